@@ -0,0 +1,104 @@
+#! python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2013-2019 European Commission (JRC);
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+"""
+The command-line entry-point of *pandalone*.
+
+Usage::
+
+    pandalone xleash extract [-o OUT_DIR] [-f {npz,parquet,feather}]
+                             [-j JOBS] [--force] MANIFEST
+"""
+
+import argparse
+import logging
+import sys
+
+
+def _build_parser():
+    from .xleash import _extract
+
+    parser = argparse.ArgumentParser(
+        prog="pandalone", description=__doc__.split("\n")[1]
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="log debug messages"
+    )
+    cmds = parser.add_subparsers(dest="cmd", metavar="CMD")
+    cmds.required = True
+
+    xleash = cmds.add_parser("xleash", help="lasso rect-regions from Excel-sheets")
+    xleash_cmds = xleash.add_subparsers(dest="xleash_cmd", metavar="XLEASH_CMD")
+    xleash_cmds.required = True
+
+    extract = xleash_cmds.add_parser(
+        "extract",
+        help="lasso the xl-refs of a manifest into columnar files",
+        description=_extract.__doc__.split("\n")[1],
+    )
+    extract.add_argument(
+        "manifest",
+        metavar="MANIFEST",
+        help="a CSV (`name`, `xlref` columns) or YAML file with xl-refs",
+    )
+    extract.add_argument(
+        "-o",
+        "--out-dir",
+        default=".",
+        help="where to write files (default: %(default)s)",
+    )
+    extract.add_argument(
+        "-f",
+        "--format",
+        choices=_extract.FORMATS,
+        default="npz",
+        help="output file-format (default: %(default)s)",
+    )
+    extract.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="worker-processes, 0 or 1 for none (default: number of CPUs)",
+    )
+    extract.add_argument(
+        "--force",
+        action="store_true",
+        help="extract also xl-refs from workbooks unchanged since last run",
+    )
+
+    return parser
+
+
+def _xleash_extract(opts):
+    from .xleash import _extract
+
+    refs = _extract.read_manifest(opts.manifest)
+    results = _extract.extract(
+        refs, opts.out_dir, fmt=opts.format, jobs=opts.jobs, force=opts.force
+    )
+    print(_extract.format_results(results))
+
+    return int(any(res.status == "failed" for res in results))
+
+
+def main(argv=None):
+    """Parse `argv` (or ``sys.argv``) and run the command, returning its exit-code."""
+    opts = _build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if opts.verbose else logging.WARNING)
+    try:
+        if opts.cmd == "xleash" and opts.xleash_cmd == "extract":
+            return _xleash_extract(opts)
+    except Exception as ex:
+        if opts.verbose:
+            raise
+        print("%s: %s" % (type(ex).__name__, ex), file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
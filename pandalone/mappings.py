@@ -32,7 +32,8 @@ Hierarchical string-like objects useful for indexing, that can be rename/relocat
 - TODO: Implements "anywhere" pmods(`//`).
 """
 
-from copy import copy
+from collections import OrderedDict, namedtuple
+from types import MappingProxyType
 import logging
 import re
 
@@ -50,6 +51,12 @@ __commit__ = ""
 
 log = logging.getLogger(__name__)
 
+_PMOD_CACHE_SIZE = 1024
+"""The maximum entries in each of the :meth:`Pmod.descend()` & :meth:`Pmod.alias()` caches of a frozen pmod."""
+
+PmodCacheInfo = namedtuple("PmodCacheInfo", "hits misses maxsize currsize")
+"""The statistics of the caches of a frozen pmod, see :meth:`Pmod.cache_info()`."""
+
 
 class Pmod(object):
 
@@ -134,16 +141,30 @@ class Pmod(object):
         >>> pmods.map_paths(['/a/foo', ''])
         ['/NEW/ROOT/a/foo', '/NEW/ROOT']
 
+    The hierarchies from :func:`pmods_from_tuples()` are *frozen*,
+    that is, they raise if modified (their dicts become read-only proxies),
+    and they cache their :meth:`descend()` & :meth:`alias()` results
+    (see :meth:`cache_info()`)::
+
+        >>> pmods._alias = 'BAD'
+        Traceback (most recent call last):
+        AttributeError: Cannot modify frozen pmod({'': pmod('/NEW/ROOT')})!
     """
 
-    __slots__ = ["_alias", "_steps", "_regxs"]
+    __slots__ = ["_alias", "_steps", "_regxs", "_frozen", "_caches", "_cache_stats"]
 
     #: (optional) the mapped-name of the pstep for
     _alias: str
-    #: {original_name --> pmod}
+    #: {original_name --> pmod}, a read-only proxy when frozen
     _steps: dict
-    #:  {regex_on_originals --> pmod}
+    #:  {regex_on_originals --> pmod}, a read-only proxy when frozen
     _regxs: dict
+    #: when true, any modification raises
+    _frozen: bool
+    #: `None` or, when frozen, the LRU-dicts ``(descends, aliases)`` {cstep --> result}
+    _caches: tuple
+    #: `None` or, when frozen, the list ``[hits, misses]`` of the caches
+    _cache_stats: list
 
     def __init__(self, _alias=None, _steps={}, _regxs={}):
         """
@@ -159,6 +180,107 @@ class Pmod(object):
             self._regxs = {re.compile(k): v for k, v in _regxs}
         else:
             self._regxs = _regxs
+        self._frozen = False
+        self._caches = self._cache_stats = None
+
+    def __setattr__(self, attr, value):
+        ## Re-assigning the same value modifies nothing.
+        if getattr(self, "_frozen", False) and getattr(self, attr, None) is not value:
+            raise AttributeError("Cannot modify frozen %r!" % self)
+        object.__setattr__(self, attr, value)
+
+    def _freeze(self):
+        """
+        Forbid any further modifications on this pmod and its children, and start caching.
+
+        :return: this pmod, for chaining
+        """
+        if not self._frozen:
+            for cpmod in self._steps.values():
+                cpmod._freeze()
+            for cpmod in self._regxs.values():
+                cpmod._freeze()
+            self._steps = MappingProxyType(self._steps)
+            self._regxs = MappingProxyType(self._regxs)
+            self._caches = (OrderedDict(), OrderedDict())
+            self._cache_stats = [0, 0]
+            self._frozen = True
+
+        return self
+
+    def _frozen_copy(self):
+        """Return this pmod if frozen, or a frozen copy of its hierarchy, sharing any frozen child-pmods."""
+        if self._frozen:
+            return self
+
+        clone = Pmod(self._alias)
+        clone._steps = {k: cpmod._frozen_copy() for k, cpmod in self._steps.items()}
+        clone._regxs = {k: cpmod._frozen_copy() for k, cpmod in self._regxs.items()}
+
+        return clone._freeze()
+
+    def _clone(self):
+        """Return an unfrozen shallow copy, sharing dicts (read-only, if frozen) and child-pmods."""
+        clone = Pmod.__new__(Pmod)
+        object.__setattr__(clone, "_alias", self._alias)
+        object.__setattr__(clone, "_steps", self._steps)
+        object.__setattr__(clone, "_regxs", self._regxs)
+        object.__setattr__(clone, "_frozen", False)
+        object.__setattr__(clone, "_caches", None)
+        object.__setattr__(clone, "_cache_stats", None)
+
+        return clone
+
+    def _cached(self, cache_index, cstep, compute):
+        """Lookup `cstep` in some LRU-cache of a frozen pmod, or `compute()` & store it."""
+        caches = self._caches
+        if caches is None:
+            return compute(cstep)
+
+        cache = caches[cache_index]
+        stats = self._cache_stats
+        try:
+            result = cache[cstep]
+        except KeyError:
+            stats[1] += 1
+            result = cache[cstep] = compute(cstep)
+            if len(cache) > _PMOD_CACHE_SIZE:
+                try:
+                    cache.popitem(last=False)
+                except KeyError:
+                    pass
+        else:
+            stats[0] += 1
+            try:
+                cache.move_to_end(cstep)
+            except KeyError:
+                pass
+
+        return result
+
+    def cache_info(self):
+        """
+        Report the statistics of the :meth:`descend()` & :meth:`alias()` caches (summed).
+
+        Only frozen pmods cache, see :func:`pmods_from_tuples()`.
+
+        :rtype: PmodCacheInfo
+
+        Example::
+
+            >>> pmods = pmods_from_tuples([('/a', 'A')])
+            >>> [pmods.map_path(p) for p in ['/a', '/a', '/b']]
+            ['/A', '/A', '/b']
+            >>> pmods.cache_info()             ## Root descended thrice into ''.
+            PmodCacheInfo(hits=2, misses=1, maxsize=1024, currsize=1)
+        """
+        caches = self._caches
+        if caches is None:
+            return PmodCacheInfo(0, 0, 0, 0)
+        hits, misses = self._cache_stats
+        return PmodCacheInfo(
+            hits, misses, _PMOD_CACHE_SIZE, sum(len(c) for c in caches)
+        )
 
     def step(self, pname="", alias=None):
         """
@@ -176,6 +298,8 @@ class Pmod(object):
 
         :param str key:    the step-name to add
         """
+        if self._frozen:
+            raise AttributeError("Cannot modify frozen %r!" % self)
 
         cpmod = None
         d = self._steps
@@ -194,6 +318,8 @@ class Pmod(object):
 
         :param str key:    the regex-pattern to add
         """
+        if self._frozen:
+            raise AttributeError("Cannot modify frozen %r!" % self)
         key = re.compile(key)
         cpmod = None
         d = self._regxs
@@ -275,7 +401,7 @@ class Pmod(object):
                     if name not in okeys
                 ]
 
-                opmods = type(spmods)(spairs + opairs)
+                opmods = dict(spairs + opairs)
 
             # Share other dict if self hadn't its own.
             self._regxs = opmods
@@ -285,7 +411,8 @@ class Pmod(object):
         Clone and override all its props with props from other-pmod, recursively.
 
         Although it does not modify this, the `other` or their children pmods,
-        it may "share" (crosslink) them, so pmods MUST NOT be modified later.
+        it may "share" (crosslink) them, so pmods MUST NOT be modified later;
+        the merged pmod is frozen if both pmods were frozen.
 
         :param Pmod other: contains the dicts with the overrides
         :return:           the cloned merged pmod
@@ -326,11 +453,14 @@ class Pmod(object):
                          re.compile('a'): pmod('A'),
                          re.compile('c'): pmod('C')})
         """
-        self = copy(self)
+        frozen = self._frozen and other._frozen
+        self = self._clone()
         if other._alias is not None:
             self._alias = other._alias
         self._override_steps(other)
         self._override_regxs(other)
+        if frozen:
+            self._freeze()
 
         return self
 
@@ -407,7 +537,12 @@ class Pmod(object):
             (None, None)
 
         but it is better to use :meth:`map_path()` for this.
+
+        Results are cached when frozen, see :meth:`cache_info()`.
         """
+        return self._cached(0, cstep, self._descend)
+
+    def _descend(self, cstep):
         alias = None
 
         cpmod = self._steps.get(cstep)
@@ -434,6 +569,9 @@ class Pmod(object):
 
         :return: the expanded alias from child/regexs or None
         """
+        return self._cached(1, cstep, self._alias_uncached)
+
+    def _alias_uncached(self, cstep):
         cpmod = self._steps.get(cstep)
         if cpmod and cpmod._alias is not None:
             return cpmod._alias
@@ -566,11 +704,97 @@ class Pmod(object):
         return npath
 
     def map_paths(self, paths):
-        return [self.map_path(p) for p in paths]
+        """
+        Like :meth:`map_path()` for many paths, through the automaton of :meth:`compile()`.
+
+        Each distinct combination of merged child-pmods, step or parent-path
+        is mapped once, so mapping many paths runs in (near) linear time.
+        """
+        automaton = self.compile()
+        return [automaton.map_path(p) for p in paths]
+
+    def map_index(self, index, table=None):
+        """
+        Map the path-labels of a pandas `index`, each unique label mapped once.
+
+        :param pandas.Index index:
+                its non-string labels are kept as they are (and left out of the table,
+                or else ie. ``1`` & ``True`` would collide)
+        :param dict table:
+                a mapping-table returned by a previous call, to reuse
+                for indices with (mostly) the same labels; it is not modified
+        :return: the mapped index (with :meth:`pandas.Index.map()` on a table),
+                 and the mapping-table ``{label --> mapped-label}`` covering
+                 all its string labels
+        :rtype:  tuple(pandas.Index, dict)
+
+        Example::
+
+            >>> import pandas as pd
+            >>> pmods = pmods_from_tuples([('/a', 'A'), ('/~b(.*)', r'B/\\1')])
+            >>> index, table = pmods.map_index(pd.Index(['/a', '/bc', '/a', 0, False]))
+            >>> index
+            Index(['/A', '/B/c', '/A', 0, False], dtype='object')
+            >>> table
+            {'/a': '/A', '/bc': '/B/c'}
+        """
+        table = dict(table) if table else {}
+        labels = [label for label in index.unique() if isinstance(label, str)]
+        missing = [label for label in labels if label not in table]
+        if missing:
+            table.update(zip(missing, self.map_paths(missing)))
+        if not labels:
+            return index, table
+
+        ## Map only the string-labels, vectorized through a hash-table
+        #  (`isin()` never matches ``0``/``False`` against strings).
+        mapped = index.map({label: table[label] for label in labels})
+        mapped = mapped.where(index.isin(labels), index)
+
+        return mapped, table
+
+    def map_frame_columns(self, df, table=None):
+        """
+        Like :meth:`map_index()` for the columns of the `df` (which is not modified).
+
+        :return: a shallow copy of the `df` with its columns mapped,
+                 and the mapping-table
+        :rtype:  tuple(pandas.DataFrame, dict)
+        """
+        columns, table = self.map_index(df.columns, table)
+        df = df.copy(deep=False)
+        df.columns = columns
+
+        return df, table
+
+    def compile(self):
+        r"""
+        Make an immutable automaton of this pmods-hierarchy, for mapping many paths.
+
+        The automaton-nodes are compiled lazily, on first descended,
+        so an unfrozen pmod-hierarchy is compiled from a frozen copy of it
+        (left intact), see :func:`pmods_from_tuples()`.
+
+        :rtype: _CompiledPmod
+
+        Example::
+
+            >>> pmods = pmods_from_tuples([
+            ...         ('/a',           'A'),
+            ...         ('/~b.*',        r'BB\g<0>'),
+            ...         ('/~b.*/~c.(.*)', r'W\1ER'),
+            ... ])
+            >>> automaton = pmods.compile()
+            >>> automaton.map_paths(['/a/foo', '/big/stuff', '/born/child'])
+            ['/A/foo', '/BBbig/stuff', '/BBborn/WildER']
+        """
+        return _CompiledPmod(self._frozen_copy())
 
     def __repr__(self):
         args = [
-            repr(a) for a in [self._alias, self._steps, self._regxs] if a or a == ""
+            repr(dict(a) if isinstance(a, MappingProxyType) else a)
+            for a in [self._alias, self._steps, self._regxs]
+            if a or a == ""
         ]
 
         args = ", ".join(args)
@@ -587,6 +811,179 @@ class Pmod(object):
             return False
 
 
+def _combine_regexes(regexes):
+    """
+    :return: a regex matching if any of `regexes` match, or `None` if they cannot be combined
+
+    Patterns with back-references are not combined, since their groups get renumbered.
+    """
+    patterns = [r.pattern for r in regexes]
+    if len(patterns) < 2 or any(re.search(r"\\\d|\(\?P=", p) for p in patterns):
+        return None
+    try:
+        return re.compile("|".join("(?:%s)" % p for p in patterns))
+    except re.error:
+        return None
+
+
+_MEMO_SIZE = 1 << 16
+"""The maximum entries memoized in each of the dicts of a :class:`_CompiledPmod` node."""
+
+
+class _CompiledPmod(object):
+    """
+    An immutable node of the automaton compiled from a :class:`Pmod` by :meth:`Pmod.compile()`.
+
+    - The regexes of a node are pre-checked at once with a combined alternation
+      (see :func:`_combine_regexes()`), to reject quickly non-matching steps.
+    - The child-pmods merged by :meth:`descend()` are compiled and memoized
+      per exact-step and combination of matched regexes.
+    - The transitions per step, and the mapped parent-paths (on the root node)
+      are memoized, up to :data:`_MEMO_SIZE` each.
+    """
+
+    __slots__ = [
+        "_alias",
+        "_steps",
+        "_regxs",
+        "_any_regex",
+        "_children",
+        "_transitions",
+        "_aliases",
+        "_prefixes",
+    ]
+
+    def __init__(self, pmod):
+        self._alias = pmod._alias
+        self._steps = pmod._steps
+        self._regxs = tuple(pmod._regxs.items())
+        self._any_regex = _combine_regexes(pmod._regxs)
+        self._children = {}
+        self._transitions = {}
+        self._aliases = {}
+        self._prefixes = {}
+
+    def _match_regxs(self, cstep):
+        """Return (index, regex.match) for those child-pmods matching `cstep`."""
+        regxs = self._regxs
+        if not regxs or (self._any_regex and not self._any_regex.fullmatch(cstep)):
+            return ()
+
+        return [
+            (i, match)
+            for i, match in (
+                (i, regex.fullmatch(cstep)) for i, (regex, _) in enumerate(regxs)
+            )
+            if match
+        ]
+
+    def _expand_alias(self, cpmod, matches):
+        if cpmod and cpmod._alias is not None:
+            return cpmod._alias
+        for i, match in reversed(matches):
+            ralias = self._regxs[i][1]._alias
+            if ralias is not None:
+                return match.expand(ralias)
+
+    def descend(self, cstep):
+        """Like :meth:`Pmod.descend()` but returning compiled child-nodes."""
+        transition = self._transitions.get(cstep)
+        if transition is None:
+            cpmod = self._steps.get(cstep)
+            matches = self._match_regxs(cstep)
+            if not cpmod and not matches:
+                transition = (None, None)
+            else:
+                key = (cstep if cpmod else None, tuple(i for i, _ in matches))
+                child = self._children.get(key)
+                if child is None:
+                    pmods = [self._regxs[i][1] for i, _ in matches]
+                    if cpmod:
+                        pmods.append(cpmod)
+                    child = _CompiledPmod(ft.reduce(Pmod._merge, pmods))
+                    self._children[key] = child
+                transition = (child, self._expand_alias(cpmod, matches))
+            if len(self._transitions) < _MEMO_SIZE:
+                self._transitions[cstep] = transition
+
+        return transition
+
+    def alias(self, cstep):
+        """Like :meth:`Pmod.alias()`."""
+        try:
+            return self._aliases[cstep]
+        except KeyError:
+            alias = self._expand_alias(self._steps.get(cstep), self._match_regxs(cstep))
+            if len(self._aliases) < _MEMO_SIZE:
+                self._aliases[cstep] = alias
+
+            return alias
+
+    def _map_parent(self, parent):
+        """
+        Map all steps of the `parent` path like :meth:`Pmod.map_path()` does.
+
+        :param parent: a path, or `None` for no parent-steps
+        :return:       the node reached, and the mapped steps, already joined
+                       with :func:`_append_step()`
+        """
+        entry = self._prefixes.get(parent)
+        if entry is None:
+            if self._alias is None:
+                nsteps = ()
+            else:
+                nsteps = tuple(iter_jsonpointer_parts_relaxed(self._alias))
+
+            pmod = self
+            steps = () if parent is None else iter_jsonpointer_parts_relaxed(parent)
+            for step in steps:
+                if pmod:
+                    pmod, alias = pmod.descend(step)
+                if alias is not None:
+                    if alias.startswith("."):
+                        nsteps += (step,)
+                    step = alias
+                # XXX: Monkey business here.
+                if len(step) > 1 and step.endswith("/"):
+                    step = step[:-1]
+                nsteps += tuple(iter_jsonpointer_parts_relaxed(step))
+
+            entry = (pmod, ft.reduce(_append_step, nsteps, ()))
+            if len(self._prefixes) < _MEMO_SIZE:
+                self._prefixes[parent] = entry
+
+        return entry
+
+    def map_path(self, path):
+        """Like :meth:`Pmod.map_path()`."""
+        if len(path) > 1 and path.endswith("/"):
+            path = path[:-1]
+        parent, slash, final_step = path.rpartition("/")
+        pmod, nsteps = self._map_parent(parent if slash else None)
+
+        final_step = unescape_jsonpointer_part(final_step)
+        if pmod:
+            alias = pmod.alias(final_step)
+            if alias is not None:
+                if alias.startswith("."):
+                    nsteps = _append_step(nsteps, final_step)
+                final_step = alias
+        # XXX: Monkey business here.
+        if len(final_step) > 1 and final_step.endswith("/"):
+            final_step = final_step[:-1]
+        nsteps = ft.reduce(
+            _append_step, iter_jsonpointer_parts_relaxed(final_step), nsteps
+        )
+
+        return "/".join(nsteps) if nsteps else "."
+
+    def map_paths(self, paths):
+        return [self.map_path(p) for p in paths]
+
+    def __repr__(self):
+        return "compiled_%r" % Pmod(self._alias, self._steps, ())
+
+
 def pmods_from_tuples(pmods_tuples):
     r"""
     Turns a list of 2-tuples into a *pmods* hierarchy.
@@ -681,7 +1078,7 @@ def pmods_from_tuples(pmods_tuples):
 
         pmod._alias = t
 
-    return root
+    return root._freeze()
 
 
 def _append_step(steps, step):
@@ -1093,7 +1490,10 @@ class Pstep(str):
                 if alias is not None:
                     pmod = self._pmod
                     if pmod:
+                        # Don't modify (frozen) pmods shared with others.
+                        pmod = pmod._clone()
                         pmod._alias = alias
+                        self._pmod = pmod
                     else:
                         self._pmod = Pmod(_alias=alias)
         csteps[ckey] = child = Pstep(ckey, existing_cstep or self._pmod, alias)
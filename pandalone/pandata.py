@@ -12,18 +12,28 @@ URI-references, implemented by :class:`Pandel`.
 """
 
 import abc
+import base64
 import binascii
 import collections.abc as cabc
+import concurrent.futures as cfut
+import contextlib
+import copy
 import functools as fnt
+import hashlib
+import json
 import numbers
+import os
+import os.path as osp
 import pickle
 import re
-from collections import namedtuple
+import threading
+import weakref
+from collections import OrderedDict, namedtuple
 from json.decoder import JSONDecoder
 from json.encoder import JSONEncoder
 from typing import Union
 from unittest.mock import MagicMock
-from urllib.parse import urljoin
+from urllib.parse import unquote, urljoin
 
 import jsonschema
 import numpy as np
@@ -100,6 +110,183 @@ def parse_value_with_units(arg):
         return _U(**res)
 
 
+UNITS_TABLE = {
+    ## length
+    "m": ("length", 1.0),
+    "km": ("length", 1e3),
+    "cm": ("length", 1e-2),
+    "mm": ("length", 1e-3),
+    ## mass
+    "kg": ("mass", 1.0),
+    "g": ("mass", 1e-3),
+    "t": ("mass", 1e3),
+    ## time
+    "s": ("time", 1.0),
+    "ms": ("time", 1e-3),
+    "min": ("time", 60.0),
+    "h": ("time", 3600.0),
+    ## speed
+    "m/s": ("speed", 1.0),
+    "km/h": ("speed", 1 / 3.6),
+    ## acceleration
+    "m/s2": ("acceleration", 1.0),
+    "m/s^2": ("acceleration", 1.0),
+    ## angular speed
+    "rad/s": ("angular_speed", 1.0),
+    "rpm": ("angular_speed", np.pi / 30),
+    ## force & torque
+    "N": ("force", 1.0),
+    "kN": ("force", 1e3),
+    "Nm": ("torque", 1.0),
+    ## power & energy
+    "W": ("power", 1.0),
+    "kW": ("power", 1e3),
+    "J": ("energy", 1.0),
+    "kJ": ("energy", 1e3),
+    "Wh": ("energy", 3600.0),
+    "kWh": ("energy", 3.6e6),
+    ## volume
+    "m3": ("volume", 1.0),
+    "l": ("volume", 1e-3),
+    ## dimensionless
+    "-": ("ratio", 1.0),
+    "%": ("ratio", 1e-2),
+}
+"""
+The default units known by :func:`convert_frame_units()`, as ``{units: (quantity, factor)}``.
+
+The `factor` multiplies values into the *base-units* of their `quantity` (those with factor 1);
+pass a modified copy to convert other (multiplicative) units.
+"""
+
+
+@fnt.lru_cache(maxsize=4096)
+def _parse_header_with_units(header):
+    return parse_value_with_units(header) if isinstance(header, str) else None
+
+
+def parse_headers_with_units(headers):
+    """
+    Parses many *name-units* headers, each unique one just once (see :func:`parse_value_with_units()`).
+
+    :param headers: an iterable of headers, ie. ``df.columns``
+    :return:        a list of United(name, units) named-tuples, or `None` for
+                    non-string headers or bad syntax
+
+    Examples::
+
+        >>> parse_headers_with_units(['v [km/h]', 'v [km/h]', 'n', 2])  # doctest: +NORMALIZE_WHITESPACE
+        [United(name='v', units='km/h'), United(name='v', units='km/h'),
+         United(name='n', units=None), None]
+    """
+    return [_parse_header_with_units(h) for h in headers]
+
+
+def units_factor(from_units, to_units, units_table=None):
+    """
+    :param dict units_table: see :data:`UNITS_TABLE`, the default
+    :return: the multiplier converting values from `from_units` into `to_units`
+    :raise ValueError: if any units unknown, or of different quantities
+
+    Examples::
+
+        >>> units_factor('km/h', 'm/s')
+        0.2777777777777778
+        >>> units_factor('km', 'kg')
+        Traceback (most recent call last):
+        ValueError: Incompatible units(km --> kg) of length --> mass!
+    """
+    table = UNITS_TABLE if units_table is None else units_table
+    try:
+        (from_q, from_f), (to_q, to_f) = table[from_units], table[to_units]
+    except KeyError as ex:
+        raise ValueError("Unknown units(%s)!" % ex.args[0]) from None
+    if from_q != to_q:
+        raise ValueError(
+            "Incompatible units(%s --> %s) of %s --> %s!"
+            % (from_units, to_units, from_q, to_q)
+        )
+
+    return from_f / to_f
+
+
+def convert_frame_units(df, to_units=None, units_table=None):
+    """
+    Converts the numeric columns with units in their headers, all in one vectorized pass.
+
+    :param pd.DataFrame df:
+            its columns headers are parsed with :func:`parse_headers_with_units()`;
+            those without units, non-numeric, with units not in `units_table`
+            or already in their target-units (or an alias of them) are left intact
+    :param dict to_units:
+            a map of column-names or quantities --> target units;
+            the columns not matched are converted to the base-units of their quantity
+    :param dict units_table:
+            see :data:`UNITS_TABLE`, the default
+    :return:
+            a new data-frame, sharing any unconverted columns with `df`,
+            with headers like ``name [units]`` for the converted ones
+    :raise ValueError:
+            if target-units unknown, or of different quantity
+
+    Examples::
+
+        >>> df = pd.DataFrame({'v [km/h]': [36, 72], 'P <kW>': [1.5, 2], 'gear': [1, 2]})
+        >>> cdf = convert_frame_units(df, {'P': 'W'})
+        >>> cdf
+           v [m/s]   P [W]  gear
+        0     10.0  1500.0     1
+        1     20.0  2000.0     2
+        >>> np.shares_memory(cdf['gear'].values, df['gear'].values)
+        True
+    """
+    table = UNITS_TABLE if units_table is None else units_table
+    to_units = to_units or {}
+    base_units = {}
+    for units, (quantity, factor) in table.items():
+        if factor == 1:
+            base_units.setdefault(quantity, units)
+
+    headers = list(df.columns)
+    kinds = [dt.kind for dt in df.dtypes]
+    indices, factors = [], []
+    for i, united in enumerate(parse_headers_with_units(headers)):
+        if not united or not united.units or united.units not in table:
+            continue
+        if kinds[i] not in "iuf":
+            continue
+        quantity = table[united.units][0]
+        target = to_units.get(united.name) or to_units.get(quantity)
+        target = target or base_units.get(quantity)
+        if target is None or target == united.units:
+            continue
+        factor = units_factor(united.units, target, table)
+        if factor == 1:
+            continue  # Just an alias of the target-units.
+        factors.append(factor)
+        indices.append(i)
+        headers[i] = ("%s [%s]" % (united.name, target)).lstrip()
+
+    if not indices:
+        return df.copy(deep=False)
+
+    values = df.iloc[:, indices].to_numpy(dtype=float) * np.array(factors)
+    converted = dict(zip(indices, values.T))
+    ## Concatenating series (not frames) shares the data of the unconverted ones.
+    columns = [
+        (
+            pd.Series(converted[i], index=df.index, copy=False)
+            if i in converted
+            else df.iloc[:, i]
+        )
+        for i in range(df.shape[1])
+    ]
+    converted = pd.concat(columns, axis=1, copy=False)
+    converted.columns = headers
+
+    return converted
+
+
 class ModelOperations(namedtuple("ModelOperations", "inp out conv")):
 
     """
@@ -170,9 +357,14 @@ def _is_integer(checker, instance):
     return isinstance(instance, (int, np.integer))
 
 
+_SIZELESS_TYPES = frozenset((bool, int, float, str, dict, list, tuple))
+
+
 def _is_null(checker, instance):
     if instance is None or instance is float("nan") or instance is np.nan:
         return True
+    if type(instance) in _SIZELESS_TYPES:  # Fast-path, they would fail below.
+        return False
 
     ## Handle np.arrays's future "bool" behavior.
     #  see https://github.com/numpy/numpy/issues/9583
@@ -244,6 +436,129 @@ def _rule_propertyNames(validator, propertyNames, instance, schema):
             yield error
 
 
+_VECTORIZED_ITEMS_KEYWORDS = frozenset(
+    (
+        "type",
+        "minimum",
+        "maximum",
+        "exclusiveMinimum",
+        "exclusiveMaximum",
+        "title",
+        "description",
+        "default",
+        "examples",
+        "$comment",
+    )
+)
+_VECTORIZED_TYPES = {
+    "b": {"boolean"},
+    "i": {"integer", "number"},
+    "u": {"integer", "number"},
+    "f": {"number"},
+}
+
+
+def _items_suspects_mask(arr, items):
+    """
+    Find with numpy which elements of `arr` may fail the simple `items` schema.
+
+    :param np.ndarray arr:
+        a 1-D array of booleans or numbers
+    :return:
+        a boolean mask (a superset of the failing elements),
+        or `None` if `items` cannot be decided by numpy alone
+
+    Examples::
+
+        >>> _items_suspects_mask(np.array([0, 1, 5]), {'type': 'integer', 'maximum': 4})
+        array([False, False,  True])
+        >>> _items_suspects_mask(np.array([0, 1, 5]), {'minimum': 0, 'exclusiveMinimum': True})
+        array([ True, False, False])
+        >>> _items_suspects_mask(np.array([0.5]), {'type': 'integer'}) is None
+        True
+    """
+    kind = arr.dtype.kind
+    if kind not in _VECTORIZED_TYPES or not _VECTORIZED_ITEMS_KEYWORDS.issuperset(
+        items
+    ):
+        return None
+
+    typ = items.get("type")
+    if typ is not None:
+        types = {typ} if isinstance(typ, str) else set(typ)
+        if not types & _VECTORIZED_TYPES[kind]:
+            return None
+
+    mask = np.zeros(arr.shape, dtype=bool)
+    if kind == "b":
+        return mask  # Booleans are not numbers, limits ignored.
+
+    for lim_kw, excl_kw, ok, ok_excl in (
+        ("minimum", "exclusiveMinimum", np.greater_equal, np.greater),
+        ("maximum", "exclusiveMaximum", np.less_equal, np.less),
+    ):
+        lim, excl = items.get(lim_kw), items.get(excl_kw)
+        if isinstance(excl, bool):  # draft3 & draft4
+            if lim is not None:
+                mask |= ~(ok_excl if excl else ok)(arr, lim)
+        else:
+            if lim is not None:
+                mask |= ~ok(arr, lim)
+            if excl is not None:
+                mask |= ~ok_excl(arr, excl)
+
+    return mask
+
+
+def _rule_items(
+    validator, items, instance, schema, original_items_rule, max_errors=None
+):
+    """
+    Validate numeric 1-D arrays & series against simple `items` schemas with numpy.
+
+    Only the elements that may fail (see :func:`_items_suspects_mask()`)
+    are validated by the `original_items_rule` logic, so the errors
+    reported are the same, with their index in `path`; anything else is
+    delegated to the `original_items_rule`.
+
+    :param max_errors:
+        if given, stop after that many item-errors, yielding one more error
+        about it (see `max_branch_errors` in :func:`PandelVisitor()`)
+    """
+    nsuspects = None
+    if (
+        isinstance(instance, (np.ndarray, pd.Series))
+        and instance.ndim == 1
+        and isinstance(items, dict)
+        and "prefixItems" not in schema
+    ):
+        arr = instance.to_numpy() if isinstance(instance, pd.Series) else instance
+        mask = _items_suspects_mask(arr, items)
+        if mask is not None:
+            indices = mask.nonzero()[0]
+            nsuspects = len(indices)
+            errors = (
+                error
+                for index in indices
+                for error in validator.descend(arr[index], items, path=int(index))
+            )
+    if nsuspects is None:
+        errors = original_items_rule(validator, items, instance, schema)
+
+    nerrors = 0
+    for error in errors:
+        if max_errors is not None and nerrors >= max_errors:
+            if hasattr(errors, "close"):
+                errors.close()
+            msg = "Stopped validating items after %i errors" % nerrors
+            if nsuspects is not None:
+                msg += ", out of %i suspect ones" % nsuspects
+            yield ValidationError("%s." % msg)
+            break
+        nerrors += 1
+        yield error
+
+
 def _is_null_in_type(typ):
     if not typ:
         return False
@@ -260,6 +575,81 @@ def first_defined(*var, default=None):
     return default
 
 
+_DefaultsPlan = namedtuple(
+    "_DefaultsPlan", "missing_defaults null_defaults null_removes"
+)
+"""
+What to apply on object-instances for some `properties` schema, precompiled by :func:`_compile_defaults_plan()`.
+
+:param missing_defaults: ``(prop, default)`` pairs to set when `prop` is missing
+:param null_defaults:    ``(prop, default)`` pairs to set when `prop` is null
+:param null_removes:     props to delete when null
+"""
+
+_defaults_plans = OrderedDict()
+_DEFAULTS_PLANS_CACHE_SIZE = 1024
+
+
+def _compile_defaults_plan(
+    properties, auto_default, auto_default_nulls, auto_remove_nulls
+):
+    """
+    Classify once the `properties` by the tri-state flags of :func:`_rule_auto_defaults_properties()`.
+
+    :return: a :class:`_DefaultsPlan`, or `None` if nothing to apply
+
+    Examples::
+
+        >>> plan = _compile_defaults_plan({'a': {'default': 1}, 'b': {'type': 'null', 'default': 2},
+        ...                                'c': {'autoRemoveNull': True}}, True, True, False)
+        >>> plan.missing_defaults, plan.null_defaults, plan.null_removes
+        ([('a', 1), ('b', 2)], [('a', 1)], ['c'])
+    """
+    missing_defaults, null_defaults, null_removes = [], [], []
+    for property, subschema in properties.items():
+        accepts_null = _is_null_in_type(subschema.get("type"))
+        default_null = False
+        if "default" in subschema:
+            default = subschema["default"]
+            if first_defined(subschema.get("autoDefault"), auto_default):
+                missing_defaults.append((property, default))
+            if (
+                first_defined(subschema.get("autoDefaultNull"), auto_default_nulls)
+                and not accepts_null
+            ):
+                default_null = True
+                null_defaults.append((property, default))
+        if (
+            not default_null
+            and first_defined(subschema.get("autoRemoveNull"), auto_remove_nulls)
+            and not accepts_null
+        ):
+            null_removes.append(property)
+
+    if missing_defaults or null_defaults or null_removes:
+        return _DefaultsPlan(missing_defaults, null_defaults, null_removes)
+
+
+def _get_defaults_plan(properties, *flags):
+    """
+    Like :func:`_compile_defaults_plan()` but cached per `properties` schema instance & `flags`.
+
+    Schemas are assumed immutable once validating, as for :func:`_cached_PandelVisitor()`.
+    """
+    key = (id(properties),) + flags
+    entry = _defaults_plans.get(key)
+    if entry is None or entry[0] is not properties:
+        entry = (properties, _compile_defaults_plan(properties, *flags))
+        _defaults_plans[key] = entry
+        if len(_defaults_plans) > _DEFAULTS_PLANS_CACHE_SIZE:
+            try:
+                _defaults_plans.popitem(last=False)
+            except KeyError:  # Evicted by another thread.
+                pass
+
+    return entry[1]
+
+
 def _rule_auto_defaults_properties(
     validator,
     properties,
@@ -272,37 +662,299 @@ def _rule_auto_defaults_properties(
 ):
     """
     Adapted from: https://python-jsonschema.readthedocs.io/en/stable/faq/#frequently-asked-questions
+
+    The `properties` are classified once into a plan (see :func:`_get_defaults_plan()`),
+    so each instance-visit just checks the few props involved.
     """
     if not _is_object(None, instance):
         return
 
-    for property, subschema in properties.items():
-        prop_given = property in instance
-        if "default" in subschema and (
-            (
-                first_defined(subschema.get("autoDefault"), auto_default)
-                and not prop_given
-            )
-            or (
-                first_defined(subschema.get("autoDefaultNull"), auto_default_nulls)
-                and not _is_null_in_type(subschema.get("type"))
-                and prop_given
-                and _is_null(None, instance[property])
-            )
-        ):
-            instance[property] = subschema["default"]
-        elif (
-            first_defined(subschema.get("autoRemoveNull"), auto_remove_nulls)
-            and not _is_null_in_type(subschema.get("type"))
-            and prop_given
-            and _is_null(None, instance[property])
-        ):
+    plan = _get_defaults_plan(
+        properties, auto_default, auto_default_nulls, auto_remove_nulls
+    )
+    if plan:
+        ## Decide removals before any defaults are given.
+        removes = [
+            property
+            for property in plan.null_removes
+            if property in instance and _is_null(None, instance[property])
+        ]
+        modified = bool(removes)
+        for property, default in plan.null_defaults:
+            if property in instance and _is_null(None, instance[property]):
+                instance[property] = default
+                modified = True
+        for property, default in plan.missing_defaults:
+            if property not in instance:
+                instance[property] = default
+                modified = True
+        for property in removes:
             del instance[property]
+        if modified:
+            _digests_modified(instance)
 
     for error in original_props_rule(validator, properties, instance, schema):
         yield error
 
 
+def _resolution_root(validator):
+    """
+    :return: the schema-document against which the relative ``$ref`` of `validator` resolve
+             (its root-schema, unless descended into a remote one), or `None` if unknown
+
+    Examples::
+
+        >>> schema = {'properties': {'a': {'$ref': '#/definitions/n'}}}
+        >>> _resolution_root(jsonschema.Draft7Validator(schema)) is schema
+        True
+    """
+    try:
+        ref_resolver = getattr(validator, "_ref_resolver", None)
+        resolver = getattr(validator, "_resolver", None)
+        if ref_resolver is None and resolver is None:  # jsonschema < 4.18
+            ref_resolver = validator.resolver
+        if ref_resolver is not None:
+            return ref_resolver.resolve("")[1]
+        return resolver.lookup("").contents
+    except Exception:
+        return None
+
+
+@fnt.lru_cache()
+def _libs_versions():
+    """The versions of pandalone & jsonschema, salting persisted :class:`ValidationCache` keys."""
+    from pandalone._version import __version__
+
+    try:
+        from importlib.metadata import version
+
+        js_version = version("jsonschema")
+    except Exception:
+        js_version = getattr(jsonschema, "__version__", None)
+
+    return (__version__, js_version)
+
+
+@fnt.lru_cache()
+def _salt_digest(salt, formats):
+    return hashlib.sha1(("%s%s" % (salt, formats)).encode()).hexdigest()[:16]
+
+
+def _validation_salt(validator):
+    """
+    :return: a digest of the ``_validation_salt`` of the class of a :func:`PandelVisitor()`
+             instance plus the formats its `format_checker` checks, or `None` for other validators
+
+    Examples::
+
+        >>> s1 = _validation_salt(PandelVisitor({}))
+        >>> s2 = _validation_salt(PandelVisitor({}, format_checker=jsonschema.FormatChecker()))
+        >>> s1 != s2
+        True
+        >>> _validation_salt(jsonschema.Draft7Validator({})) is None
+        True
+    """
+    salt = getattr(validator, "_validation_salt", None)
+    if salt is not None:
+        checker = validator.format_checker
+        formats = checker is not None and tuple(sorted(checker.checkers))
+        salt = _salt_digest(salt, formats)
+
+    return salt
+
+
+def _rule_cached_properties(
+    validator, properties, instance, schema, original_props_rule, cache
+):
+    """
+    Skips descending into property-values that have already passed their subschema (see :class:`ValidationCache`).
+
+    The keys of the values passed are recomputed before caching them only if
+    any value got modified while validating (ie. by auto-defaults or coercion),
+    and the digests of unmodified nodes are reused (see :func:`_digests_pass()`).
+    """
+    if not _is_object(None, instance):
+        for error in original_props_rule(validator, properties, instance, schema):
+            yield error
+        return
+
+    root = _resolution_root(validator)
+    salt = _validation_salt(validator)
+    if root is None:
+        for error in original_props_rule(validator, properties, instance, schema):
+            yield error
+        return
+
+    with _digests_pass() as memo:
+        keys = {}
+        for property, subschema in properties.items():
+            if property in instance:
+                key = cache.key(subschema, instance[property], salt, root, memo)
+                if key:
+                    keys[property] = key
+        passed = [p for p, k in keys.items() if k in cache]
+        if passed:
+            properties = {p: s for p, s in properties.items() if p not in passed}
+
+        modifications = memo.modifications
+        failed = set()
+        for error in original_props_rule(validator, properties, instance, schema):
+            if error.path:
+                failed.add(error.path[0])
+            yield error
+
+        modified = memo.modifications != modifications
+        for property, key in keys.items():
+            if property not in failed and property not in passed:
+                if modified:
+                    key = property in instance and cache.key(
+                        properties[property], instance[property], salt, root, memo
+                    )
+                if key:
+                    cache.add(key)
+
+
+_COERCIBLE_KINDS = {"number": "iuf", "integer": "iu", "boolean": "b"}
+_COERCIBLE_DATE_FORMATS = frozenset(("date-time", "date"))
+
+
+def _coerce_column(values, subschema, validated):
+    """
+    Convert vectorially an object-array (or series) to the dtype of its `items` subschema.
+
+    :param validated:
+        if false, convert only to numbers & booleans (without parsing strings),
+        before validation, so that :func:`_rule_items()` validates them with numpy;
+        if true, convert date-strings into datetimes, after they validated as strings
+    :return: the converted values, or `None` if not (losslessly) coercible
+
+    Examples::
+
+        >>> _coerce_column(np.array([1, 2.5], dtype=object), {'items': {'type': 'number'}}, False)
+        array([1. , 2.5])
+        >>> _coerce_column(np.array([1, None], dtype=object), {'items': {'type': 'number'}}, False) is None
+        True
+        >>> _coerce_column(pd.Series(['2019-01-02']), {'items': {'type': 'string', 'format': 'date'}}, True)
+        0   2019-01-02
+        dtype: datetime64[ns]
+    """
+    items = subschema.get("items") if isinstance(subschema, dict) else None
+    if (
+        not isinstance(values, (np.ndarray, pd.Series))
+        or values.dtype != object
+        or values.ndim != 1
+        or not isinstance(items, dict)
+    ):
+        return None
+
+    typ = items.get("type")
+    types = {typ} if isinstance(typ, str) else set(typ or ())
+    nullable = "null" in types
+    types.discard("null")
+    if len(types) != 1:
+        return None
+    (typ,) = types
+    if validated:
+        if typ != "string" or items.get("format") not in _COERCIBLE_DATE_FORMATS:
+            return None
+        kinds = "M"
+    else:
+        kinds = _COERCIBLE_KINDS.get(typ)
+        if not kinds:
+            return None
+
+    series = values if isinstance(values, pd.Series) else pd.Series(values, copy=False)
+    if not nullable and series.isna().any():
+        return None  # Invalid nulls must not become valid NaNs.
+    if validated:
+        try:
+            converted = pd.to_datetime(series)
+        except (ValueError, TypeError, OverflowError):
+            return None
+    else:
+        converted = series.infer_objects()
+    if converted.dtype.kind not in kinds:
+        return None
+
+    return converted if isinstance(values, pd.Series) else converted.to_numpy()
+
+
+_coerced_dates = weakref.WeakValueDictionary()
+"""The buffers of the datetime columns coerced by :func:`_rule_coerce_dtypes_properties()`, by id."""
+
+
+def _values_buffer(values):
+    """:return: the array owning the memory of `values`, stable across the views pandas returns"""
+    arr = np.asarray(values)
+    while isinstance(arr.base, np.ndarray):
+        arr = arr.base
+
+    return arr
+
+
+def _is_coerced_dates(values, subschema):
+    items = subschema.get("items") if isinstance(subschema, dict) else None
+    if (
+        isinstance(values, (np.ndarray, pd.Series))
+        and values.dtype.kind == "M"
+        and isinstance(items, dict)
+        and items.get("format") in _COERCIBLE_DATE_FORMATS
+    ):
+        buffer = _values_buffer(values)
+        return _coerced_dates.get(id(buffer)) is buffer
+
+    return False
+
+
+def _sans_items_string_checks(subschema):
+    """:return: a `subschema` copy without its items' ``type`` & ``format`` (checked before coercing dates)"""
+    items = {k: v for k, v in subschema["items"].items() if k not in ("type", "format")}
+    return dict(subschema, items=items)
+
+
+def _rule_coerce_dtypes_properties(
+    validator, properties, instance, schema, original_props_rule
+):
+    """
+    Convert in-place the object-columns (or arrays) to the dtype of their `items` subschema.
+
+    Numbers & booleans are converted before descending into them,
+    and date-strings after they have passed (see :func:`_coerce_column()`);
+    so the datetime columns coerced here (and only those) skip their items'
+    string ``type`` & ``format`` checks, when re-validated (ie. when merged in a model).
+    """
+    coercible = isinstance(instance, (cabc.MutableMapping, pd.DataFrame))
+    if coercible:
+        dates = {}
+        for property, subschema in properties.items():
+            if property in instance:
+                values = instance[property]
+                converted = _coerce_column(values, subschema, False)
+                if converted is not None:
+                    instance[property] = converted
+                    _digests_modified(instance)
+                elif _is_coerced_dates(values, subschema):
+                    dates[property] = _sans_items_string_checks(subschema)
+        if dates:
+            properties = {p: dates.get(p, s) for p, s in properties.items()}
+
+    failed = set()
+    for error in original_props_rule(validator, properties, instance, schema):
+        if error.path:
+            failed.add(error.path[0])
+        yield error
+
+    if coercible:
+        for property, subschema in properties.items():
+            if property in instance and property not in failed:
+                converted = _coerce_column(instance[property], subschema, True)
+                if converted is not None:
+                    instance[property] = converted
+                    _digests_modified(instance)
+                    buffer = _values_buffer(instance[property])
+                    _coerced_dates[id(buffer)] = buffer
+
+
 def rule_enum(validator, enums, instance, schema):
     """Overridden to evade pandas-equals after Julian/jsonschema#575 fixed bool != 0,1 (v3.0.2)."""
     unbool = jsonschema._utils.unbool
@@ -321,6 +973,9 @@ def PandelVisitor(
     auto_default: Union[bool, None] = True,
     auto_default_nulls: Union[bool, None] = False,
     auto_remove_nulls: Union[bool, None] = False,
+    validation_cache=None,
+    max_branch_errors=None,
+    coerce_dtypes=False,
 ):
     """
     A customized jsonschema-validator suporting instance-trees with pandas and numpy objects, natively.
@@ -352,6 +1007,21 @@ def PandelVisitor(
             If this is enabled, any `required` properties rule must FOLLOW
             the `properties` rule.
 
+    :param ValidationCache validation_cache:
+        if given, property-values (subtrees) that have already passed
+        their subschema are not descended again.
+
+    :param int max_branch_errors:
+        if given, stop validating the items of an array (or series) after that
+        many errors, yielding one more error about it, to bound the time & memory
+        spent on systematically wrong columns (see also :func:`iter_errors_bounded()`).
+
+    :param bool coerce_dtypes:
+        if true, convert in-place the *object* columns of data-frames (and arrays or series
+        in mappings) to the dtype of the ``type``/``format`` of their ``items`` subschema:
+        ``number``, ``integer``, ``boolean``, and ``date``/``date-time`` strings
+        (see :func:`_coerce_column()`).
+
     Any pandas or numpy instance (for example ``obj``) is treated like that:
 
     +----------------------------+------------------------------------------+
@@ -443,11 +1113,61 @@ def PandelVisitor(
             Series([], dtype: float64)
 
     """
-    validator = jsonschema.validators.validator_for(schema)
+    ValidatorClass = _PandelVisitor_class(
+        jsonschema.validators.validator_for(schema),
+        auto_default,
+        auto_default_nulls,
+        auto_remove_nulls,
+        validation_cache,
+        max_branch_errors,
+        coerce_dtypes,
+    )
+
+    return ValidatorClass(schema, resolver=resolver, format_checker=format_checker)
+
+
+@fnt.lru_cache()
+def _PandelVisitor_class(
+    validator,
+    auto_default,
+    auto_default_nulls,
+    auto_remove_nulls,
+    validation_cache=None,
+    max_branch_errors=None,
+    coerce_dtypes=False,
+):
+    """
+    Extend a jsonschema `validator` class, once per draft, flags, cache & limits (see :func:`PandelVisitor()`).
+
+    The class gets a ``_validation_salt`` attribute, distinguishing
+    the :class:`ValidationCache` keys of validators behaving differently
+    (or from other library versions); instances add their formats
+    (see :func:`_validation_salt()`).
+
+    Examples::
+
+        >>> pv1, pv2 = PandelVisitor({}), PandelVisitor({'type': 'object'})
+        >>> type(pv1) is type(pv2)
+        True
+        >>> type(pv1) is type(PandelVisitor({}, auto_default=False))
+        False
+    """
     props_rule = validator.VALIDATORS["properties"]
+    flags = (auto_default, auto_default_nulls, auto_remove_nulls)
+    salt = "%s%s%s" % (validator.__name__, flags + (coerce_dtypes,), _libs_versions())
 
     rules = {"additionalProperties": _rule_additionalProperties}
-    if any((auto_default, auto_default_nulls, auto_remove_nulls)):
+    if validation_cache is not None:
+        props_rule = rules["properties"] = fnt.partial(
+            _rule_cached_properties,
+            original_props_rule=props_rule,
+            cache=validation_cache,
+        )
+    if coerce_dtypes:
+        props_rule = rules["properties"] = fnt.partial(
+            _rule_coerce_dtypes_properties, original_props_rule=props_rule
+        )
+    if any(flags):
         rules["properties"] = fnt.partial(
             _rule_auto_defaults_properties,
             original_props_rule=props_rule,
@@ -455,6 +1175,12 @@ def PandelVisitor(
             auto_default_nulls=auto_default_nulls,
             auto_remove_nulls=auto_remove_nulls,
         )
+    if "items" in validator.VALIDATORS:
+        rules["items"] = fnt.partial(
+            _rule_items,
+            original_items_rule=validator.VALIDATORS["items"],
+            max_errors=max_branch_errors,
+        )
     if "propertyNames" in validator.VALIDATORS:
         rules["propertyNames"] = _rule_propertyNames
     if hasattr(jsonschema._utils, "unbool"):
@@ -473,8 +1199,794 @@ def PandelVisitor(
         ),
         validators=rules,
     )
+    ValidatorClass._validation_salt = salt
 
-    return ValidatorClass(schema, resolver=resolver, format_checker=format_checker)
+    return ValidatorClass
+
+
+_validators_cache = OrderedDict()
+_validators_lock = threading.Lock()
+_VALIDATORS_CACHE_SIZE = 32
+
+
+def _schema_cache_key(schema):
+    """
+    :return: the schema serialized as canonical json, or `None` if not json-able
+
+    Examples::
+
+        >>> _schema_cache_key({'b': 1, 'a': [None]})
+        '{"a": [null], "b": 1}'
+        >>> _schema_cache_key({'a': object()}) is None
+        True
+    """
+    try:
+        return json.dumps(schema, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+
+
+def _cached_PandelVisitor(
+    schema, validation_cache=None, max_branch_errors=None, coerce_dtypes=False
+):
+    """
+    Like :func:`PandelVisitor()` with defaults, but reusing instances for equal schemas.
+
+    The schemas are keyed by their identity and (if json-able) their canonical json
+    (see :func:`_schema_cache_key()`), so they must not be modified
+    after their 1st use; the least-recently-used validators are evicted
+    beyond :data:`_VALIDATORS_CACHE_SIZE`.
+
+    :param ValidationCache validation_cache: see :func:`PandelVisitor()`
+    :param int max_branch_errors: see :func:`PandelVisitor()`
+    :param bool coerce_dtypes: see :func:`PandelVisitor()`
+    """
+    cache = _validators_cache
+    cache_id = (id(validation_cache), max_branch_errors, bool(coerce_dtypes))
+    with _validators_lock:
+        id_key = (id(schema),) + cache_id
+        entry = cache.get(id_key)
+        if entry and entry[0] is schema:
+            cache.move_to_end(id_key)
+            return entry[1]
+
+        key = _schema_cache_key(schema)
+        key = key and (key,) + cache_id
+        entry = key and cache.get(key)
+        if entry:
+            cache.move_to_end(key)
+            validator = entry[1]
+        else:
+            validator = PandelVisitor(
+                schema,
+                validation_cache=validation_cache,
+                max_branch_errors=max_branch_errors,
+                coerce_dtypes=coerce_dtypes,
+            )
+            if key:
+                cache[key] = (schema, validator)
+        cache[id_key] = (schema, validator)
+
+        while len(cache) > _VALIDATORS_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    return validator
+
+
+def iter_errors_bounded(errors, max_errors=None, max_examples=None):
+    """
+    Stream validation-errors within bounded memory, aggregating them per schema-path.
+
+    Only the first `max_examples` errors of each ``schema_path`` are yielded as they come;
+    the rest are just counted (and released), to be summarized by a last error for each
+    schema-path at the end.
+
+    :param errors:      an iterable of :class:`ValidationError` (ie. ``validator.iter_errors(mdl)``)
+    :param int max_errors:
+            if given, stop consuming (and closing) `errors` after that many,
+            yielding one more error about it
+    :param int max_examples:
+            if given, how many errors to yield per schema-path
+
+    Examples::
+
+        >>> pv = PandelVisitor({'items': {'type': 'string'}})
+        >>> for err in iter_errors_bounded(pv.iter_errors(list(range(10))), max_errors=6, max_examples=2):
+        ...     print(err.message)
+        0 is not of type 'string'
+        1 is not of type 'string'
+        Gave-up validating after 6 errors.
+        4 more errors like: 1 is not of type 'string'
+    """
+    counts = OrderedDict()
+    last_examples = {}
+    nerrors = 0
+    for err in errors:
+        if max_errors is not None and nerrors >= max_errors:
+            if hasattr(errors, "close"):
+                errors.close()
+            yield ValidationError("Gave-up validating after %i errors." % nerrors)
+            break
+        nerrors += 1
+        schema_path = tuple(err.schema_path)
+        count = counts[schema_path] = counts.get(schema_path, 0) + 1
+        if max_examples is None or count <= max_examples:
+            last_examples[schema_path] = err
+            yield err
+
+    if max_examples is not None:
+        for schema_path, count in counts.items():
+            if count > max_examples:
+                example = last_examples[schema_path]
+                path = list(example.path)
+                while path and isinstance(path[-1], int):
+                    path.pop()  # Report on the array, not the last item-example.
+                yield ValidationError(
+                    "%i more errors like: %s" % (count - max_examples, example.message),
+                    path=path,
+                    schema_path=schema_path,
+                )
+
+
+class _DigestsMemo(object):
+    """
+    The digests of the containers in the trees visited by a single validation pass.
+
+    Nodes are digested bottom-up (Merkle-style), so each one is hashed once per pass,
+    however many of its ancestors are keyed (see :func:`_content_digest()`);
+    any node modified must be reported with :meth:`modified()`,
+    to forget its digest and those of its ancestors.
+    """
+
+    def __init__(self):
+        #: ``{id: (node, digest)}``, keeping nodes alive, or their ids may be reused.
+        self._digests = {}
+        #: ``{child-id: {parent-ids}}``
+        self._parents = {}
+        #: A counter of :meth:`modified()` calls, to detect them.
+        self.modifications = 0
+
+    def get(self, node):
+        entry = self._digests.get(id(node))
+        if entry and entry[0] is node:
+            return entry[1]
+
+    def put(self, node, digest, children):
+        self._digests[id(node)] = (node, digest)
+        for child in children:
+            self._parents.setdefault(id(child), set()).add(id(node))
+
+    def modified(self, node):
+        self.modifications += 1
+        stack = [id(node)]
+        while stack:
+            node_id = stack.pop()
+            if self._digests.pop(node_id, None):
+                stack.extend(self._parents.get(node_id, ()))
+
+
+_digests_memos = threading.local()
+"""Holds the :class:`_DigestsMemo` of the validation pass running in each thread, if any."""
+
+
+@contextlib.contextmanager
+def _digests_pass():
+    """
+    Yield the :class:`_DigestsMemo` of the current thread's validation pass, starting one if none.
+
+    It spans generators, so it ends when the outermost one is exhausted or closed.
+    """
+    memo = getattr(_digests_memos, "memo", None)
+    if memo is not None:
+        yield memo
+        return
+
+    _digests_memos.memo = memo = _DigestsMemo()
+    try:
+        yield memo
+    finally:
+        _digests_memos.memo = None
+
+
+def _digests_modified(node):
+    """Report to the current validation pass (if any) that `node` was modified in-place."""
+    memo = getattr(_digests_memos, "memo", None)
+    if memo is not None:
+        memo.modified(node)
+
+
+_DIGESTED_NODES = (cabc.Mapping, list, tuple, np.ndarray, NDFrame)
+
+
+def _update_digest(hasher, obj, memo):
+    """Feed `hasher` with the type & content of `obj`, or with its node-digest; pickle what is unknown."""
+    if isinstance(obj, (str, bytes, numbers.Number, bool, type(None))):
+        hasher.update(repr((type(obj).__name__, obj)).encode())
+    elif isinstance(obj, _DIGESTED_NODES):
+        hasher.update(_node_digest(obj, memo))
+    else:
+        hasher.update(pickle.dumps(obj, protocol=4))
+
+
+def _node_digest(node, memo):
+    """:return: the digest of a container `node`, made of the digests of its children"""
+    digest = memo is not None and memo.get(node)
+    if digest:
+        return digest
+
+    hasher = hashlib.blake2b(digest_size=20)
+    children = ()
+    if isinstance(node, (pd.Series, pd.DataFrame)):
+        try:
+            rows = pd.util.hash_pandas_object(node, index=True).values
+        except TypeError:  # Unhashable values.
+            hasher.update(pickle.dumps(node, protocol=4))
+        else:
+            hasher.update(repr((type(node).__name__, node.shape)).encode())
+            axes_types = (node.axes[1:], getattr(node, "dtypes", node.dtype))
+            hasher.update(pickle.dumps(axes_types, protocol=4))
+            hasher.update(rows.view(np.uint8))
+    elif isinstance(node, cabc.Mapping):
+        hasher.update(b"{%i" % len(node))
+        for key, val in node.items():
+            _update_digest(hasher, key, memo)
+            _update_digest(hasher, val, memo)
+        hasher.update(b"}")
+        children = node.values()
+    elif isinstance(node, (list, tuple)):
+        hasher.update(b"[%s%i" % (type(node).__name__.encode(), len(node)))
+        for val in node:
+            _update_digest(hasher, val, memo)
+        hasher.update(b"]")
+        children = node
+    elif isinstance(node, np.ndarray) and not node.dtype.hasobject:
+        hasher.update(repr(("ndarray", node.dtype.str, node.shape)).encode())
+        hasher.update(np.require(node, requirements="C").reshape(-1).view(np.uint8))
+    else:
+        hasher.update(pickle.dumps(node, protocol=4))
+
+    digest = hasher.digest()
+    if memo is not None:
+        memo.put(node, digest, [c for c in children if isinstance(c, _DIGESTED_NODES)])
+
+    return digest
+
+
+def _content_digest(obj, memo=None):
+    """
+    :param memo: a :class:`_DigestsMemo` to reuse & store the digests of the nodes of `obj`
+    :return: a structural digest of the `obj` tree, or `None` if it cannot be pickled
+
+    Examples::
+
+        >>> _content_digest({'a': [1, 2]}) == _content_digest({'a': [1, 2]})
+        True
+        >>> _content_digest({'a': [1, 2]}) == _content_digest({'a': (1, 2)})
+        False
+        >>> _content_digest(np.arange(3)) == _content_digest(np.arange(3.))
+        False
+        >>> _content_digest(pd.Series([1, 2])) == _content_digest(pd.Series([1, 3]))
+        False
+
+        >>> memo = _DigestsMemo()
+        >>> tree = {'a': {'b': [1, 2]}}
+        >>> _content_digest(tree, memo) == _content_digest(tree)
+        True
+        >>> tree['a']['c'] = 3
+        >>> _content_digest(tree, memo) == _content_digest(tree)  ## Unreported.
+        False
+        >>> memo.modified(tree['a'])
+        >>> _content_digest(tree, memo) == _content_digest(tree)
+        True
+    """
+    hasher = hashlib.blake2b(digest_size=20)
+    try:
+        _update_digest(hasher, obj, memo)
+    except Exception:
+        return None
+
+    return hasher.hexdigest()
+
+
+_SCHEMA_DIGESTS_CACHE_SIZE = 1024
+"""The number of (sub)schemas whose digests each :class:`ValidationCache` remembers."""
+
+
+class ValidationCache(object):
+    """
+    Remembers which subtrees have passed validation against which subschemas.
+
+    Use it with :func:`PandelVisitor()` or :attr:`Pandel.validation_cache`,
+    to skip re-validating the unchanged parts of models validated repeatedly.
+
+    - The keys combine the digests of the subschema (its canonical json),
+      of the root-schema its ``$ref`` resolve against (see :func:`_resolution_root()`),
+      and of the instance's content (see :func:`_content_digest()`),
+      so a subtree modified (ie. by auto-defaults) is validated again.
+    - Only container values (mappings, sequences, numpy & pandas objects)
+      are cached; scalars are cheaper to validate than to hash.
+    - Schemas are assumed immutable, as for :func:`_cached_PandelVisitor()`;
+      the digests of the least-recently-used ones are forgotten
+      beyond :data:`_SCHEMA_DIGESTS_CACHE_SIZE`.
+    - The least-recently-used keys are evicted beyond `maxsize`.
+
+    :param str fpath:   if given, a json-file to load keys from (if it exists),
+                        and to :meth:`save()` them into, to persist across runs
+    :param int maxsize: the maximum number of keys to remember
+
+    Examples::
+
+        >>> cache = ValidationCache()
+        >>> schema = {'properties': {'a': {'type': 'array', 'items': {'type': 'number'}}}}
+        >>> pv = PandelVisitor(schema, validation_cache=cache)
+        >>> pv.validate({'a': [1, 2]})
+        >>> len(cache)
+        1
+        >>> pv.validate({'a': [1, 2]})    ## Hit, not descended.
+        >>> len(cache)
+        1
+        >>> pv.is_valid({'a': [1, 'x']})  ## Failures are not cached.
+        False
+        >>> len(cache)
+        1
+    """
+
+    def __init__(self, fpath=None, maxsize=100000):
+        self.fpath = fpath
+        self.maxsize = maxsize
+        self._keys = OrderedDict()
+        self._schema_digests = OrderedDict()
+        self._lock = threading.Lock()
+        if fpath and osp.isfile(fpath):
+            self.load()
+
+    def _schema_digest(self, schema):
+        digests = self._schema_digests
+        with self._lock:
+            entry = digests.get(id(schema))
+            if entry and entry[0] is schema:
+                digests.move_to_end(id(schema))
+                return entry[1]
+
+        js = _schema_cache_key(schema)
+        digest = js and hashlib.sha1(js.encode()).hexdigest()
+        with self._lock:
+            ## Keep `schema` alive, or its id may be reused.
+            digests[id(schema)] = (schema, digest)
+            while len(digests) > _SCHEMA_DIGESTS_CACHE_SIZE:
+                digests.popitem(last=False)
+
+        return digest
+
+    def key(self, schema, instance, salt="", root=None, memo=None):
+        """
+        :param salt: distinguishes validators behaving differently for the same schema
+        :param root: the schema-document that any ``$ref`` in `schema` resolve against;
+                     if `None`, `schema` is itself the root
+        :param memo: the :class:`_DigestsMemo` of the validation pass, if any
+        :return: the key of validating `instance` against `schema`,
+                 or `None` if uncacheable (ie. a scalar or an unpicklable object)
+        """
+        if isinstance(instance, (str, bytes)) or not isinstance(
+            instance, (cabc.Mapping, list, tuple, np.ndarray, NDFrame)
+        ):
+            return None
+        schema_digest = self._schema_digest(schema)
+        root_digest = schema_digest if root is None else self._schema_digest(root)
+        if schema_digest and root_digest:
+            content_digest = _content_digest(instance, memo)
+            if content_digest:
+                digests = (root_digest, schema_digest, content_digest)
+                return "%s:%s:%s:%s" % ((salt,) + digests)
+
+    def __contains__(self, key):
+        with self._lock:
+            if key in self._keys:
+                self._keys.move_to_end(key)
+                return True
+        return False
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, key):
+        with self._lock:
+            self._keys[key] = None
+            self._keys.move_to_end(key)
+            while len(self._keys) > self.maxsize:
+                self._keys.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._keys.clear()
+
+    def load(self, fpath=None):
+        """Add the keys stored in a json-file (default: :attr:`fpath`), ignoring it if corrupted."""
+        try:
+            with open(fpath or self.fpath, "rt") as fd:
+                keys = json.load(fd)["keys"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        for key in keys:
+            self.add(key)
+
+    def save(self, fpath=None):
+        """Store the keys in a json-file (default: :attr:`fpath`), atomically."""
+        fpath = fpath or self.fpath
+        with self._lock:
+            keys = list(self._keys)
+        tmp_fpath = "%s.tmp" % fpath
+        with open(tmp_fpath, "wt") as fd:
+            json.dump({"keys": keys}, fd)
+        os.replace(tmp_fpath, fpath)
+
+
+def _shallow_pandas(pd_type, obj):
+    """A new `pd_type` instance sharing the data (but not the columns) of `obj`, if already one."""
+    return obj.copy(deep=False) if isinstance(obj, pd_type) else pd_type(obj)
+
+
+def _merge_frames(a, b):
+    """
+    Like ``a.update(b)`` plus appending extra `b` columns, without modifying `a`.
+
+    Only the columns of `a` partially overridden by `b` are copied, the rest are shared;
+    columns of `b` without NaNs (of the same index & dtype) replace wholly
+    those of `a`, so they are shared, too.
+    Overridden columns of the same index & dtype are merged
+    with a single :meth:`pandas.Series.where()`, without any temporary copies.
+
+    Examples::
+
+        >>> a = pd.DataFrame({'x': [1., 2.], 'y': [3., 4.]})
+        >>> b = pd.DataFrame({'x': [10., np.nan], 'z': [5, 6]})
+        >>> m = _merge_frames(a, b)
+        >>> m
+              x    y  z
+        0  10.0  3.0  5
+        1   2.0  4.0  6
+        >>> np.shares_memory(m['y'].values, a['y'].values)
+        True
+        >>> list(a.columns), a.loc[0, 'x']
+        (['x', 'y'], 1.0)
+    """
+    overridden = [c for c in a.columns if c in b.columns]
+    extra = [c for c in b.columns if c not in a.columns]
+    if not overridden and not extra:
+        return a.copy(deep=False)
+
+    same_index = a.index.equals(b.index)
+    replaced = {}
+    if same_index:
+        for c in overridden:
+            bcol, acol = b[c], a[c]
+            if bcol.dtype == acol.dtype:
+                notna = bcol.notna()
+                replaced[c] = bcol if notna.all() else bcol.where(notna, acol)
+        overridden = [c for c in overridden if c not in replaced]
+    if overridden:
+        ## Avoid `df[list]`, it consolidates (copies) all blocks in-place.
+        upd = pd.DataFrame({c: a[c] for c in overridden}, index=a.index, copy=True)
+        upd.update(pd.DataFrame({c: b[c] for c in overridden}, index=b.index))
+        replaced.update((c, upd[c]) for c in overridden)
+    columns = [replaced[c] if c in replaced else a[c] for c in a.columns]
+    columns.extend(b[c] if same_index else b[c].reindex(a.index) for c in extra)
+
+    merged = pd.concat(columns, axis=1, copy=False)
+    merged.columns = a.columns.append(pd.Index(extra))
+
+    return merged
+
+
+def _submodel_snapshot(mdl, digests=False):
+    """
+    :param bool digests: whether to take also the content-digest of each branch
+    :return: a ``{key: (branch, digest)}`` map for each top-level branch of
+             a mapping submodel, or `None` if not a (pure) mapping
+    """
+    if not isinstance(mdl, dict):
+        return None
+
+    return {
+        key: (val, _content_digest(val) if digests else None)
+        for key, val in _raw_items(mdl)
+    }
+
+
+def _changed_branch_keys(old_snap, new_snap):
+    """
+    :return: the keys of the top-level branches differing between two :func:`_submodel_snapshot()`
+
+    Branches are compared by content-digest if both snapshots have them,
+    otherwise only branches replaced by another object are compared
+    (the digests computed just for those).
+
+    Examples::
+
+        >>> b = {'x': 1}
+        >>> old = _submodel_snapshot({'a': 1, 'b': b, 'c': [1]})
+        >>> b['x'] = 2  ## In-place edits go unnoticed without digests.
+        >>> sorted(_changed_branch_keys(old, _submodel_snapshot({'a': 1, 'b': b, 'c': [2], 'd': 0})))
+        ['c', 'd']
+
+        >>> old = _submodel_snapshot({'b': b}, digests=True)
+        >>> b['x'] = 3
+        >>> _changed_branch_keys(old, _submodel_snapshot({'b': b}, digests=True))
+        {'b'}
+    """
+    keys = old_snap.keys() ^ new_snap.keys()
+    for key in old_snap.keys() & new_snap.keys():
+        (old_val, old_digest), (new_val, new_digest) = old_snap[key], new_snap[key]
+        if old_digest is None or new_digest is None:
+            if old_val is new_val:
+                continue
+            old_digest, new_digest = _content_digest(old_val), _content_digest(new_val)
+        if old_digest is None or old_digest != new_digest:
+            keys.add(key)
+
+    return keys
+
+
+def _is_path_affected(path, keys):
+    """
+    Whether a ``json_path`` lies in, or contains, any of the top-level `keys`.
+
+    Examples::
+
+        >>> _is_path_affected('/a/b', ['a'])
+        True
+        >>> _is_path_affected('', ['a']), _is_path_affected('/ab', ['a'])
+        (True, False)
+    """
+    parts = [p for p in iter_jsonpointer_parts_relaxed(path) if p]
+    return not parts or parts[0] in {str(k) for k in keys}
+
+
+_INCREMENTAL_SCHEMA_BLOCKERS = frozenset(
+    (
+        "$ref",
+        "allOf",
+        "anyOf",
+        "oneOf",
+        "not",
+        "if",
+        "dependencies",
+        "dependentSchemas",
+        "unevaluatedProperties",
+    )
+)
+
+
+def _restrict_schema(schema, keys):
+    """
+    Make a schema validating fully only the `keys` properties (the rest already validated).
+
+    The other properties get an empty (always valid) schema, while all
+    other top-level keywords (ie. ``required``) are kept.
+
+    :return: the new schema, or `None` if `schema` is not a plain object-schema
+             with ``properties`` (ie. it combines sub-schemas)
+
+    Examples::
+
+        >>> _restrict_schema({'required': ['a'], 'properties': {'a': {'type': 'string'},
+        ...                   'b': {'type': 'number'}}}, ['a'])
+        {'required': ['a'], 'properties': {'a': {'type': 'string'}, 'b': {}}}
+        >>> _restrict_schema({'anyOf': [], 'properties': {}}, ['a']) is None
+        True
+    """
+    if (
+        not isinstance(schema, dict)
+        or not isinstance(schema.get("properties"), dict)
+        or _INCREMENTAL_SCHEMA_BLOCKERS & schema.keys()
+    ):
+        return None
+    props = {k: (sub if k in keys else {}) for k, sub in schema["properties"].items()}
+
+    return {**schema, "properties": props}
+
+
+class _LazyBranch(object):
+    """
+    A placeholder for a model-branch to be read by :meth:`Pandel._read_branch()` on first access.
+
+    The value read is cached, so it loads at most once, even if the placeholder
+    has been shared by many (merged) models and threads.
+    """
+
+    __slots__ = ("path", "inp", "_reader", "_value", "_lock")
+
+    _unread = object()
+
+    def __init__(self, reader, path, inp):
+        self.path = path
+        self.inp = inp
+        self._reader = reader
+        self._value = self._unread
+        self._lock = threading.Lock()
+
+    @property
+    def is_read(self):
+        return self._value is not self._unread
+
+    def read(self):
+        if self._value is self._unread:
+            with self._lock:
+                if self._value is self._unread:
+                    try:
+                        self._value = self._reader(*self.inp)
+                    except Exception as ex:
+                        raise ValueError(
+                            "Reading branch(%s) from %s failed due to: %s"
+                            % (self.path, self.inp, ex)
+                        ) from ex
+        return self._value
+
+    def __repr__(self):
+        return "%s(%s, %s)" % (type(self).__name__, self.path, self.inp)
+
+
+def _materialized(value):
+    return value.read() if isinstance(value, _LazyBranch) else value
+
+
+def _raw_items(mapping):
+    """Like ``mapping.items()`` without reading any :class:`_LazyBranch` values."""
+    return dict.items(mapping) if isinstance(mapping, dict) else mapping.items()
+
+
+class _LazyDict(dict):
+    """
+    A model-dict reading any :class:`_LazyBranch` values when accessed (and replacing them).
+
+    Membership, iterating and counting keys do not read values,
+    so branches never accessed (ie. by validation) never load.
+    Its :meth:`items()` & :meth:`values()` are (lazy) views, as for plain dicts.
+    """
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if isinstance(value, _LazyBranch):
+            value = value.read()
+            dict.__setitem__(self, key, value)
+        return value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def pop(self, key, *default):
+        return _materialized(dict.pop(self, key, *default))
+
+    def values(self):
+        return cabc.ValuesView(self)
+
+    def items(self):
+        return cabc.ItemsView(self)
+
+    def copy(self):
+        return type(self)(dict.items(self))
+
+    def __eq__(self, other):
+        return dict(self.items()) == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "%s(%s)" % (type(self).__name__, dict.__repr__(self))
+
+
+def _wrap_if_lazy(mapping):
+    """Upgrade `mapping` into a :class:`_LazyDict` if it contains any unread branches."""
+    if not isinstance(mapping, _LazyDict) and any(
+        isinstance(v, _LazyBranch) for v in dict.values(mapping)
+    ):
+        mapping = _LazyDict(dict.items(mapping))
+    return mapping
+
+
+def _lazy_ref_inp(node):
+    """
+    :return: the args-list for :meth:`Pandel._read_branch()` if `node` is a lazy reference, `None` otherwise
+
+    Lazy references are either :class:`ModelOperations` with a non-empty `inp`,
+    or the *extended json-refs* dicts ``{"$ref": <source>, "$inp": [<fmt>, ...]}``;
+    the ``$inp`` key is mandatory (but may be empty, for ``AUTO`` format),
+    so that plain json-refs in model-data are left intact.
+
+    Examples::
+
+        >>> _lazy_ref_inp(ModelOperations(inp=['data.npy']))
+        ['data.npy']
+        >>> _lazy_ref_inp({'$ref': 'data.csv', '$inp': ['CSV', 'sep=;']})
+        ['data.csv', 'CSV', 'sep=;']
+        >>> _lazy_ref_inp({'$ref': 'data.csv', '$inp': []})
+        ['data.csv']
+        >>> _lazy_ref_inp({'$ref': '#/x'}) is None
+        True
+        >>> _lazy_ref_inp({'a': 1}) is None
+        True
+    """
+    if isinstance(node, ModelOperations):
+        if node.inp:
+            return list(node.inp) if isinstance(node.inp, (list, tuple)) else [node.inp]
+    elif (
+        isinstance(node, dict)
+        and isinstance(node.get("$ref"), str)
+        and isinstance(node.get("$inp"), (list, tuple))
+    ):
+        return [node["$ref"]] + list(node["$inp"])
+
+
+def _parse_branch_opt(opt):
+    """
+    :return: the ``(key, value)`` of a ``key=value`` reader-option, the value parsed as JSON, if possible
+
+    Examples::
+
+        >>> _parse_branch_opt('index_col=0'), _parse_branch_opt('header=null')
+        (('index_col', 0), ('header', None))
+        >>> _parse_branch_opt('sep=;'), _parse_branch_opt('na_values=["-"]')
+        (('sep', ';'), ('na_values', ['-']))
+    """
+    key, value = opt.split("=", 1)
+    try:
+        value = json.loads(value)
+    except ValueError:
+        pass
+
+    return key, value
+
+
+def _read_json_branch(source, **kws):
+    with open(source, "rt") as fd:
+        return json.load(fd, **kws)
+
+
+def _read_xlref_branch(source, **kws):
+    from pandalone import xleash
+
+    return xleash.lasso(source, **kws)
+
+
+_branch_readers = {
+    "JSON": _read_json_branch,
+    "CSV": lambda source, **kws: pd.read_csv(source, **kws),
+    "NPY": lambda source, **kws: np.load(source, **kws),
+    "PARQUET": lambda source, **kws: pd.read_parquet(source, **kws),
+    "XLREF": _read_xlref_branch,
+}
+"""The formats supported by :meth:`Pandel._read_branch()` --> ``read(source, **kws)``."""
+
+
+def _guess_branch_format(source):
+    """
+    Examples::
+
+        >>> _guess_branch_format('some/file.Parquet'), _guess_branch_format('a.xlsx#A1:B2')
+        ('PARQUET', 'XLREF')
+        >>> _guess_branch_format('#Sheet1!A1')
+        'XLREF'
+    """
+    from pandalone import xlsutils
+
+    if "#" in source:
+        url = source.split("#", 1)[0]
+        if not url or xlsutils._xl_extensions_anywhere.search(url):
+            return "XLREF"
+    m = re.search(r"\.(\w+)$", source)
+    fmt = m and m.group(1).upper()
+    if fmt not in _branch_readers:
+        raise ValueError("Cannot guess format of branch-source(%s)!" % source)
+
+    return fmt
+
+
+def _prevalidate_in_process(pandel, schema, mdl):
+    """The process-pool worker of :meth:`Pandel._prevalidate()`, returning its errors & the validated `mdl`."""
+    return list(pandel._validate_json_model(schema, mdl)), mdl
 
 
 class Pandel(object):
@@ -551,7 +2063,8 @@ class Pandel(object):
               "$out": ["HDF5"]
             }
 
-        .. Warning:: Step NOT IMPLEMENTED YET!
+        Currently the referred content is read *lazily* (see :meth:`_resolve()`),
+        and ``http`` URIs are not supported.
 
 
     2.  Loosely :meth:`_prevalidate` each sub-model separately with :term:`json-schema`,
@@ -669,6 +2182,12 @@ class Pandel(object):
         the last one, the :dfn:`top-model`.  Use the :meth:`add_submodel()` to build this list.
 
 
+    .. Attribute:: _resolved_submodels
+
+        The submodels after the :meth:`_resolve()` step, with any lazy-references
+        replaced by branches read on first access.
+
+
     .. Attribute:: _global_cntxt
 
         A :class:`ModelOperations` instance acting as the global-default context for the unified-model and all submodels.
@@ -684,6 +2203,68 @@ class Pandel(object):
                 pass      ## ie: modify ``model_maker.model``.
 
         Better specify this list of functions on construction time.
+        A function may declare the ``json_paths`` it reads in an ``input_paths`` attribute,
+        so that :meth:`rebuild_iter()` re-runs it only if those paths have changed.
+
+
+    .. Attribute:: model_provenance
+
+        A map of top-level ``json_paths`` of the :attr:`model` --> the indices of the submodels
+        contributing to them, when all submodels are mappings; `None` otherwise.
+        Updated after each successful :meth:`build_iter()` or :meth:`rebuild_iter()`.
+
+
+    .. Attribute:: _submodel_snapshots
+
+        A list with a ``{key: (branch, digest)}`` map for each (mapping) submodel,
+        taken after the last successful build, for :meth:`rebuild_iter()` to detect
+        which top-level branches have changed (see :func:`_submodel_snapshot()`).
+
+
+    .. Attribute:: digest_submodels
+
+        When true, the content of each top-level branch of the submodels is digested
+        after every successful build, so that :meth:`rebuild_iter()` detects also
+        in-place edits in them (at the cost of hashing all submodels on each build).
+        False by default, when only the branches replaced by other objects
+        (ie. with :meth:`replace_submodel()`) are detected (and digested just then).
+
+
+    .. Attribute:: validation_cache
+
+        A :class:`ValidationCache` (or `None`) remembering the model-trees and subtrees
+        that have passed validation, so that unchanged ones are skipped when
+        re-validated (ie. across builds, or runs if persisted).
+
+
+    .. Attribute:: prevalidate_jobs
+
+        The number of worker-processes validating concurrently the submodels
+        in :meth:`_prevalidate()`; if `None` (default), ``0`` or ``1``,
+        they are validated serially.  Errors are yielded in the order of submodels,
+        regardless.  The workers validate copies of the submodels, so the copies
+        returned (with any auto-defaults & coercions applied) replace
+        the :attr:`_resolved_submodels`; submodels failing to pickle
+        (ie. with lazy-references) and Pandel subclasses failing to pickle
+        (ie. not importable) are validated serially, in this process.
+
+
+    .. Attribute:: max_errors
+                   max_error_examples
+                   max_branch_errors
+
+        Error budgets (all `None` by default, for unbounded) for validating each (sub)model,
+        so that badly broken ones are reported in bounded time & memory:
+        the total errors, the errors yielded per schema-path (see :func:`iter_errors_bounded()`),
+        and the errors within the items of each array (see :func:`PandelVisitor()`).
+
+
+    .. Attribute:: coerce_dtypes
+
+        When true, the *object* columns of data-frames (and arrays) are converted in-place,
+        while validating, to the dtypes their schema's ``items`` denote,
+        ie. ``number`` --> float (see `coerce_dtypes` in :func:`PandelVisitor()`).
+        False by default.
 
 
     .. Attribute:: _errored
@@ -764,16 +2345,43 @@ class Pandel(object):
 
     __metaclass__ = abc.ABCMeta
 
-    def __init__(self, curate_funcs=()):
+    def __init__(
+        self,
+        curate_funcs=(),
+        validation_cache=None,
+        max_errors=None,
+        max_error_examples=None,
+        max_branch_errors=None,
+        coerce_dtypes=False,
+        digest_submodels=False,
+        prevalidate_jobs=None,
+    ):
         """
 
         :param sequence curate_funcs:   See :attr:`_curate_funcs`.
+        :param ValidationCache validation_cache:    See :attr:`validation_cache`.
+        :param int max_errors:          See :attr:`max_errors`.
+        :param int max_error_examples:  See :attr:`max_error_examples`.
+        :param int max_branch_errors:   See :attr:`max_branch_errors`.
+        :param bool coerce_dtypes:      See :attr:`coerce_dtypes`.
+        :param bool digest_submodels:   See :attr:`digest_submodels`.
+        :param int prevalidate_jobs:    See :attr:`prevalidate_jobs`.
         """
 
+        self.validation_cache = validation_cache
+        self.max_errors = max_errors
+        self.max_error_examples = max_error_examples
+        self.max_branch_errors = max_branch_errors
+        self.coerce_dtypes = coerce_dtypes
+        self.digest_submodels = digest_submodels
+        self.prevalidate_jobs = prevalidate_jobs
         self.model = None
         self._errored = None
         self._submodel_tuples = []
         self._curate_funcs = curate_funcs
+        self._resolved_submodels = None
+        self.model_provenance = None
+        self._submodel_snapshots = None
         self._global_cntxt = []
         self._unified_contexts = None
 
@@ -819,11 +2427,28 @@ class Pandel(object):
         """
         pass
 
-    def _read_branch(self):
+    def _read_branch(self, source, fmt="AUTO", *opts):
         """
-        Reads model-branches during *resolve* step.
+        Reads a model-branch, lazily, when first accessed after the *resolve* step.
+
+        :param str source:  a file-path or an :term:`xl-ref`
+        :param str fmt:     one of :data:`_branch_readers` keys (case-insensitive),
+                            or ``AUTO`` to guess it from `source`
+        :param opts:        ``key=value`` strings, passed as keywords to the reader,
+                            with their values parsed as JSON (ie. ``index_col=0``,
+                            ``header=null``), or else kept as strings
+        :return:            the branch's value
         """
-        pass  # TODO: impl read_branch()
+        fmt = fmt.upper()
+        if fmt == "AUTO":
+            fmt = _guess_branch_format(source)
+        if fmt not in _branch_readers:
+            raise ValueError(
+                "Unknown branch-format(%s) for source(%s)!" % (fmt, source)
+            )
+        kws = dict(_parse_branch_opt(opt) for opt in opts)
+
+        return _branch_readers[fmt](source, **kws)
 
     def _write_branch(self):
         """
@@ -868,100 +2493,259 @@ class Pandel(object):
                     yield ValidationError("%r is a required property" % prop)
 
     def _get_model_validator(self, schema):
-        return PandelVisitor(schema)
+        """Override it to customize validation, by default reusing validators (see :func:`_cached_PandelVisitor()`)."""
+        return _cached_PandelVisitor(
+            schema, self.validation_cache, self.max_branch_errors, self.coerce_dtypes
+        )
 
     def _validate_json_model(self, schema, mdl):
         validator = self._get_model_validator(schema)
-        for err in validator.iter_errors(mdl):
+        cache = self.validation_cache
+        salt = _validation_salt(validator)
+        if cache is None or salt is None:
+            for err in self._iter_model_errors(validator, mdl):
+                yield err
+            return
+
+        with _digests_pass() as memo:
+            key = cache.key(schema, mdl, salt, memo=memo)
+            if key and key in cache:
+                return
+
+            modifications = memo.modifications
+            passed = True
+            for err in self._iter_model_errors(validator, mdl):
+                passed = False
+                yield err
+
+            if key and passed:
+                if memo.modifications != modifications:  # Auto-defaults modified it.
+                    key = cache.key(schema, mdl, salt, memo=memo)
+                if key:
+                    cache.add(key)
+
+    def _iter_model_errors(self, validator, mdl):
+        errors = validator.iter_errors(mdl)
+        if self.max_errors is not None or self.max_error_examples is not None:
+            errors = iter_errors_bounded(
+                errors, self.max_errors, self.max_error_examples
+            )
+        for err in errors:
             self._errored = True
             yield err
 
     def _clone_and_merge_submodels(self, a, b, path=""):
-        """' Recursively merge b into a, cloning both. """
+        """
+        Recursively merge b into a, copying-on-write only the overridden branches.
+
+        - Branches present only in `a` or only in `b` are shared by reference,
+          so the merged model must not be modified in-place (as before,
+          nested branches of the submodels were also shared).
+        - Mappings are always shallow-copied.
+        - For DataFrames, only the columns overridden by `b` are copied;
+          the rest of the columns keep sharing the pandas blocks
+          (see :func:`_merge_frames()`).
+        - Sequences are not merged, `b` replaces `a`.
+        - Unread lazy branches (see :meth:`_resolve()`) are read only if both
+          `a` & `b` have them, otherwise they are carried over unread.
+        """
 
-        if isinstance(a, pd.DataFrame) or isinstance(b, pd.DataFrame):
-            a = pd.DataFrame() if a is None else pd.DataFrame(a)
-            b = pd.DataFrame() if b is None else pd.DataFrame(b)
+        a, b = _materialized(a), _materialized(b)
+        if a is None and b is None:
+            raise ValidationError("Cannot merge Nones at path(%s)!" % path)
 
-            a.update(b)  # , 'outer') NOT IMPL YET
-            extra_b_items = list(set(b.columns) - set(a.columns))
-            a[extra_b_items] = b[extra_b_items]
+        if isinstance(a, pd.DataFrame) or isinstance(b, pd.DataFrame):
+            if a is None or b is None:
+                a = _shallow_pandas(pd.DataFrame, b if a is None else a)
+            else:
+                a = _merge_frames(pd.DataFrame(a), pd.DataFrame(b))
 
         elif isinstance(a, pd.Series) or isinstance(b, pd.Series):
-            a = pd.Series() if a is None else pd.Series(a)
-            b = pd.Series() if b is None else pd.Series(b)
-            # a.update(b) # DOES NOT append extra keys!
-            a = b.combine_first(a)
+            if a is None or b is None:
+                a = _shallow_pandas(pd.Series, b if a is None else a)
+            else:
+                # a.update(b) # DOES NOT append extra keys!
+                a = pd.Series(b).combine_first(pd.Series(a))
 
         elif isinstance(a, cabc.Mapping) or isinstance(b, cabc.Mapping):
-            a = {} if a is None else {**a}
-            b = {} if b is None else {**b}
-
-            for key in b:
-                b_val = b[key]
-                if key in a:
-                    val = self._clone_and_merge_submodels(
-                        a[key], b_val, "%s/%s" % (path, key)
-                    )
+            a = {} if a is None else dict(_raw_items(a))
+            if b is not None:
+                for key, b_val in _raw_items(b):
+                    if key in a:
+                        b_val = self._clone_and_merge_submodels(
+                            a[key], b_val, "%s/%s" % (path, key)
+                        )
+                    a[key] = b_val
+            a = _wrap_if_lazy(a)
+
+        elif b is not None:
+            a = b
+
+        return a
+
+    def _lazify(self, node, path):
+        """Clone `node` replacing lazy-references with :class:`_LazyBranch`, or return it if none found."""
+        if isinstance(node, dict):
+            changed = False
+            clone = {}
+            for key, val in dict.items(node):
+                child_path = "%s/%s" % (path, escape_jsonpointer_part(str(key)))
+                inp = _lazy_ref_inp(val)
+                if inp is not None:
+                    val = _LazyBranch(self._read_branch, child_path, inp)
                 else:
-                    val = b_val
-                a[key] = val
+                    val = self._lazify(val, child_path)
+                changed |= val is not dict.__getitem__(node, key)
+                clone[key] = val
+            if changed:
+                return _wrap_if_lazy(clone)
 
-        elif (isinstance(a, cabc.Sequence) and not isinstance(a, str)) or (
-            isinstance(b, cabc.Sequence) and not isinstance(b, str)
-        ):
-            if b is not None:
-                val = b
-            else:
-                val = a
+        return node
 
-            l = list()
-            for (i, item) in enumerate(val):
-                l.append(
-                    self._clone_and_merge_submodels(item, None, "%s[%i]" % (path, i))
-                )
-            a = l
+    def _resolve(self, indices=None):
+        """
+        Step-0: Replace lazy-references in submodels with branches read on first access.
 
-        elif a is None and b is None:
-            raise ValidationError("Cannot merge Nones at path(%s)!" % path)
+        Lazy references (see :func:`_lazy_ref_inp()`) may appear as values of mappings,
+        at any depth; only the containers up to them are cloned, to avoid side-effecting
+        the submodels.  The branches are read by :meth:`_read_branch()` only when
+        validation, merging or :meth:`get()` access them.
 
-        else:
-            if b is not None:
-                a = b
+        The resolved submodels are stored in :attr:`_resolved_submodels`.
 
-        return a
+        :param indices: if given, resolves only those submodels
+        """
+        submodels = [mdl for mdl, _path_ops in self._submodel_tuples]
+        resolved = (self._resolved_submodels or [])[: len(submodels)]
+        resolved.extend([None] * (len(submodels) - len(resolved)))
+        for i, mdl in enumerate(submodels):
+            if indices is None or i in indices or resolved[i] is None:
+                inp = _lazy_ref_inp(mdl)
+                if inp is not None:
+                    mdl = _LazyBranch(self._read_branch, "", inp).read()
+                resolved[i] = self._lazify(mdl, "")
+        self._resolved_submodels = resolved
 
-    def _resolve(self):
-        "Step-1"
         if False:
-            yield
+            yield  # Just mark method as generator.
 
-    def _prevalidate(self):
-        "Step-1"
-        for (mdl, path_ops) in self._submodel_tuples:
-            schema = self._get_json_schema(is_prevalidation=True)
-            for err in self._validate_json_model(schema, mdl):
-                yield err
+    def _prevalidate(self, indices=None):
+        """
+        Step-1: Validates submodels, in :attr:`prevalidate_jobs` processes if more than 1.
+
+        :param indices: if given, validates only those submodels
+        """
+        if indices is None:
+            indices = range(len(self._resolved_submodels))
+        jobs = self.prevalidate_jobs
+        if jobs is not None and jobs > 1 and len(indices) > 1:
+            errors = self._prevalidate_in_processes(indices, jobs)
+        else:
+            errors = (err for i in indices for err in self._prevalidate_submodel(i))
+        for err in errors:
+            yield err
+
+    def _prevalidate_submodel(self, index):
+        schema = self._get_json_schema(is_prevalidation=True)
+        return self._validate_json_model(schema, self._resolved_submodels[index])
 
-    def _merge(self):
-        "Step-2"
-        for (mdl, path_ops) in self._submodel_tuples:
-            self.model = self._clone_and_merge_submodels(self.model, mdl)
+    def _prevalidate_in_processes(self, indices, jobs):
+        """
+        Validate in a process-pool the submodels not in the :attr:`validation_cache`.
+
+        The workers receive a clone of this instance stripped of its models & cache,
+        so any overridden :meth:`_get_model_validator()` applies.
+        """
+        worker = copy.copy(self)
+        worker.validation_cache = worker.model = worker._resolved_submodels = None
+        worker._submodel_tuples = worker._global_cntxt = []
+        worker._curate_funcs = ()
+        worker._submodel_snapshots = worker.model_provenance = None
+
+        schema = self._get_json_schema(is_prevalidation=True)
+        cache = self.validation_cache
+        salt = cache is not None and _validation_salt(self._get_model_validator(schema))
+        submodels = self._resolved_submodels
+        with cfut.ProcessPoolExecutor(jobs) as pool:
+            futures = []
+            for i in indices:
+                mdl = submodels[i]
+                key = salt and cache.key(schema, mdl, salt)
+                if not (key and key in cache):
+                    fut = pool.submit(_prevalidate_in_process, worker, schema, mdl)
+                    futures.append((i, fut))
+            for i, fut in futures:
+                try:
+                    errors, mdl = fut.result()
+                except (pickle.PicklingError, TypeError, AttributeError):
+                    ## Unpicklable submodel or Pandel.
+                    errors = self._prevalidate_submodel(i)
+                else:
+                    submodels[i] = mdl
+                    if errors:
+                        self._errored = True
+                    else:
+                        key = salt and cache.key(schema, mdl, salt)
+                        if key:
+                            cache.add(key)
+                for err in errors:
+                    yield err
+
+    def _merge(self, keys=None):
+        """
+        Step-2
+
+        :param keys: if given, re-merges only those top-level keys into the existing :attr:`model`
+        """
+        if keys is None:
+            for mdl in self._resolved_submodels:
+                self.model = self._clone_and_merge_submodels(self.model, mdl)
+        else:
+            model = dict(_raw_items(self.model))
+            for key in keys:
+                model.pop(key, None)
+                for mdl in self._resolved_submodels:
+                    if key in mdl:
+                        model[key] = (
+                            self._clone_and_merge_submodels(
+                                model[key], mdl[key], "/%s" % key
+                            )
+                            if key in model
+                            else dict.__getitem__(mdl, key)
+                        )
+            self.model = _wrap_if_lazy(model)
         if False:
             yield  # Just mark method as generator.
 
-    def _validate(self):
-        "Step-3"
+    def _validate(self, keys=None):
+        """
+        Step-3
+
+        :param keys: if given, and the schema allows it (see :func:`_restrict_schema()`),
+                     re-validates only those top-level keys
+        """
         schema = self._get_json_schema(is_prevalidation=False)
+        if keys is not None:
+            schema = _restrict_schema(schema, keys) or schema
         for err in self._validate_json_model(schema, self.model):
             yield err
 
-    def _curate(self):
-        "Step-4:  Invokes any curate-functions found in :attr:`_curate_funcs`."
+    def _curate(self, keys=None):
+        """
+        Step-4:  Invokes any curate-functions found in :attr:`_curate_funcs`.
+
+        :param keys: if given, skips functions with ``input_paths`` unaffected by these top-level keys
+        """
         if False:
             yield  # To be overriden, just mark method as generator.
         for curfunc in self._curate_funcs:
-            curfunc(self)
+            input_paths = getattr(curfunc, "input_paths", None)
+            if (
+                keys is None
+                or input_paths is None
+                or any(_is_path_affected(p, keys) for p in input_paths)
+            ):
+                curfunc(self)
 
     def add_submodel(self, model, path_ops=None):
         """
@@ -985,24 +2769,21 @@ class Pandel(object):
 
         return self._submodel_tuples.append((model, path_ops))
 
-    def build_iter(self):
+    def replace_submodel(self, index, model, path_ops=None):
         """
-        Iteratively build model, yielding any problems as :class:`ValidationError` instances.
-
-        For debugging, the unified model at :attr:`model` my contain intermediate results at any time,
-        even if construction has failed.  Check the :attr:`_errored` flag if neccessary.
+        Replaces a submodel added with :meth:`add_submodel()`; use :meth:`rebuild()` afterwards.
+
+        :param int index:           the position of the submodel to replace (negatives count from top)
         """
+        if path_ops:
+            assert isinstance(path_ops, cabc.Mapping), (type(path_ops), path_ops)
 
-        steps = [
-            (self._prevalidate, "prevalidate"),
-            (self._merge, "merge"),
-            (self._validate, "validate"),
-            (self._curate, "curate"),
-        ]
-        self._errored = False
-        self.model = None
+        self._submodel_tuples[index] = (model, path_ops)
 
-        for (i, (step, step_name)) in enumerate(steps, start=1):
+    def _run_steps(self, steps):
+        ## The 1st (resolve) step is numbered 0, keeping the numbers
+        #  of the original steps (prevalidate, merge...) in the messages.
+        for (i, (step, step_name)) in enumerate(steps):
             try:
                 for err in step():
                     yield err
@@ -1021,11 +2802,102 @@ class Pandel(object):
                 yield nex
 
             if self._errored:
+                self._submodel_snapshots = self.model_provenance = None
                 yield ValidationError(
                     "Gave-up building model after step %i.%s (out of %i)."
-                    % (i, step_name, len(steps))
+                    % (i, step_name, len(steps) - 1)
                 )
                 break
+        else:
+            snapshots = [
+                _submodel_snapshot(mdl, self.digest_submodels)
+                for mdl, _ in self._submodel_tuples
+            ]
+            if all(snap is not None for snap in snapshots):
+                self._submodel_snapshots = snapshots
+                self.model_provenance = {
+                    "/%s" % escape_jsonpointer_part(str(key)): [
+                        i for i, snap in enumerate(snapshots) if key in snap
+                    ]
+                    for key in self.model
+                }
+            else:
+                self._submodel_snapshots = self.model_provenance = None
+
+    def build_iter(self):
+        """
+        Iteratively build model, yielding any problems as :class:`ValidationError` instances.
+
+        For debugging, the unified model at :attr:`model` my contain intermediate results at any time,
+        even if construction has failed.  Check the :attr:`_errored` flag if neccessary.
+        """
+
+        steps = [
+            (self._resolve, "resolve"),
+            (self._prevalidate, "prevalidate"),
+            (self._merge, "merge"),
+            (self._validate, "validate"),
+            (self._curate, "curate"),
+        ]
+        self._errored = False
+        self.model = None
+        self._submodel_snapshots = self.model_provenance = None
+
+        return self._run_steps(steps)
+
+    def rebuild_iter(self):
+        """
+        Like :meth:`build_iter()`, but reworks only the top-level branches changed since the last build.
+
+        Compares the :attr:`_submodel_snapshots` of the last successful build
+        with the current ones of all submodels (ie. after :meth:`replace_submodel()`,
+        or in-place edits if :attr:`digest_submodels`) to find which top-level keys
+        have changed, and then:
+
+        - resolves & prevalidates only the changed submodels,
+        - re-merges only the changed keys into the existing :attr:`model`,
+        - re-validates only the changed keys (if the schema allows it,
+          see :func:`_restrict_schema()`), and
+        - re-runs only the curate-functions affected (see :attr:`_curate_funcs`).
+
+        Falls back to a full :meth:`build_iter()` if the last build had failed,
+        or not all submodels are mappings.
+        """
+        old_snapshots = self._submodel_snapshots
+        new_snapshots = [
+            _submodel_snapshot(mdl, self.digest_submodels)
+            for mdl, _ in self._submodel_tuples
+        ]
+        if (
+            self._errored is not False
+            or old_snapshots is None
+            or not isinstance(self.model, dict)
+            or any(snap is None for snap in new_snapshots)
+        ):
+            return self.build_iter()
+
+        changed = []
+        keys = set()
+        for i, new_snap in enumerate(new_snapshots):
+            old_snap = old_snapshots[i] if i < len(old_snapshots) else {}
+            changed_keys = _changed_branch_keys(old_snap, new_snap)
+            if changed_keys:
+                changed.append(i)
+                keys.update(changed_keys)
+        for old_snap in old_snapshots[len(new_snapshots) :]:
+            keys.update(old_snap)
+        keys = sorted(keys, key=str)
+
+        steps = [
+            (fnt.partial(self._resolve, changed), "resolve"),
+            (fnt.partial(self._prevalidate, changed), "prevalidate"),
+            (fnt.partial(self._merge, keys), "merge"),
+            (fnt.partial(self._validate, keys), "validate"),
+            (fnt.partial(self._curate, keys), "curate"),
+        ]
+        self._errored = False
+
+        return self._run_steps(steps)
 
     def build(self):
         """
@@ -1040,8 +2912,22 @@ class Pandel(object):
 
         return self.model
 
+    def rebuild(self):
+        """Like :meth:`build()`, but exhausting :meth:`rebuild_iter()`."""
+
+        err = next(self.rebuild_iter(), None)
+        if err:
+            raise err
+
+        return self.model
+
     def get(self, path, **kws):
-        resolve_jsonpointer(self.model, path, **kws)
+        """
+        Resolve `path` in the :attr:`model`, reading any lazy branches on the way.
+
+        :param kws: see :func:`resolve_jsonpointer()`
+        """
+        return _materialized(resolve_jsonpointer(self.model, path, **kws))
 
 
 def escape_jsonpointer_part(part):
@@ -1173,24 +3059,165 @@ def resolve_jsonpointer(doc, jsonpointer, default=_scream):
 
     :author: Julian Berman, ankostis
     """
-    for part in iter_jsonpointer_parts(jsonpointer):
-        if isinstance(doc, cabc.Sequence):
-            # Array indexes should be turned into integers
-            try:
-                part = int(part)
-            except ValueError:
-                pass
+    return compile_jsonpointer(jsonpointer).resolve(doc, default)
+
+
+def _resolve_step(doc, part):
+    """One step of :func:`resolve_jsonpointer()`, raising ``TypeError/LookupError`` if unresolvable."""
+    if type(doc) is dict:  # Fast-path, skipping the slow ABC-check below.
+        return doc[part]
+    if isinstance(doc, cabc.Sequence):
+        # Array indexes should be turned into integers
         try:
-            doc = doc[part]
-        except (TypeError, LookupError):
-            if default is _scream:
-                raise RefResolutionError(
-                    "Unresolvable JSON pointer(%r)@(%s)" % (jsonpointer, part)
-                )
-            else:
-                return default
+            part = int(part)
+        except ValueError:
+            pass
+    return doc[part]
 
-    return doc
+
+class JsonPointer(object):
+    """
+    A "compiled" :term:`json-pointer` with its parts split & unescaped once.
+
+    Prefer :func:`compile_jsonpointer()` to construct them, to reuse instances.
+
+    Examples::
+
+        >>> jp = JsonPointer('/a~1b/0')
+        >>> jp.parts
+        ('a/b', '0')
+        >>> jp.resolve({'a/b': [3]})
+        3
+        >>> jp.resolve({}, default=None) is None
+        True
+    """
+
+    __slots__ = ("path", "parts")
+
+    def __init__(self, jsonpointer):
+        self.path = jsonpointer
+        self.parts = tuple(iter_jsonpointer_parts(jsonpointer))
+
+    def resolve(self, doc, default=_scream):
+        """Same as :func:`resolve_jsonpointer()`."""
+        for part in self.parts:
+            try:
+                doc = _resolve_step(doc, part)
+            except (TypeError, LookupError):
+                if default is _scream:
+                    raise RefResolutionError(
+                        "Unresolvable JSON pointer(%r)@(%s)" % (self.path, part)
+                    )
+                else:
+                    return default
+
+        return doc
+
+    def __eq__(self, other):
+        return isinstance(other, JsonPointer) and self.path == other.path
+
+    def __hash__(self):
+        return hash(self.path)
+
+    def __repr__(self):
+        return "%s(%r)" % (type(self).__name__, self.path)
+
+
+@fnt.lru_cache(maxsize=4096)
+def compile_jsonpointer(jsonpointer):
+    """
+    :return: a cached :class:`JsonPointer` for the `jsonpointer` string
+    :raises: RefResolutionError (if not an absolute path)
+    """
+    return JsonPointer(jsonpointer)
+
+
+def _split_escaped_jsonpointer(jsonpointer):
+    """Like :func:`iter_jsonpointer_parts()` but a list with parts NOT unescaped, for tries."""
+    if isinstance(jsonpointer, JsonPointer):
+        return [escape_jsonpointer_part(part) for part in jsonpointer.parts]
+    parts = jsonpointer.split("/")
+    if parts[0] != "":
+        list(iter_jsonpointer_parts(jsonpointer))  # Scream with the same error.
+    del parts[0]
+
+    return parts
+
+
+def _build_jsonpointers_trie(jsonpointers):
+    """
+    :return: the root of a prefix-trie, where nodes are ``[{part: child-node}, [pointer-indices]]``
+             and parts are still escaped
+    """
+    root = [{}, []]
+    for i, jp in enumerate(jsonpointers):
+        node = root
+        for part in _split_escaped_jsonpointer(jp):
+            children = node[0]
+            child = children.get(part)
+            if child is None:
+                child = children[part] = [{}, []]
+            node = child
+        node[1].append(i)
+
+    return root
+
+
+def resolve_jsonpointers(doc, jsonpointers, default=_scream):
+    """
+    Resolve many ``jsonpointers`` within ``doc``, walking each common prefix only once.
+
+    Pointers are merged into a prefix-trie, so resolving i.e. all children of
+    ``/vehicle/engine`` steps into the ``vehicle`` & ``engine`` branches just once.
+
+    :param doc:           the referrant document
+    :param jsonpointers:  a sequence of json-pointer strings or :class:`JsonPointer` instances
+    :param default:       A value to return for paths that do not resolve.
+    :return:              a list with the resolved doc-items, in the order of `jsonpointers`
+    :raises:              RefResolutionError (for the 1st unresolvable path, if no `default`)
+
+    Examples::
+
+        >>> dt = {'a': {'b': 1, 'c': [2, 3]}, 'd': 4}
+        >>> resolve_jsonpointers(dt, ['/a/b', '/a/c/1', '/d', '', '/a/x'], default=None)
+        [1, 3, 4, {'a': {'b': 1, 'c': [2, 3]}, 'd': 4}, None]
+    """
+    jsonpointers = list(jsonpointers)
+    results = [default] * len(jsonpointers)
+    failures = []
+    stack = [(_build_jsonpointers_trie(jsonpointers), doc)]
+    while stack:
+        (children, indices), node_doc = stack.pop()
+        for i in indices:
+            results[i] = node_doc
+        for part, child in children.items():
+            part = unescape_jsonpointer_part(part)
+            try:
+                stack.append((child, _resolve_step(node_doc, part)))
+            except (TypeError, LookupError):
+                if default is _scream:
+                    failures.append((_trie_min_index(child), part))
+
+    if failures:
+        i, part = min(failures)
+        jp = jsonpointers[i]
+        raise RefResolutionError(
+            "Unresolvable JSON pointer(%r)@(%s)"
+            % (jp.path if isinstance(jp, JsonPointer) else jp, part)
+        )
+
+    return results
+
+
+def _trie_min_index(node):
+    indices = []
+    stack = [node]
+    while stack:
+        children, node_indices = stack.pop()
+        indices.extend(node_indices)
+        stack.extend(children.values())
+
+    return min(indices)
 
 
 def resolve_path(doc, path, default=_scream, root=None):
@@ -1275,23 +3302,7 @@ def set_jsonpointer(doc, jsonpointer, value, object_factory=dict):
         if isinstance(doc, cabc.Sequence) and not isinstance(doc, str):
             # Array indexes should be turned into integers
             #
-            doclen = len(doc)
-            if part == "-":
-                part = doclen
-            else:
-                try:
-                    part = int(part)
-                except ValueError:
-                    raise RefResolutionError(
-                        "Expected numeric index(%s) for sequence at (%r)[%i]"
-                        % (part, jsonpointer, i)
-                    )
-                else:
-                    if part > doclen:
-                        raise RefResolutionError(
-                            "Index(%s) out of bounds(%i) of (%r)[%i]"
-                            % (part, doclen, jsonpointer, i)
-                        )
+            part = _sequence_index(doc, part, jsonpointer, i)
         try:
             ndoc = doc[part]
         except (LookupError):
@@ -1332,8 +3343,132 @@ def set_jsonpointer(doc, jsonpointer, value, object_factory=dict):
 #            doc[part] = value
 
 
+def _sequence_index(doc, part, jsonpointer, i):
+    """Convert `part` into an index of `doc` sequence, like :func:`set_jsonpointer()` does."""
+    doclen = len(doc)
+    if part == "-":
+        return doclen
+    try:
+        part = int(part)
+    except ValueError:
+        raise RefResolutionError(
+            "Expected numeric index(%s) for sequence at (%r)[%i]"
+            % (part, jsonpointer, i)
+        )
+    if part > doclen:
+        raise RefResolutionError(
+            "Index(%s) out of bounds(%i) of (%r)[%i]" % (part, doclen, jsonpointer, i)
+        )
+
+    return part
+
+
+_unset = object()
+
+
+def _set_trie_children(doc, children, object_factory, depth, fresh=False):
+    """
+    Write trie `children` into `doc`, creating any missing containers as it goes.
+
+    :param fresh:   when `doc` has just been created, so no lookups are needed
+    :return:        `doc`, or a new container if `doc` was not indexable (ie a string)
+    """
+    for key, (grandchildren, value, jsonpointer) in children.items():
+        is_dash = isinstance(key, tuple)
+        part = key[0] if is_dash else unescape_jsonpointer_part(key)
+        ## In mappings, all ``-`` steps are the same literal key, so look it up.
+        if fresh and not is_dash:
+            ndoc = _unset
+        else:
+            if (
+                type(doc) is not dict  # Fast-path, skipping the slow ABC-check.
+                and isinstance(doc, cabc.Sequence)
+                and not isinstance(doc, str)
+            ):
+                part = _sequence_index(doc, part, jsonpointer, depth)
+
+            try:
+                ndoc = doc[part]
+            except LookupError:
+                ndoc = _unset  # Branch-extension needed.
+            except TypeError:  # Maybe indexing a string...
+                doc = object_factory()
+                ndoc = _unset
+
+        attach = ndoc is _unset or value is not _unset
+        if value is not _unset:
+            ndoc = value
+        if grandchildren:
+            ndoc_fresh = ndoc is _unset
+            if ndoc_fresh:
+                ndoc = object_factory()
+            new_ndoc = _set_trie_children(
+                ndoc, grandchildren, object_factory, depth + 1, ndoc_fresh
+            )
+            attach |= new_ndoc is not ndoc
+            ndoc = new_ndoc
+
+        if attach:
+            try:
+                doc[part] = ndoc
+            # Inserting last sequence-element raises IndexError("list assignment index
+            # out of range")
+            except IndexError:
+                doc.append(ndoc)
+
+    return doc
+
+
+def set_jsonpointers(doc, jsonpointer_values, object_factory=dict):
+    """
+    Set many values with :func:`set_jsonpointer()` semantics, walking each common prefix once.
+
+    The pointers are merged into a prefix-trie, and written *grouped by prefix*
+    in the order they were first met; a pointer is written before those extending it,
+    and missing branches are created while walking the trie.
+    Each ``-`` step appends a new item in sequences, so pointers sharing a ``-``
+    prefix append separate items, as if set one by one; in mappings,
+    ``-`` is a literal key, shared by all those pointers.
+
+    :param doc:                 the referrant document
+    :param jsonpointer_values:  a mapping (or pairs) of json-pointer strings --> values
+    :param object_factory:      the constructor for missing branches
+    :raises:                    RefResolutionError (if a jsonpointer empty, invalid-contet)
+
+    Examples::
+
+        >>> doc = {'a': [1]}
+        >>> set_jsonpointers(doc, {'/a/-': 2, '/a/0': 0, '/b/c/d': 3, '/b/e': 4})
+        >>> doc
+        {'a': [0, 2], 'b': {'c': {'d': 3}, 'e': 4}}
+    """
+    if isinstance(jsonpointer_values, cabc.Mapping):
+        jsonpointer_values = jsonpointer_values.items()
+
+    # Nodes are ``[{escaped-part: child-node}, value, 1st-jsonpointer]``.
+    root = [{}, _unset, None]
+    for i, (jsonpointer, value) in enumerate(jsonpointer_values):
+        parts = _split_escaped_jsonpointer(jsonpointer)
+        if not parts:
+            raise RefResolutionError(
+                "Cannot set the root of the document with JSON pointer(%r)!"
+                % jsonpointer
+            )
+        node = root
+        for part in parts:
+            key = (part, i) if part == "-" else part
+            children = node[0]
+            child = children.get(key)
+            if child is None:
+                child = children[key] = [{}, _unset, jsonpointer]
+            node = child
+        node[1] = value
+
+    _set_trie_children(doc, root[0], object_factory, 0)
+
+
 def build_all_jsonpaths(schema):
-    # Totally quick an dirty, TODO: Use json-validator to build all json-paths.
+    # Totally quick an dirty, see :class:`SchemaIndex` for a complete one.
     forks = ["oneOf", "anyOf", "allOf"]
 
     def _visit(schema, path, paths):
@@ -1356,6 +3491,209 @@ def build_all_jsonpaths(schema):
     return paths
 
 
+SchemaIndexEntry = namedtuple("SchemaIndexEntry", "subschemas defaults types")
+"""
+What a :class:`SchemaIndex` knows for some json-pointer.
+
+:param tuple subschemas: all subschemas applying on that path, ie. from ``allOf`` or ``$ref``
+:param tuple defaults:   the ``default`` values of the `subschemas`, if any
+:param frozenset types:  all ``type`` names of the `subschemas` (empty if unconstrained),
+                         or of the target of a recursive ``$ref``
+"""
+
+
+class SchemaIndex(object):
+    """
+    Maps all json-pointers of a :term:`json-schema` to their subschemas, traversing it once.
+
+    The schema is traversed through ``properties``, ``additionalProperties`` &
+    ``patternProperties``, ``items``/``prefixItems``/``additionalItems``,
+    the ``allOf``/``anyOf``/``oneOf`` forks, and local ``$ref`` (``#/...``),
+    which are expanded once per path, to stop on recursive schemas.
+    Array items and non-explicit properties are indexed under the
+    :attr:`WILDCARD` part, which cannot clash with any (escaped) property-name.
+    Recursive ``$ref`` paths alias their ancestor path,
+    and their entries get the `types` of its target, too.
+
+    - Use ``index[jsonpointer]`` for the :class:`SchemaIndexEntry` of an indexed path
+      (ie. ``/a/*/b``), a dict-lookup.
+    - Use :meth:`match()` for concrete model paths (ie. ``/a/3/b``).
+
+    Examples::
+
+        >>> schema = {
+        ...     'definitions': {'num': {'type': 'number', 'default': 0}},
+        ...     'properties': {
+        ...         'a': {'$ref': '#/definitions/num'},
+        ...         'b': {'type': 'array', 'items': {'properties': {'c': {'type': 'string'}}}},
+        ...     }}
+        >>> sidx = SchemaIndex(schema)
+        >>> sorted(sidx)
+        ['', '/a', '/b', '/b/~*', '/b/~*/c']
+        >>> sidx['/a'].defaults, sorted(sidx['/a'].types)
+        ((0,), ['number'])
+        >>> sidx.match('/b/12/c').types
+        frozenset({'string'})
+        >>> sidx.match('/b/12/d') is None
+        True
+    """
+
+    WILDCARD = "~*"
+    """The part for any item or property; not a valid escaped json-pointer part (``~`` is ``~0``)."""
+
+    def __init__(self, schema):
+        self.schema = schema
+        collected = OrderedDict()
+        self._aliases = {}
+        self._alias_types = {}
+        self._visit(schema, "", {}, collected)
+        self._entries = {
+            path: self._make_entry(subschemas) for path, subschemas in collected.items()
+        }
+        for path, types in self._alias_types.items():
+            entry = self._entries[path]
+            self._entries[path] = entry._replace(types=entry.types | types)
+        self._trie = self._build_trie(self._entries, self._aliases)
+
+    def _resolve_ref(self, ref):
+        if ref.startswith("#"):
+            return resolve_jsonpointer(self.schema, unquote(ref[1:]), default=None)
+
+    def _visit(self, schema, path, refs, collected):
+        """
+        :param refs: ``{ref: (path, index)}`` of the refs expanded by the ancestors,
+                     with the index of the target in the subschemas `collected` for that path
+        """
+        if not isinstance(schema, dict):
+            return  # ie. boolean schemas
+        collected.setdefault(path, []).append(schema)
+
+        ref = schema.get("$ref")
+        if isinstance(ref, str):
+            if ref in refs:
+                ## Recursive schema, link to the ancestor path expanding it.
+                ancestor, i = refs[ref]
+                target_entry = self._make_entry(collected[ancestor][i:])
+                self._aliases[path] = ancestor
+                self._alias_types[path] = target_entry.types
+            else:
+                target = self._resolve_ref(ref)
+                if target is not None:
+                    target_refs = {**refs, ref: (path, len(collected[path]))}
+                    self._visit(target, path, target_refs, collected)
+
+        for fork in ("allOf", "anyOf", "oneOf"):
+            for subschema in schema.get(fork) or ():
+                self._visit(subschema, path, refs, collected)
+
+        wild_path = "%s/%s" % (path, self.WILDCARD)
+        props = schema.get("properties")
+        if isinstance(props, dict):
+            for prop, subschema in props.items():
+                prop_path = "%s/%s" % (path, escape_jsonpointer_part(prop))
+                self._visit(subschema, prop_path, refs, collected)
+        for subschema in (schema.get("patternProperties") or {}).values():
+            self._visit(subschema, wild_path, refs, collected)
+        self._visit(schema.get("additionalProperties"), wild_path, refs, collected)
+
+        items = schema.get("items")
+        prefix_items = schema.get("prefixItems")
+        if isinstance(items, list):
+            prefix_items = items
+        else:
+            self._visit(items, wild_path, refs, collected)
+        for i, subschema in enumerate(prefix_items or ()):
+            self._visit(subschema, "%s/%i" % (path, i), refs, collected)
+        self._visit(schema.get("additionalItems"), wild_path, refs, collected)
+
+    @staticmethod
+    def _make_entry(subschemas):
+        types = set()
+        for subschema in subschemas:
+            typ = subschema.get("type")
+            if typ:
+                types.update([typ] if isinstance(typ, str) else typ)
+
+        return SchemaIndexEntry(
+            tuple(subschemas),
+            tuple(s["default"] for s in subschemas if "default" in s),
+            frozenset(types),
+        )
+
+    @staticmethod
+    def _build_trie(paths, aliases):
+        """
+        :return: nodes ``[{escaped-part: child-node}, path-or-None]``,
+                 where the nodes of recursive `aliases` are replaced by their
+                 ancestor ones, so the trie may contain cycles
+        """
+        root = [{}, None]
+        nodes = {}
+        for path in paths:
+            node = root
+            for part in _split_escaped_jsonpointer(path):
+                node = node[0].setdefault(part, [{}, None])
+            node[1] = path
+            nodes[path] = node
+        for path, ancestor in aliases.items():
+            parent_path, _, part = path.rpartition("/")
+            nodes[parent_path][0][part] = nodes[ancestor]
+
+        return root
+
+    def __getitem__(self, jsonpointer):
+        return self._entries[jsonpointer]
+
+    def __contains__(self, jsonpointer):
+        return jsonpointer in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def match(self, jsonpointer):
+        """
+        Find the entry of a concrete path, preferring explicit parts over :attr:`WILDCARD` ones.
+
+        :return: a :class:`SchemaIndexEntry`, or `None` if the path is not in the schema
+        """
+        entry = self._entries.get(jsonpointer)
+        if entry is not None:
+            return entry
+
+        nodes = [self._trie]
+        for part in _split_escaped_jsonpointer(jsonpointer):
+            nodes = [
+                child
+                for children, _ in nodes
+                for child in (children.get(part), children.get(self.WILDCARD))
+                if child is not None
+            ]
+            if not nodes:
+                return None
+        for _, path in nodes:
+            if path is not None:
+                return self._entries[path]
+
+    def leaf_paths(self):
+        """The paths without children, like :func:`build_all_jsonpaths()` but following also items & refs."""
+        leaves = set()
+        visited = set()
+        stack = [self._trie]
+        while stack:
+            node = stack.pop()
+            if id(node) not in visited:
+                visited.add(id(node))
+                children, path = node
+                if not children:
+                    leaves.add(path)
+                stack.extend(children.values())
+
+        return [path for path in self._entries if path in leaves]
+
+
 _NONE = object()
 """Denotes non-existent json-schema attribute in :class:`JSchema`."""
 
@@ -1446,5 +3784,473 @@ class JSONCodec:
             return o
 
 
+class BinaryJSONCodec:
+
+    """
+    Json coders/decoders storing numpy & pandas data as raw binary buffers.
+
+    Unlike :class:`JSONCodec`, which pickles the whole object, here only
+    arrays with numeric/boolean/datetime dtypes are dumped as raw buffers,
+    along with their ``dtype`` & ``shape``, while containers stay JSON.
+    DataFrames & Series are stored column-by-column, with their index & labels.
+    Any other non-JSON object is pickled, as in :class:`JSONCodec`.
+
+    The buffers are either embedded as *base64* strings, or, when a binary `sidecar`
+    file is given to the coders, appended into it and referred by offset,
+    so the JSON text remains tiny.  Since the coders work with the standard
+    :func:`json.dump()`/:func:`json.load()` hooks, they encode streaming
+    into files, and decode buffers one-by-one, as each node is parsed.
+
+    .. Note::
+        Containers follow JSON semantics (ie. tuples become lists,
+        keys become strings), and pandas extension-dtypes & multi-indices
+        are pickled.
+
+    Example::
+
+        >>> import io, json
+        >>> obj = {'arr': np.arange(6).reshape(2, 3),
+        ...        'df': pd.DataFrame({'a': [1.5, 2.5], 'b': ['x', 'y']}, index=[10, 20])}
+        >>> s = json.dumps(obj, cls=BinaryJSONCodec.Encoder)
+        >>> oo = json.loads(s, cls=BinaryJSONCodec.Decoder)
+        >>> oo['arr']
+        array([[0, 1, 2],
+               [3, 4, 5]])
+        >>> oo['df']
+              a  b
+        10  1.5  x
+        20  2.5  y
+
+    With a sidecar file for the buffers::
+
+        >>> sidecar = io.BytesIO()
+        >>> s = json.dumps(obj, cls=BinaryJSONCodec.Encoder, sidecar=sidecar)
+        >>> oo = json.loads(s, cls=BinaryJSONCodec.Decoder, sidecar=sidecar)
+        >>> oo['df'].equals(obj['df'])
+        True
+    """
+
+    _arr = "$ndarray"
+    _ser = "$series"
+    _df = "$dataframe"
+    _idx = "$index"
+    _rng = "$range"
+
+    #: Sidecar buffers are aligned to this many bytes (ie. for memory-mapping them).
+    _align = 64
+
+    @staticmethod
+    def _is_raw_dtype(dtype):
+        return isinstance(dtype, np.dtype) and dtype.kind in "biufcmM"
+
+    class Encoder(JSONEncoder):
+        """
+        :param sidecar: a binary file-like object to append array-buffers into
+        """
+
+        def __init__(self, *args, sidecar=None, **kws):
+            super().__init__(*args, **kws)
+            self.sidecar = sidecar
+
+        def _encode_buffer(self, arr):
+            codec = BinaryJSONCodec
+            # Unlike `ascontiguousarray()`, keeps 0-d arrays.
+            arr = np.require(arr, requirements="C")
+            node = {"dtype": arr.dtype.str, "shape": list(arr.shape)}
+            buf = arr.reshape(-1).view(np.uint8)  # Datetimes cannot export buffers.
+            sidecar = self.sidecar
+            if sidecar is None:
+                node["b64"] = base64.b64encode(buf).decode("ascii")
+            else:
+                pos = sidecar.tell()
+                pad = -pos % codec._align
+                if pad:
+                    sidecar.write(b"\0" * pad)
+                node["offset"] = pos + pad
+                sidecar.write(buf)
+
+            return {codec._arr: node}
+
+        def _encode_values(self, values):
+            if BinaryJSONCodec._is_raw_dtype(values.dtype):
+                return self._encode_buffer(values)
+            return values.tolist()
+
+        def _encode_index(self, index):
+            codec = BinaryJSONCodec
+            if isinstance(index, pd.RangeIndex):
+                return {
+                    codec._rng: [index.start, index.stop, index.step],
+                    "name": index.name,
+                }
+            return {
+                codec._idx: self._encode_values(index.to_numpy()),
+                "name": index.name,
+            }
+
+        def _is_pickled(self, o):
+            """Pandas with extension-dtypes & multi-indices are pickled."""
+            codec = BinaryJSONCodec
+            dtypes = o.dtypes if isinstance(o, pd.DataFrame) else [o.dtype]
+            indices = [o.index] + ([o.columns] if isinstance(o, pd.DataFrame) else [])
+            return any(not isinstance(dt, np.dtype) for dt in list(dtypes)) or any(
+                isinstance(idx, pd.MultiIndex)
+                or not isinstance(idx.dtype, np.dtype)
+                or (idx.dtype.kind not in "O" and not codec._is_raw_dtype(idx.dtype))
+                for idx in indices
+            )
+
+        def default(self, o):
+            codec = BinaryJSONCodec
+            if isinstance(o, np.ndarray) and codec._is_raw_dtype(o.dtype):
+                return self._encode_buffer(o)
+            if isinstance(o, np.generic) and codec._is_raw_dtype(o.dtype):
+                return self._encode_buffer(np.asarray(o))
+            if isinstance(o, pd.DataFrame) and not self._is_pickled(o):
+                return {
+                    codec._df: [
+                        self._encode_values(o.iloc[:, i].to_numpy())
+                        for i in range(o.shape[1])
+                    ],
+                    "index": self._encode_index(o.index),
+                    "columns": self._encode_index(o.columns),
+                }
+            if isinstance(o, pd.Series) and not self._is_pickled(o):
+                return {
+                    codec._ser: self._encode_values(o.to_numpy()),
+                    "index": self._encode_index(o.index),
+                    "name": o.name,
+                }
+
+            pickle_str = binascii.b2a_qp(pickle.dumps(o)).decode(encoding="utf8")
+            return {JSONCodec._obj: pickle_str, JSONCodec._ver_key: JSONCodec._ver}
+
+    class Decoder(JSONDecoder):
+        """
+        :param sidecar: the binary file-like object (seekable) where the array-buffers were appended
+        """
+
+        def __init__(self, *args, sidecar=None, **kws):
+            kws.setdefault("object_hook", self._decode_node)
+            super().__init__(*args, **kws)
+            self.sidecar = sidecar
+
+        def _decode_buffer(self, node):
+            dtype = np.dtype(node["dtype"])
+            shape = node["shape"]
+            if "b64" in node:
+                buf = bytearray(base64.b64decode(node["b64"]))
+            else:
+                nbytes = dtype.itemsize * int(np.prod(shape, dtype=np.int64))
+                buf = bytearray(nbytes)
+                self.sidecar.seek(node["offset"])
+                if self.sidecar.readinto(buf) != nbytes:
+                    raise ValueError(
+                        "Truncated sidecar-buffer at offset(%s)!" % node["offset"]
+                    )
+            return np.frombuffer(buf, dtype).reshape(shape)
+
+        @staticmethod
+        def _as_values(data):
+            """Lists come from object-dtype values, so keep them so (and 1-D)."""
+            if isinstance(data, list):
+                values = np.empty(len(data), dtype=object)
+                values[:] = data
+                data = values
+            return data
+
+        def _decode_node(self, node):
+            codec = BinaryJSONCodec
+            if codec._arr in node:
+                arr = self._decode_buffer(node[codec._arr])
+                return arr[()] if arr.ndim == 0 else arr
+            if codec._rng in node:
+                return pd.RangeIndex(*node[codec._rng], name=node["name"])
+            if codec._idx in node:
+                return pd.Index(self._as_values(node[codec._idx]), name=node["name"])
+            if codec._ser in node:
+                return pd.Series(
+                    self._as_values(node[codec._ser]),
+                    index=node["index"],
+                    name=node["name"],
+                )
+            if codec._df in node:
+                df = pd.DataFrame(
+                    {
+                        i: self._as_values(data)
+                        for i, data in enumerate(node[codec._df])
+                    },
+                    index=node["index"],
+                )
+                df.columns = node["columns"]
+                return df
+            pickle_str = node.get(JSONCodec._obj)
+            if pickle_str is not None and len(node) == 2:
+                return pickle.loads(binascii.a2b_qp(pickle_str.encode(encoding="utf8")))
+
+            return node
+
+
+MODEL_SKELETON_FNAME = "model.json"
+"""The file in a model-store directory with the JSON skeleton of the model (see :func:`store_model()`)."""
+
+
+class _ModelStorer(object):
+    """Writes the leaves of a model into files, returning its JSON skeleton."""
+
+    def __init__(self, dpath, fmt):
+        if fmt not in ("npy", "parquet"):
+            raise ValueError("Unknown model-store format(%s)!" % fmt)
+        self.dpath = dpath
+        self.fmt = fmt
+        self.fnames = set()
+
+    def leaf_fname(self, path, ext):
+        """Deduce filename from the jsonpointer-path, substituting "strange" chars with underscores."""
+        base = re.sub(r"[^\w.-]", "_", path.strip("/")) or "_root"
+        fname = "%s.%s" % (base, ext)
+        i = 1
+        while fname in self.fnames:
+            fname = "%s.%i.%s" % (base, i, ext)
+            i += 1
+        self.fnames.add(fname)
+
+        return fname
+
+    def save_npy(self, arr, path):
+        fname = self.leaf_fname(path, "npy")
+        np.save(osp.join(self.dpath, fname), arr, allow_pickle=False)
+        return {"$npy": fname}
+
+    def save_pickle(self, obj, path):
+        fname = self.leaf_fname(path, "pkl")
+        with open(osp.join(self.dpath, fname), "wb") as fd:
+            pickle.dump(obj, fd, protocol=4)
+        return {"$pickle": fname}
+
+    def dump_index(self, index, path):
+        if isinstance(index, pd.RangeIndex):
+            return {
+                "$range": [index.start, index.stop, index.step],
+                "name": self.dump(index.name, path + "/name"),
+            }
+        if BinaryJSONCodec._is_raw_dtype(index.dtype):
+            values = self.save_npy(index.to_numpy(), path)
+        else:
+            values = self.dump(index.tolist(), path)
+        return {"$index": values, "name": self.dump(index.name, path + "/name")}
+
+    def _is_storable_pandas(self, obj):
+        dtypes = obj.dtypes if isinstance(obj, pd.DataFrame) else [obj.dtype]
+        indices = [obj.index] + ([obj.columns] if isinstance(obj, pd.DataFrame) else [])
+        return all(BinaryJSONCodec._is_raw_dtype(dt) for dt in dtypes) and all(
+            not isinstance(idx, pd.MultiIndex) and isinstance(idx.dtype, np.dtype)
+            for idx in indices
+        )
+
+    def dump(self, node, path=""):
+        if node is None or isinstance(node, (str, bool, int, float)):
+            return node
+        if isinstance(node, np.generic) and BinaryJSONCodec._is_raw_dtype(node.dtype):
+            return node.item()
+        if isinstance(node, np.ndarray) and BinaryJSONCodec._is_raw_dtype(node.dtype):
+            return self.save_npy(node, path)
+        if isinstance(node, (pd.Series, pd.DataFrame)):
+            if self.fmt == "parquet":
+                fname = self.leaf_fname(path, "parquet")
+                is_series = isinstance(node, pd.Series)
+                df = node.to_frame() if is_series else node
+                df.to_parquet(osp.join(self.dpath, fname))
+                return {"$parquet": fname, "series": is_series}
+            if self._is_storable_pandas(node):
+                index = self.dump_index(node.index, path + "/_index")
+                if isinstance(node, pd.Series):
+                    return {
+                        "$series": self.save_npy(node.to_numpy(), path),
+                        "index": index,
+                        "name": self.dump(node.name, path + "/_name"),
+                    }
+                columns = self.dump_index(node.columns, path + "/_columns")
+                if node.shape[1] and len(set(node.dtypes)) == 1:
+                    data = self.save_npy(node.to_numpy(), path)
+                else:
+                    data = [
+                        self.save_npy(node.iloc[:, i].to_numpy(), "%s/%i" % (path, i))
+                        for i in range(node.shape[1])
+                    ]
+                return {"$frame": data, "index": index, "columns": columns}
+        elif isinstance(node, cabc.Mapping):
+            return {
+                str(k): self.dump(v, "%s/%s" % (path, escape_jsonpointer_part(str(k))))
+                for k, v in _raw_items(node)
+            }
+        elif isinstance(node, (list, tuple)):
+            return [self.dump(v, "%s/%i" % (path, i)) for i, v in enumerate(node)]
+
+        return self.save_pickle(_materialized(node), path)
+
+
+def store_model(model, dpath, fmt="npy"):
+    """
+    Store a model value-tree as a JSON skeleton plus a file for each array-like leaf.
+
+    - Mappings, sequences & JSON scalars go into the :data:`MODEL_SKELETON_FNAME` file,
+      where each leaf is replaced by a tagged object referring to its file,
+      named after its json-pointer path.
+    - numpy-arrays and (the values & indices of) Series/DataFrames with numpy-dtypes
+      are saved as ``.npy`` files, to be memory-mapped by :func:`load_model()`;
+      homogeneous DataFrames go into a single 2-D file, the rest column-by-column.
+    - All other objects (ie. extension-dtypes, multi-indices) are pickled into ``.pkl`` files.
+
+    .. Note::
+        The skeleton follows JSON semantics (ie. tuples become lists,
+        keys become strings).
+
+    :param model:   the value-tree to store; any lazy branches are read
+    :param str dpath:
+            the directory to write into (created if missing);
+            existing leaf-files are overwritten
+    :param str fmt:
+            either ``npy``, or ``parquet`` to store pandas leaves as *parquet*
+            files (need *pyarrow*), which are read (not memory-mapped) when loaded
+    :return:        the path of the skeleton file
+    """
+    os.makedirs(dpath, exist_ok=True)
+    skeleton = _ModelStorer(dpath, fmt).dump(model)
+    fpath = osp.join(dpath, MODEL_SKELETON_FNAME)
+    with open(fpath, "wt") as fd:
+        json.dump(skeleton, fd, indent=1)
+
+    return fpath
+
+
+class _ModelLoader(object):
+    """A json object-hook replacing leaf-tags with (lazy) values read from their files."""
+
+    def __init__(self, dpath, lazy, mmap_mode):
+        self.dpath = dpath
+        self.lazy = lazy
+        self.mmap_mode = mmap_mode
+
+    def read_npy(self, fname):
+        return np.load(osp.join(self.dpath, fname), mmap_mode=self.mmap_mode)
+
+    def read_pickle(self, fname):
+        with open(osp.join(self.dpath, fname), "rb") as fd:
+            return pickle.load(fd)
+
+    def read_parquet(self, fname, is_series):
+        df = pd.read_parquet(osp.join(self.dpath, fname))
+        return df.iloc[:, 0] if is_series else df
+
+    def build_index(self, node):
+        if "$range" in node:
+            return pd.RangeIndex(*node["$range"], name=_materialized(node["name"]))
+        values = _read_lazy_in_lists(_materialized(node["$index"]))
+        return pd.Index(values, name=_materialized(node["name"]))
+
+    def build_series(self, node):
+        return pd.Series(
+            _materialized(node["$series"]),
+            index=self.build_index(node["index"]),
+            name=_materialized(node["name"]),
+            copy=False,
+        )
+
+    def build_frame(self, node):
+        index = self.build_index(node["index"])
+        columns = self.build_index(node["columns"])
+        data = node["$frame"]
+        if isinstance(data, list):
+            df = pd.DataFrame(
+                {i: _materialized(col) for i, col in enumerate(data)}, index=index
+            )
+            df.columns = columns
+        else:
+            df = pd.DataFrame(
+                _materialized(data), index=index, columns=columns, copy=False
+            )
+        return df
+
+    def __call__(self, node):
+        if "$npy" in node:
+            reader, inp = self.read_npy, [node["$npy"]]
+        elif "$pickle" in node:
+            reader, inp = self.read_pickle, [node["$pickle"]]
+        elif "$parquet" in node:
+            reader, inp = self.read_parquet, [node["$parquet"], node["series"]]
+        elif "$series" in node:
+            reader, inp = self.build_series, [node]
+        elif "$frame" in node:
+            reader, inp = self.build_frame, [node]
+        else:
+            return _wrap_if_lazy(node)
+
+        branch = _LazyBranch(reader, "", inp)
+        return branch if self.lazy else branch.read()
+
+
+def _set_lazy_paths(node, path):
+    """
+    Set the json-pointer `path` of the :class:`_LazyBranch` in the mappings of `node`.
+
+    The json object-hooks of :class:`_ModelLoader` build them bottom-up, unaware of their paths.
+    """
+    if isinstance(node, _LazyBranch):
+        node.path = path
+    elif isinstance(node, dict):
+        for key, child in dict.items(node):
+            _set_lazy_paths(child, "%s/%s" % (path, escape_jsonpointer_part(str(key))))
+    elif isinstance(node, list):
+        for i, child in enumerate(node):
+            _set_lazy_paths(child, "%s/%i" % (path, i))
+
+
+def _read_lazy_in_lists(node):
+    """Lazy branches are supported only as mapping-values, so read those in lists."""
+    if isinstance(node, list):
+        for i, item in enumerate(node):
+            node[i] = _read_lazy_in_lists(_materialized(item))
+    elif isinstance(node, dict):
+        for item in dict.values(node):
+            _read_lazy_in_lists(item)
+
+    return node
+
+
+def load_model(dpath, lazy=True, mmap_mode="r"):
+    """
+    Load a model value-tree stored by :func:`store_model()`, reading its leaves on first access.
+
+    Only the small JSON skeleton is parsed, so opening even huge models is instant;
+    array-leaves in mappings are read when accessed (ie. by validation, merging or
+    :meth:`Pandel.get()`, see :meth:`Pandel._resolve()`), and ``.npy`` files are
+    memory-mapped, so only the touched parts are paged in.
+    Leaves inside lists are read while loading.
+
+    :param str dpath:   the directory given to :func:`store_model()`
+    :param bool lazy:   if false, reads all leaves while loading
+    :param mmap_mode:   see :func:`numpy.load()`; use `None` to read leaves in memory
+    :return:            the model, with the mappings containing unread leaves
+                        as (lazy) :class:`dict` subclasses
+
+    Example::
+
+        >>> import tempfile
+        >>> model = {'a': 1, 'arr': np.arange(3), 'sr': pd.Series([1.5, 2.5], name='x')}
+        >>> with tempfile.TemporaryDirectory() as dpath:
+        ...     _ = store_model(model, dpath)
+        ...     m2 = load_model(dpath)
+        ...     print(m2['arr'], m2['sr'].tolist(), m2['a'])
+        [0 1 2] [1.5, 2.5] 1
+    """
+    loader = _ModelLoader(dpath, lazy, mmap_mode)
+    with open(osp.join(dpath, MODEL_SKELETON_FNAME), "rt") as fd:
+        model = json.load(fd, object_hook=loader)
+    _set_lazy_paths(model, "")
+
+    return _read_lazy_in_lists(_materialized(model))
+
+
 if __name__ == "__main__":  # pragma: no cover
     raise NotImplementedError
@@ -760,6 +760,30 @@ API
       _xlrd.XlrdSheet
       _xlrd._open_sheet_by_name_or_index
 
+- Long-running server keeping workbooks "warm":
+
+  .. currentmodule:: pandalone.xleash._server
+  .. autosummary::
+
+      make_server
+      lasso_remote
+
+- Batch-extraction into files, used by ``pandalone xleash extract`` command:
+
+  .. currentmodule:: pandalone.xleash._extract
+  .. autosummary::
+
+      read_manifest
+      extract
+
+- Planning nested :term:`xl-ref` into a dependency-graph:
+
+  .. currentmodule:: pandalone.xleash._plan
+  .. autosummary::
+
+      make_plan
+      LassoPlan
+
 - Plugin related
   .. autosummary::
 
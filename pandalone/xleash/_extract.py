@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2014-2019European Commission (JRC);
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+"""
+Batch-extraction of many :term:`xl-ref` into columnar files, used by ``pandalone xleash extract``.
+
+- The :term:`xl-ref` are read from a *manifest* file, see :func:`read_manifest()`.
+- They are grouped by workbook, and each group is lassoed in a worker-process
+  with its own :class:`SheetsFactory`, so each workbook is opened once.
+- The values of each :term:`xl-ref` are written into ``<out_dir>/<name>.<fmt>``;
+  *npz* files contain either a single ``values`` array, or for dataframes,
+  one ``col_<i>`` array per column, plus ``columns`` & ``index`` arrays
+  (see :func:`_npz_arrays()`); only mixed-type ones need *pickle* to load.
+- A ``.xleash-extract.json`` state-file in `out_dir` remembers the workbook
+  stamps (modification-time & size) of the last run, so :term:`xl-ref`
+  from unchanged workbooks are skipped.
+
+.. currentmodule:: pandalone.xleash
+"""
+
+from collections import namedtuple
+import concurrent.futures as cfut
+import csv
+import json
+import logging
+import os
+import os.path as osp
+import re
+import time
+
+from urllib.parse import urldefrag, urlparse
+
+import numpy as np
+
+from .. import utils
+from ._pack import pack_values
+
+
+log = logging.getLogger(__name__)
+
+STATE_FNAME = ".xleash-extract.json"
+"""The file in the output-dir where stamps of the last run are stored."""
+
+FORMATS = ("npz", "parquet", "feather")
+"""The supported output file-formats; the last 2 need *pandas* & *pyarrow*."""
+
+ExtractResult = namedtuple(
+    "ExtractResult", ("name", "xlref", "status", "elapsed", "out_file", "error")
+)
+"""
+The outcome of extracting one :term:`xl-ref`.
+
+:param str status: one of ``ok``, ``skipped``, ``failed``
+:param float elapsed: seconds spent lassoing & writing
+"""
+
+
+def _sanitize_name(name):
+    """
+    Examples::
+
+        >>> _sanitize_name('a/b c#1.x')
+        'a_b_c_1.x'
+    """
+    return re.sub(r"[^\w.-]", "_", name)
+
+
+def read_manifest(fpath):
+    """
+    Read ``(name, xl-ref)`` pairs from a CSV or YAML manifest-file.
+
+    - *CSV* files must have an ``xlref`` header-column, and optionally a
+      ``name`` one.
+    - *YAML* files (need *pyyaml*) may contain either a list of :term:`xl-ref`
+      strings, or a mapping of names to :term:`xl-ref`.
+
+    Missing names become ``ref<i>``.
+
+    :return: a list of ``(name, xlref)`` pairs
+    """
+    if fpath.lower().endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError as ex:
+            raise ValueError(
+                "Reading YAML manifest(%s) needs `pyyaml` installed!" % fpath
+            ) from ex
+        with open(fpath, "rt", encoding="utf-8") as fd:
+            content = yaml.safe_load(fd) or []
+        if isinstance(content, dict):
+            pairs = list(content.items())
+        elif isinstance(content, list):
+            pairs = [(None, xlref) for xlref in content]
+        else:
+            raise ValueError("Expected a list or mapping in manifest(%s)!" % fpath)
+    else:
+        with open(fpath, "rt", encoding="utf-8", newline="") as fd:
+            rows = list(csv.DictReader(fd))
+        if rows and "xlref" not in rows[0]:
+            raise ValueError("No `xlref` column in CSV manifest(%s)!" % fpath)
+        pairs = [(row.get("name"), row["xlref"]) for row in rows]
+
+    refs = []
+    for i, (name, xlref) in enumerate(pairs):
+        if not isinstance(xlref, str) or not xlref.strip():
+            raise ValueError("Invalid xl-ref(%r) in manifest(%s)!" % (xlref, fpath))
+        refs.append((_sanitize_name(str(name) if name else "ref%i" % i), xlref))
+
+    names = [n for n, _ in refs]
+    dupes = sorted(set(n for n in names if names.count(n) > 1))
+    if dupes:
+        raise ValueError("Duplicate names %s in manifest(%s)!" % (dupes, fpath))
+
+    return refs
+
+
+def _book_stamp(url_file):
+    """Return ``[mtime_ns, size]`` of a local workbook, or `None`."""
+    if url_file:
+        parts = urlparse(utils.path2url(url_file))
+        if parts.scheme == "file":
+            try:
+                st = os.stat(utils.urlpath2path(parts.path))
+            except OSError:
+                return None
+            return [st.st_mtime_ns, st.st_size]
+
+
+def _npz_arrays(values):
+    """
+    Pack `values` into the arrays of a :func:`numpy.savez()` archive (see :func:`pack_values()`).
+
+    :return: a dict with a single ``values`` array, or for dataframes,
+             ``columns`` & ``index`` arrays plus a ``col_<i>`` array per column
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+
+    if pd is not None and isinstance(values, pd.DataFrame):
+        arrays = {
+            "columns": pack_values([str(c) for c in values.columns]),
+            "index": pack_values(values.index.to_numpy()),
+        }
+        for i in range(values.shape[1]):
+            arrays["col_%i" % i] = pack_values(values.iloc[:, i].to_numpy())
+    else:
+        arrays = {"values": pack_values(values)}
+
+    return arrays
+
+
+def _write_values(values, fpath, fmt):
+    if fmt == "npz":
+        np.savez(fpath, **_npz_arrays(values))
+    else:
+        import pandas as pd
+
+        df = values if isinstance(values, pd.DataFrame) else pd.DataFrame(values)
+        if fmt == "feather":
+            df = df.reset_index()  # Feather stores no index, so keep it as a column.
+        df.columns = [str(c) for c in df.columns]
+        if fmt == "parquet":
+            df.to_parquet(fpath)
+        else:
+            df.to_feather(fpath)
+
+
+def _extract_book_refs(refs, out_dir, fmt):
+    """Worker lassoing all `refs` of a single workbook with a common :class:`SheetsFactory`."""
+    from ._lasso import make_default_Ranger
+
+    results = []
+    ranger = make_default_Ranger(lean=True)
+    try:
+        for name, xlref in refs:
+            out_file = osp.join(out_dir, "%s.%s" % (name, fmt))
+            start = time.perf_counter()
+            try:
+                values = ranger.do_lasso(xlref).values
+                _write_values(values, out_file, fmt)
+                status, error = "ok", None
+            except Exception as ex:
+                log.debug("Extracting xl-ref(%r) failed: %s", xlref, ex, exc_info=1)
+                status, error, out_file = "failed", str(ex), None
+            elapsed = time.perf_counter() - start
+            results.append(ExtractResult(name, xlref, status, elapsed, out_file, error))
+    finally:
+        ranger.sheets_factory.close()
+
+    return results
+
+
+def _load_state(out_dir):
+    try:
+        with open(osp.join(out_dir, STATE_FNAME), "rt") as fd:
+            return json.load(fd)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_state(out_dir, state):
+    with open(osp.join(out_dir, STATE_FNAME), "wt") as fd:
+        json.dump(state, fd, indent=2, sort_keys=True)
+
+
+def extract(refs, out_dir, fmt="npz", jobs=None, force=False):
+    """
+    Lasso `refs` grouped by workbook in a process-pool, writing each into a file.
+
+    :param list refs:
+            ``(name, xlref)`` pairs, i.e. from :func:`read_manifest()`;
+            :term:`xl-ref` must contain a workbook, since no context is given.
+    :param str out_dir:
+            where to write the files (created if missing)
+    :param str fmt:
+            one of :data:`FORMATS`
+    :param int or None jobs:
+            number of worker-processes; if 0 or 1, runs in this process,
+            if `None`, as many as CPUs
+    :param bool force:
+            extract also :term:`xl-ref` from workbooks unchanged since last run
+    :return:
+            a list of :class:`ExtractResult` in the order of `refs`
+    """
+    if fmt not in FORMATS:
+        raise ValueError("Unknown format(%s), must be one of %s!" % (fmt, FORMATS))
+    utils.ensure_dir_exists(out_dir)
+
+    state = {} if force else _load_state(out_dir)
+    new_state = {}
+    results = {}
+    groups = {}
+    for name, xlref in refs:
+        url_file = urldefrag(xlref)[0] or None
+        stamp = _book_stamp(url_file)
+        prev = state.get(name)
+        out_file = osp.join(out_dir, "%s.%s" % (name, fmt))
+        if (
+            stamp
+            and prev
+            and prev["xlref"] == xlref
+            and prev["stamp"] == stamp
+            and osp.isfile(out_file)
+        ):
+            results[name] = ExtractResult(name, xlref, "skipped", 0.0, out_file, None)
+            new_state[name] = prev
+        else:
+            groups.setdefault(url_file, []).append((name, xlref))
+        if stamp:
+            new_state.setdefault(name, {"xlref": xlref, "stamp": stamp})
+
+    if jobs is not None and jobs <= 1:
+        for grp in groups.values():
+            for res in _extract_book_refs(grp, out_dir, fmt):
+                results[res.name] = res
+    elif groups:
+        with cfut.ProcessPoolExecutor(jobs) as pool:
+            futures = [
+                pool.submit(_extract_book_refs, grp, out_dir, fmt)
+                for grp in groups.values()
+            ]
+            for fut in cfut.as_completed(futures):
+                for res in fut.result():
+                    results[res.name] = res
+
+    for name, res in results.items():
+        if res.status == "failed":
+            new_state.pop(name, None)
+    _save_state(out_dir, new_state)
+
+    return [results[name] for name, _ in refs]
+
+
+def format_results(results):
+    """Report a line with the timing & status of each :class:`ExtractResult`."""
+    lines = []
+    for res in results:
+        line = "%8.3fs %-8s %s: %s" % (res.elapsed, res.status, res.name, res.xlref)
+        if res.error:
+            line += "\n    %s" % res.error
+        lines.append(line)
+    return "\n".join(lines)
@@ -204,6 +204,40 @@ processed ones were `None`.
 """
 
 
+def _is_block(elval, pd):
+    """Whether `elval` is a numpy-array or a pandas-series, for `vectorized` element-funcs."""
+    return isinstance(elval, np.ndarray) or (
+        pd is not None and isinstance(elval, pd.Series)
+    )
+
+
+def _visitable_cells_mask(arr, element_types):
+    """
+    Mark cells of an object-array that are `element_types` or dive-able containers.
+
+    Examples::
+
+        >>> arr = np.array([1, 'a', None, [1], {}, 2.2], dtype=object)
+        >>> _visitable_cells_mask(arr, (str, ))
+        array([False,  True, False,  True,  True, False])
+    """
+    types = tuple(element_types) + (list, dict)
+    is_visitable = np.frompyfunc(
+        lambda v: isinstance(v, types) or hasattr(v, "items"), 1, 1
+    )
+    return is_visitable(arr).astype(bool)
+
+
+def _included_mask(index, include, exclude):
+    """Vectorized equivalent of `is_included()` in :func:`run_filter_elementwise()`."""
+    mask = np.ones(len(index), dtype=bool)
+    if include:
+        mask &= index.isin(include)
+    if exclude:
+        mask &= ~index.isin(exclude)
+    return mask
+
+
 def run_filter_elementwise(
     ranger,
     lasso,
@@ -253,6 +287,18 @@ def run_filter_elementwise(
 
             Its `kwds` may contain the `include`, `exclude` and `depth` args.
             Any exception raised from `element_func` will cancel the diving.
+
+            To speed up diving into big pandas/numpy values, the function
+            may declare these attributes:
+
+            - ``vectorized = True``: it is invoked first with whole
+              numpy-arrays or pandas-series (i.e. dataframe columns) as
+              `elval`, with `context.base_coords` pointing to their 1st cell;
+              if it does not process them, diving continues element-wise.
+            - ``element_types = (str, ...)``: it processes only elements of
+              these types, so that the runner locates them in object
+              pandas-series with numpy, skips non-object (numeric) series
+              altogether, and computes their `base_coords` arithmetically.
     :param list filters:
             Any :term:`filters` to apply after invoking the `element_func`.
     :param list or str include:
@@ -271,6 +317,13 @@ def run_filter_elementwise(
     """
     include = include and as_list(include)
     exclude = exclude and as_list(exclude)
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+    is_vectorized = getattr(element_func, "vectorized", False)
+    element_types = getattr(element_func, "element_types", None)
+    location = XLocation(lasso.sheet, lasso.st, lasso.nd, None)
 
     def is_included(elval, key, cdepth):
         ok = True
@@ -282,9 +335,7 @@ def run_filter_elementwise(
     def upd_base_coords(elval, cdepth, base_coords, i):
         if base_coords and not isinstance(elval, dict):
             row, col = base_coords
-            try:
-                import pandas as pd
-            except ImportError:
+            if pd is None:
                 if cdepth == 0:
                     row += i
                 elif cdepth == 1:
@@ -298,9 +349,7 @@ def run_filter_elementwise(
             return row, col
 
     def call_element_func(elval, cdepth, base_coords):
-        context_kwds = dtz.keyfilter(lambda k: k in XLocation._fields, lasso._asdict())
-        context_kwds["base_coords"] = base_coords
-        context = XLocation(**context_kwds)
+        context = location._replace(base_coords=base_coords)
         try:
             proced, res_lasso = element_func(
                 ranger, lasso, context, elval, *args, **kwds
@@ -328,8 +377,39 @@ def run_filter_elementwise(
 
         return elval
 
+    def dive_series(elval, cdepth, base_coords):
+        """Visit only cells of a Series that `element_func` may process."""
+        if elval.dtype.kind != "O":
+            return elval  # Numeric/datetime cells are never visited.
+
+        mask = _visitable_cells_mask(elval.values, element_types)
+        if cdepth == 0 and (include or exclude):
+            mask &= _included_mask(elval.index, include, exclude)
+        visit_idxs = mask.nonzero()[0]
+        if not visit_idxs.size:
+            return elval
+
+        new_values = elval.to_numpy(dtype=object, copy=True)
+        for i in visit_idxs:
+            nbc = base_coords and (base_coords[0] + i, base_coords[1])
+            new_values[i] = dive_indexed(new_values[i], cdepth + 1, nbc)
+
+        return pd.Series(new_values, index=elval.index, name=elval.name)
+
     def dive_indexed(elval, cdepth, base_coords):
         if cdepth != depth:
+            if is_vectorized and _is_block(elval, pd):
+                proced, new_elval = call_element_func(elval, cdepth, base_coords)
+                if proced:
+                    return new_elval
+            if (
+                element_types
+                and pd is not None
+                and isinstance(elval, pd.Series)
+                and cdepth + 1 != depth
+            ):
+                return dive_series(elval, cdepth, base_coords)
+
             dived = False
             try:
                 items = elval.items()
@@ -370,6 +450,9 @@ def _recurse_element_func(ranger, lasso, context, elval):
     return proced, lasso
 
 
+_recurse_element_func.element_types = (str,)
+
+
 def recursive_filter(ranger, lasso, filters=(), include=None, exclude=None, depth=-1):
     """
     A :term:`element-wise-filter` that expand recursively any :term:`xl-ref` strings elements in :term:`capture-rect` values.
@@ -437,6 +520,9 @@ def _pyeval_element_func(ranger, lasso, context, elval, eval_all):
     return proced, lasso
 
 
+_pyeval_element_func.element_types = (str,)
+
+
 def pyeval_filter(
     ranger, lasso, filters=(), eval_all=False, include=None, exclude=None, depth=-1
 ):
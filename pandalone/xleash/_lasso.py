@@ -14,6 +14,7 @@ Prefer accessing the public members from the parent module.
 """
 
 from copy import deepcopy
+import functools as fnt
 import inspect
 import logging
 import textwrap
@@ -44,6 +45,17 @@ def _Lasso_to_edges_str(lasso):
     return s + exp
 
 
+@fnt.lru_cache(maxsize=4096)
+def _parse_xlref_fields(xlref):
+    """
+    Parse `xlref` and keep only its non `None` fields, for :attr:`Ranger.lean` mode.
+
+    :return: the cached (shared) dict, NEVER modify it
+    """
+    parsed_fields = _parse.parse_xlref(xlref)
+    return dtz.valfilter(lambda v: v is not None, parsed_fields)
+
+
 class Ranger(object):
     """
     The director-class that performs all stages required for "throwing the lasso" around rect-values.
@@ -72,10 +84,23 @@ class Ranger(object):
     :ivar Lasso intermediate_lasso:
             A ``('stage', Lasso)`` pair with the last :class:`Lasso` instance
             produced during the last execution of the :meth:`do_lasso()`.
-            Used for inspecting/debuging.
+            Used for inspecting/debuging; always `None` when :attr:`lean`.
+    :ivar bool lean:
+            When true, :meth:`do_lasso()` runs in a low-overhead "fast-path":
+
+            - :attr:`base_opts` are not deep-copied but shared copy-on-write
+              (writes land on a new top-map of the :class:`ChainMap`), so
+              any nested containers in them must be treated as immutable;
+            - no :attr:`intermediate_lasso` bookkeeping happens;
+            - the parsed fields of each :term:`xl-ref` are cached and reused
+              (in a process-wide LRU-cache, see :func:`_parse_xlref_fields()`).
+
+            Use it when throwing lots of small lassos.
     """
 
-    def __init__(self, sheets_factory, base_opts=None, available_filters=None):
+    def __init__(
+        self, sheets_factory, base_opts=None, available_filters=None, lean=False
+    ):
         if not sheets_factory:
             raise ValueError("Please specify a non-null sheets-factory!")
         self.sheets_factory = sheets_factory
@@ -86,11 +111,14 @@ class Ranger(object):
             installed_filters if available_filters is None else available_filters
         )
         self.intermediate_lasso = None
+        self.lean = lean
 
     def _relasso(self, lasso, stage, **kwds):
-        """Replace lasso-values and updated :attr:`intermediate_lasso`."""
-        lasso = lasso._replace(**kwds)
-        self.intermediate_lasso = (stage, lasso)
+        """Replace lasso-values and updated :attr:`intermediate_lasso` (unless :attr:`lean`)."""
+        if kwds:
+            lasso = lasso._replace(**kwds)
+        if not self.lean:
+            self.intermediate_lasso = (stage, lasso)
 
         return lasso
 
@@ -113,6 +141,9 @@ class Ranger(object):
         lasso = self._relasso(lasso, func_name)
 
         verbose = lasso.opts.get("verbose", False)
+        if "lax" in kwds:
+            # Don't mutate `kwds`, they may belong to a cached call-spec.
+            kwds = kwds.copy()
         lax = kwds.pop("lax", lasso.opts.get("lax", False))
         func, func_desc = "", ""
         try:
@@ -142,6 +173,19 @@ class Ranger(object):
 
         return init_lasso
 
+    def _parse_xlref_cached(self, xlref):
+        """
+        Parses `xlref` once and reuses the non-null fields, for :attr:`lean` mode.
+
+        :return: a new dict with any non `None` parsed-fields; the `opts`
+                 dict is also copied, to be mutated freely by filters.
+        """
+        filled_fields = _parse_xlref_fields(xlref).copy()
+        if "opts" in filled_fields:
+            filled_fields["opts"] = filled_fields["opts"].copy()
+
+        return filled_fields
+
     def _parse_and_merge_with_context(self, xlref, init_lasso):
         """
         Merges xl-ref parsed-parsed_fields with `init_lasso`, reporting any errors.
@@ -154,8 +198,11 @@ class Ranger(object):
         assert isinstance(init_lasso.opts, ChainMap), init_lasso
 
         try:
-            parsed_fields = _parse.parse_xlref(xlref)
-            filled_fields = dtz.valfilter(lambda v: v is not None, parsed_fields)
+            if self.lean:
+                filled_fields = self._parse_xlref_cached(xlref)
+            else:
+                parsed_fields = _parse.parse_xlref(xlref)
+                filled_fields = dtz.valfilter(lambda v: v is not None, parsed_fields)
             init_lasso = init_lasso._replace(**filled_fields)
         except SyntaxError:
             raise
@@ -198,6 +245,36 @@ class Ranger(object):
             raise ValueError(msg % (_Lasso_to_edges_str(lasso), ex))
         return st, nd
 
+    def _capture_values(self, lasso, sheet):
+        """
+        Resolve the :term:`capture-rect` and read its values.
+
+        If the :attr:`sheets_factory` tracks changes (see :class:`SheetsFactory`),
+        reuses any previous capture over the same sheet-cells, if unchanged.
+
+        :return: a ``(st, nd, values)`` tuple
+        """
+        sf = self.sheets_factory
+        capture_key = (
+            lasso.st_edge,
+            lasso.nd_edge,
+            lasso.exp_moves,
+            lasso.base_coords,
+            bool(lasso.opts.get("no_empty", False)),
+        )
+        capture = getattr(sf, "track_changes", False) and sf.lookup_capture(
+            sheet, capture_key
+        )
+        if capture:
+            return capture
+
+        st, nd = self._resolve_capture_rect(lasso, sheet)
+        values = sheet.read_rect(st, nd) if st or nd else []
+        if getattr(sf, "track_changes", False):
+            sf.store_capture(sheet, capture_key, st, nd, values)
+
+        return st, nd, values
+
     def _run_filters(self, lasso):
         if lasso.call_spec:
             try:
@@ -231,6 +308,8 @@ class Ranger(object):
         if not isinstance(xlref, str):
             raise ValueError("Expected a string as `xl-ref`: %s" % xlref)
         self.intermediate_lasso = None
+        if self.lean:
+            return self._do_lasso_lean(xlref, context_kwds)
 
         lasso = self._make_init_Lasso(**context_kwds)
         lasso = self._relasso(lasso, "context")
@@ -241,13 +320,8 @@ class Ranger(object):
         sheet = self._open_sheet(lasso)
         lasso = self._relasso(lasso, "open", sheet=sheet)
 
-        st, nd = self._resolve_capture_rect(lasso, sheet)
+        st, nd, values = self._capture_values(lasso, sheet)
         lasso = self._relasso(lasso, "capture", st=st, nd=nd)
-
-        if st or nd:
-            values = sheet.read_rect(st, nd)
-        else:
-            values = []
         lasso = self._relasso(lasso, "read_rect", values=values)
 
         lasso = self._run_filters(lasso)
@@ -255,6 +329,19 @@ class Ranger(object):
 
         return lasso
 
+    def _do_lasso_lean(self, xlref, context_kwds):
+        """The :attr:`lean` variant of :meth:`do_lasso()`, same stages, less copies."""
+        context_kwds["opts"] = ChainMap({}, self.base_opts)
+        lasso = Lasso(**context_kwds)
+        lasso = self._parse_and_merge_with_context(xlref, lasso)
+
+        sheet = self._open_sheet(lasso)
+        lasso = lasso._replace(sheet=sheet)
+        st, nd, values = self._capture_values(lasso, sheet)
+        lasso = lasso._replace(st=st, nd=nd, values=values)
+
+        return self._run_filters(lasso)
+
 
 def get_default_opts(overrides=None):
     """
@@ -271,7 +358,9 @@ def get_default_opts(overrides=None):
     return opts
 
 
-def make_default_Ranger(sheets_factory=None, base_opts=None, available_filters=None):
+def make_default_Ranger(
+    sheets_factory=None, base_opts=None, available_filters=None, lean=False
+):
     """
     Makes a defaulted :class:`Ranger`.
 
@@ -295,6 +384,9 @@ def make_default_Ranger(sheets_factory=None, base_opts=None, available_filters=N
     :type available_filters:
             dict or None
 
+    :param bool lean:
+            Whether to run the low-overhead :attr:`Ranger.lean` mode.
+
 
     For instance, to make you own sheets-factory and override options,
     yoummay do this::
@@ -310,6 +402,7 @@ def make_default_Ranger(sheets_factory=None, base_opts=None, available_filters=N
         sheets_factory or backend.SheetsFactory(),
         base_opts or get_default_opts(),
         available_filters,
+        lean,
     )
 
 
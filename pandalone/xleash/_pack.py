@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2014-2019European Commission (JRC);
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+"""
+Packs lassoed values into arrays storable losslessly with :func:`numpy.savez()`.
+
+- Scalars, rect-lists & ndarrays whose elements are all of the same native
+  type (bool, int, float or str) become native arrays.
+- Anything else (i.e. mixed rects, dataframes, dicts) is wrapped as-is
+  in a 0-dim object-array, that needs *pickle* to be stored & loaded.
+
+Prefer accessing the public members from the parent module.
+
+.. currentmodule:: pandalone.xleash
+"""
+
+import numpy as np
+
+
+_NATIVE_TYPES = (bool, int, float, str)
+"""The python types of elements convertible losslessly into native arrays."""
+
+
+def _collect_leaf_types(values, types):
+    for v in values:
+        if isinstance(v, (list, tuple)):
+            _collect_leaf_types(v, types)
+        else:
+            types.add(type(v))
+
+    return types
+
+
+def _as_native_array(values):
+    """:return: a native array if `values` are all of a single native type, `None` otherwise"""
+    if isinstance(values, np.ndarray):
+        types = set(type(v) for v in values.flat)
+        values = values.tolist()
+    elif isinstance(values, (list, tuple)):
+        types = _collect_leaf_types(values, set())
+    else:
+        types = {type(values)}
+
+    if len(types) == 1 and types.pop() in _NATIVE_TYPES:
+        try:
+            arr = np.asarray(values)
+        except ValueError:
+            return None  # Ragged.
+        if arr.dtype.kind != "O":
+            return arr
+
+
+def is_object_array(arr):
+    """:return: true if `arr` needs *pickle* to be stored & loaded"""
+    return arr.dtype.hasobject
+
+
+def pack_values(values):
+    """
+    Convert lassoed `values` into an array storable with :func:`numpy.savez()`.
+
+    Examples::
+
+        >>> pack_values([[1, 2], [3, 4]])
+        array([[1, 2],
+               [3, 4]])
+        >>> pack_values(4)
+        array(4)
+
+    Mixed values are not coerced into a common native dtype, but wrapped as-is::
+
+        >>> pack_values([['a', 1.5], ['b', 2]])
+        array(list([['a', 1.5], ['b', 2]]), dtype=object)
+        >>> unpack_values(pack_values([[1, True]]))
+        [[1, True]]
+        >>> pack_values({'a': 1})
+        array({'a': 1}, dtype=object)
+    """
+    if isinstance(values, np.ndarray) and not values.dtype.hasobject:
+        return values
+
+    arr = _as_native_array(values)
+    if arr is None:
+        arr = np.empty((), dtype=object)
+        arr[()] = values
+
+    return arr
+
+
+def read_object_array(npz, key):
+    """Read the `key` object-array (unpickling it) from an `npz` archive loaded with ``allow_pickle=False``."""
+    with npz.zip.open(key + ".npy") as fd:
+        return np.lib.format.read_array(fd, allow_pickle=True)
+
+
+def unpack_values(arr):
+    """The inverse of :func:`pack_values()`, 0-dim arrays become scalars."""
+    return arr.item() if arr.ndim == 0 else arr
@@ -0,0 +1,419 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2014-2019European Commission (JRC);
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+"""
+A planner of nested :term:`xl-ref` into a dependency-graph, to lasso them level by level.
+
+Workbooks may chain :term:`xl-ref` across sheets and files, to be expanded
+on demand by the ``recurse`` :term:`filter`.  The :class:`LassoPlan`
+instead scans statically the captured values of each :term:`xl-ref`
+(without running any :term:`filters`) for strings parsing as :term:`xl-ref`,
+and builds a DAG of ``(workbook, sheet, xl-ref)`` nodes:
+
+- During scanning, all workbooks are opened once, through the
+  :class:`SheetsFactory` of the :class:`Ranger`.
+- :meth:`LassoPlan.run()` filters the values captured while scanning,
+  node by node, level by level (leafs first), and the ``recurse`` filter
+  of the upper levels reuses the results of the lower ones,
+  instead of lassoing them again.
+  They run serially, in-memory, since neither :class:`Ranger`
+  nor :class:`SheetsFactory` are thread-safe, and the sheets of the captures
+  cannot be shipped to other processes (filtering is CPU-bound anyway).
+- The graph can be exported with :meth:`LassoPlan.to_dict()`
+  and :meth:`LassoPlan.to_dot()`, to inspect its fan-out & cost.
+
+The scan over-approximates: strings are searched only in the values of
+:term:`xl-ref` having a ``recurse`` filter somewhere in their
+:term:`call-spec`, but regardless of any `include`/`exclude`/`depth` args;
+and relative :term:`xl-ref` (with ``.`` coordinates, ie. ``R.C3``) are assumed
+to be based where ``recurse`` would base them on raw captured values.
+Any nodes not matching the actual ``recurse`` invocations are simply lassoed
+again, as usual.
+
+The nodes are keyed by the ids of their opened sheets (see :func:`_node_key()`),
+so the same workbook & sheet is keyed alike, whether given explicitly
+or inherited from the context of a nested :term:`xl-ref`.
+
+Example::
+
+    >>> from pandalone import xleash
+    >>> from pandalone.xleash import _plan
+    >>> sheet = xleash.ArraySheet([['#C1:D1', 'b', 'c', 'd']])
+    >>> plan = _plan.make_plan(['#A1:B1:"recurse"'], sheet=sheet)
+    >>> plan.levels()
+    [[('wb', 'sh', 'C1:D1', None)], [('wb', 'sh', 'A1:B1:"recurse"', None)]]
+    >>> plan.run()
+    [[[[['c', 'd']], 'b']]]
+    >>> plan.to_dict()['edges']
+    [[0, 1]]
+
+.. currentmodule:: pandalone.xleash
+"""
+
+from collections import namedtuple
+from copy import deepcopy
+import logging
+import time
+
+from urllib.parse import urldefrag
+
+from . import _lasso, _parse
+
+log = logging.getLogger(__name__)
+
+PlanNode = namedtuple(
+    "PlanNode", ("key", "xlref", "context", "sheet", "st", "nd", "deps", "lasso")
+)
+"""
+A node of the :class:`LassoPlan` graph.
+
+:param tuple key:
+        ``(workbook, sheet-name, xl-ref-fragment, base_coords)``,
+        see :func:`_node_key()`
+:param dict context:
+        the :class:`Lasso` kwds to invoke :meth:`Ranger.do_lasso()` with
+:param sheet, st, nd:
+        the :class:`ABCSheet` and the :term:`capture-rect` found when scanning
+:param list deps:
+        the keys of the nodes found in the captured values
+:param Lasso lasso:
+        parsed, opened & captured when scanning, for :meth:`LassoPlan.run()`
+        to run just its :term:`filters`
+"""
+
+
+class _CyclicXlrefError(ValueError):
+    pass
+
+
+def _is_base_relative(lasso):
+    """Whether any edge of the `lasso` has ``.`` coordinates, resolved against its `base_coords`."""
+    return any(
+        edge and "." in (edge.land.row, edge.land.col)
+        for edge in (lasso.st_edge, lasso.nd_edge)
+    )
+
+
+def _node_key(xlref, lasso):
+    """
+    :param Lasso lasso:
+            parsed from `xlref` & merged with its context, with its sheet opened;
+            the ids of that sheet normalize the workbook & sheet of the key
+    :return: ``(workbook, sheet-name, xl-ref-fragment, base_coords)``,
+             where `base_coords` is `None` unless xl-ref has ``.`` coordinates
+    """
+    frag = urldefrag(xlref)[1]
+    if "!" in frag:
+        frag = frag.split("!", 1)[1]
+    book, sh_ids = lasso.sheet.get_sheet_ids()
+    base_coords = lasso.base_coords if _is_base_relative(lasso) else None
+    base_coords = base_coords and tuple(base_coords)
+
+    return (book, sh_ids[0], frag, base_coords)
+
+
+def _open_node(ranger, xlref, context_kwds):
+    """
+    Parse `xlref` and open its sheet, as :meth:`Ranger.do_lasso()` does (without capturing).
+
+    :return: the lasso with its `sheet`, and its node-key (see :func:`_node_key()`)
+    """
+    lasso = ranger._make_init_Lasso(**context_kwds)
+    lasso = ranger._parse_and_merge_with_context(xlref, lasso)
+    lasso = lasso._replace(sheet=ranger._open_sheet(lasso))
+
+    return lasso, _node_key(xlref, lasso)
+
+
+def _mentions_recurse(call_spec):
+    """Whether the string ``recurse`` is found anywhere in a :term:`call-spec`."""
+    if isinstance(call_spec, str):
+        return call_spec == "recurse"
+    if isinstance(call_spec, dict):
+        call_spec = call_spec.values()
+    if isinstance(call_spec, (list, tuple, type({}.values()))):
+        return any(_mentions_recurse(i) for i in call_spec)
+    return False
+
+
+def _iter_str_cells(values, st):
+    """
+    Yield ``(base_coords, str)`` for string-cells of raw captured `values`.
+
+    The `base_coords` are those :func:`run_filter_elementwise()` passes
+    for nested lists, ie. the cell's coordinates only when *pandas* is missing.
+    """
+    try:
+        import pandas  # noqa: F401
+
+        def cell_coords(i, j):
+            return tuple(st)
+
+    except ImportError:
+
+        def cell_coords(i, j):
+            return (st[0] + i, st[1] + j)
+
+    if isinstance(values, str):
+        yield tuple(st), values
+    elif isinstance(values, list):
+        for i, row in enumerate(values):
+            if isinstance(row, list):
+                for j, v in enumerate(row):
+                    if isinstance(v, str):
+                        yield cell_coords(i, j), v
+            elif isinstance(row, str):
+                yield cell_coords(i, 0), row
+
+
+def _as_ints(coords):
+    return coords and [int(i) for i in coords]
+
+
+def _rect_size(st, nd):
+    if st is None:
+        return 0
+    if nd is None:
+        return 1
+    return (nd[0] - st[0] + 1) * (nd[1] - st[1] + 1)
+
+
+class _PlannedRanger(_lasso.Ranger):
+    """A :class:`Ranger` reusing the results of :class:`LassoPlan` nodes already run."""
+
+    def __init__(self, ranger, results):
+        super(_PlannedRanger, self).__init__(
+            ranger.sheets_factory,
+            ranger.base_opts,
+            ranger.available_filters,
+            ranger.lean,
+        )
+        self._results = results
+
+    def do_lasso(self, xlref, **context_kwds):
+        if isinstance(xlref, str):
+            try:
+                key = _open_node(self, xlref, context_kwds)[1]
+            except Exception:
+                key = None  # Let it scream below.
+            lasso = self._results.get(key)
+            if lasso is not None:
+                return lasso._replace(values=deepcopy(lasso.values))
+        return super(_PlannedRanger, self).do_lasso(xlref, **context_kwds)
+
+
+class LassoPlan(object):
+    """
+    A DAG of nested :term:`xl-ref`, built with :meth:`add()`, see module's doc.
+
+    :ivar dict nodes:
+            the :class:`PlanNode` instances, keyed by their `key`
+    :ivar list roots:
+            the keys of the :term:`xl-ref` added, in order
+    :ivar dict results:
+            the :class:`Lasso` of each node lassoed by :meth:`run()`
+    :ivar dict errors:
+            the exceptions of any nodes failed in :meth:`run()`
+    :ivar dict elapsed:
+            the seconds each node took in :meth:`run()`
+    """
+
+    def __init__(self, ranger):
+        """
+        :param Ranger ranger:
+                its :class:`SheetsFactory` must cache sheets, so that
+                workbooks are opened just once
+        """
+        self.ranger = ranger
+        self.nodes = {}
+        self.roots = []
+        self.results = {}
+        self.errors = {}
+        self.elapsed = {}
+
+    def _scan(self, xlref, context_kwds, path):
+        ranger = self.ranger
+        lasso, key = _open_node(ranger, xlref, context_kwds)
+        if key in path:
+            raise _CyclicXlrefError(
+                "Cyclic xl-ref(%r) through: %s" % (xlref, [k[2] for k in path])
+            )
+        if key in self.nodes:
+            return key
+
+        sheet = lasso.sheet
+        st, nd, values = ranger._capture_values(lasso, sheet)
+        lasso = lasso._replace(st=st, nd=nd, values=values)
+
+        deps = []
+        node = PlanNode(key, xlref, dict(context_kwds), sheet, st, nd, deps, lasso)
+        self.nodes[key] = node
+        if st is not None and _mentions_recurse(lasso.call_spec):
+            path = path + (key,)
+            for base_coords, elval in _iter_str_cells(values, st):
+                try:
+                    _parse.parse_xlref(elval)
+                except Exception:
+                    continue  # Not an xl-ref, or broken one to scream on run.
+                ctx = {"sheet": sheet, "st": st, "nd": nd, "base_coords": base_coords}
+                try:
+                    dep = self._scan(elval, ctx, path)
+                except _CyclicXlrefError:
+                    raise
+                except Exception as ex:
+                    log.debug("Skipped planning xl-ref(%r): %s", elval, ex)
+                    continue
+                if dep not in deps:
+                    deps.append(dep)
+
+        return key
+
+    def add(self, xlref, **context_kwds):
+        """
+        Scan `xlref` and any :term:`xl-ref` nested in its values, opening their sheets.
+
+        :param Lasso context_kwds:
+                Default :class:`Lasso` fields in case parsed ones are `None`
+        :return: the key of the root node
+        :raise ValueError: on cyclic :term:`xl-ref`, or when the root
+                           cannot be lassoed
+        """
+        key = self._scan(xlref, context_kwds, ())
+        self.roots.append(key)
+
+        return key
+
+    def levels(self):
+        """
+        :return: a list of lists of node-keys, where nodes depend only on lower levels
+        """
+        node_levels = {}
+
+        def level(key):
+            lvl = node_levels.get(key)
+            if lvl is None:
+                deps = self.nodes[key].deps
+                lvl = node_levels[key] = 1 + max((level(d) for d in deps), default=-1)
+            return lvl
+
+        levels = []
+        for key in self.nodes:
+            lvl = level(key)
+            while len(levels) <= lvl:
+                levels.append([])
+            levels[lvl].append(key)
+
+        return levels
+
+    def _run_node(self, ranger, key):
+        node = self.nodes[key]
+        start = time.perf_counter()
+        ## Filters may modify values & opts in-place, so copy them,
+        #  to keep :meth:`run()` repeatable.
+        lasso = node.lasso
+        lasso = lasso._replace(values=deepcopy(lasso.values), opts=deepcopy(lasso.opts))
+        try:
+            self.results[key] = ranger._run_filters(lasso)
+        except Exception as ex:
+            log.debug("Planned xl-ref(%r) failed: %s", node.xlref, ex, exc_info=1)
+            self.errors[key] = ex
+        self.elapsed[key] = time.perf_counter() - start
+
+    def run(self):
+        """
+        Filter the captured values of all nodes serially, level by level, reusing the results of lower levels.
+
+        Failed nodes are not reused, so their errors resurface normally
+        when their dependents get lassoed.
+
+        :return: a list with the values of each root :term:`xl-ref`
+        :raise: the error of the 1st failed root
+        """
+        ranger = _PlannedRanger(self.ranger, self.results)
+        for level in self.levels():
+            for key in level:
+                self._run_node(ranger, key)
+
+        for key in self.roots:
+            if key in self.errors:
+                raise self.errors[key]
+
+        return [self.results[key].values for key in self.roots]
+
+    def to_dict(self):
+        """
+        Export the graph as json-able lists of `nodes` & `edges`.
+
+        Each node has its workbook, sheet, xl-ref (and its fragment after
+        the sheet), level, rect & size
+        (in cells), `fan_out` (number of dependencies) and, if run,
+        the `elapsed` seconds and any `error`.
+        """
+        ids = {key: i for i, key in enumerate(self.nodes)}
+        node_levels = {key: i for i, lvl in enumerate(self.levels()) for key in lvl}
+        nodes = []
+        edges = []
+        for key, node in self.nodes.items():
+            wb, sh, frag, base_coords = key
+            nodes.append(
+                {
+                    "id": ids[key],
+                    "workbook": wb,
+                    "sheet": sh,
+                    "xlref": node.xlref,
+                    "fragment": frag,
+                    "base_coords": _as_ints(base_coords),
+                    "level": node_levels[key],
+                    "st": _as_ints(node.st),
+                    "nd": _as_ints(node.nd),
+                    "size": int(_rect_size(node.st, node.nd)),
+                    "fan_out": len(node.deps),
+                    "elapsed": self.elapsed.get(key),
+                    "error": key in self.errors and str(self.errors[key]) or None,
+                }
+            )
+            edges.extend([ids[key], ids[dep]] for dep in node.deps)
+
+        return {"nodes": nodes, "edges": edges}
+
+    def to_dot(self):
+        """Export the graph in *graphviz* DOT language, with an arrow from each node to its dependencies."""
+        graph = self.to_dict()
+        lines = ["digraph xlrefs {"]
+        for n in graph["nodes"]:
+            label = "%s#%s!%s\\nlevel: %s, cells: %s" % (
+                n["workbook"],
+                n["sheet"],
+                n["fragment"],
+                n["level"],
+                n["size"],
+            )
+            lines.append('    n%s [label="%s"];' % (n["id"], label.replace('"', '\\"')))
+        for src, dst in graph["edges"]:
+            lines.append("    n%s -> n%s;" % (src, dst))
+        lines.append("}")
+
+        return "\n".join(lines)
+
+
+def make_plan(xlrefs, ranger=None, **context_kwds):
+    """
+    Build a :class:`LassoPlan` for all `xlrefs`; invoke its :meth:`LassoPlan.run()` to lasso them.
+
+    :param list xlrefs:
+            the root :term:`xl-ref` strings
+    :param Ranger ranger:
+            if unspecified, one is created by :func:`make_default_Ranger()`
+            (remember to close its :class:`SheetsFactory`)
+    :param Lasso context_kwds:
+            Default :class:`Lasso` fields for all roots
+    """
+    plan = LassoPlan(ranger or _lasso.make_default_Ranger())
+    for xlref in xlrefs:
+        plan.add(xlref, **context_kwds)
+
+    return plan
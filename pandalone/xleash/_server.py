@@ -0,0 +1,281 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2014-2019European Commission (JRC);
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+"""
+A long-running :term:`lassoing` server keeping workbooks "warm" for many short-lived clients.
+
+The server owns a single :class:`Ranger` (and its :class:`SheetsFactory`),
+so that workbooks are opened & parsed once and shared among all clients,
+until their files change on disk; even then, only the captures
+overlapping changed cells are re-read (see :class:`SheetsFactory`).
+
+- It listens on a *localhost* TCP-port or on a *Unix* domain-socket.
+- Clients ``POST`` batches of :term:`xl-ref` as a json-object like
+  ``{"xlrefs": ["path/to/book.xlsx#Sheet1!A1:..(D)", ...]}``.
+- The results are returned as a :func:`numpy.savez()` archive:
+
+  - ``values_<i>`` keys contain the values of each :term:`xl-ref`
+    as native arrays, when all their elements are of a single type
+    (see :func:`pack_values()`),
+  - ``objects_<i>`` keys contain instead anything else (i.e. mixed rects,
+    dataframes, dicts) as 0-dim object-arrays; only these get unpickled,
+  - the ``errors`` key contains an error-message for each :term:`xl-ref`,
+    empty if it succeeded.
+
+Use :func:`lasso_remote()` as the client.
+
+Example::
+
+    >>> from pandalone import xleash
+    >>> from pandalone.xleash import _server
+    >>> srv = _server.make_server(('localhost', 0))
+    >>> srv.ranger.sheets_factory.add_sheet(
+    ...     xleash.ArraySheet([[1, 2], [3, 4]]), wb_ids='book', sh_ids='Sheet1')
+    >>> import threading
+    >>> threading.Thread(target=srv.serve_forever, daemon=True).start()
+    >>> _server.lasso_remote(['book#Sheet1!A1:B2', 'book#Sheet1!B2'],
+    ...                      srv.server_address)
+    [array([[1, 2],
+           [3, 4]]), 4]
+    >>> srv.shutdown()
+    >>> srv.server_close()
+
+.. currentmodule:: pandalone.xleash
+"""
+
+from http import client as http_client
+from http import server as http_server
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+
+from urllib.parse import urldefrag, urlparse
+
+import numpy as np
+
+from . import _lasso
+from ._pack import is_object_array, pack_values, read_object_array, unpack_values
+from .io import backend
+from .. import utils
+
+
+log = logging.getLogger(__name__)
+
+
+def _local_path(url_file):
+    """Return the file-path of a local workbook, or `None` if remote."""
+    if url_file:
+        parts = urlparse(utils.path2url(url_file))
+        if parts.scheme == "file":
+            return utils.urlpath2path(parts.path)
+
+
+class _LassoRequestHandler(http_server.BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        log.debug("%s: " + format, self.command, *args)
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            req = json.loads(self.rfile.read(length).decode("utf-8"))
+            xlrefs = req["xlrefs"]
+            if not isinstance(xlrefs, list):
+                raise ValueError("Expected a list of `xlrefs`, got: %r" % xlrefs)
+        except Exception as ex:
+            self.send_error(400, "Bad lasso request due to: %s" % ex)
+            return
+
+        results = self.server.lasso_batch(xlrefs)
+
+        buf = io.BytesIO()
+        np.savez(buf, **results)
+        body = buf.getvalue()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _LassoServerMixin(socketserver.ThreadingMixIn):
+    """
+    Serves :term:`lassoing` batches from a shared :class:`Ranger`.
+
+    :ivar Ranger ranger:
+            Shared by all clients; its :class:`SheetsFactory` caches the
+            workbooks.
+    :ivar dict _mtimes:
+            The last-modification times of the local workbook files,
+            to invalidate cached sheets when changed.
+    """
+
+    daemon_threads = True
+
+    def _init_lasso_server(self, ranger):
+        self.ranger = ranger or _lasso.make_default_Ranger(
+            backend.SheetsFactory(track_changes=True), lean=True
+        )
+        self._mtimes = {}
+        self._lock = threading.Lock()
+
+    def _invalidate_if_changed(self, url_file):
+        fpath = _local_path(url_file)
+        if not fpath:
+            return
+        try:
+            mtime = os.stat(fpath).st_mtime_ns
+        except OSError:
+            return
+        old_mtime = self._mtimes.get(url_file)
+        if old_mtime is not None and old_mtime != mtime:
+            log.info("Workbook(%r) changed, re-opening it.", url_file)
+            self.ranger.sheets_factory.close_book(url_file)
+        self._mtimes[url_file] = mtime
+
+    def lasso_batch(self, xlrefs):
+        """
+        Lasso all `xlrefs` serially, under a lock.
+
+        :return:
+                a dict of arrays, as described in the module's doc
+        """
+        results = {}
+        errors = []
+        with self._lock:
+            for i, xlref in enumerate(xlrefs):
+                err = ""
+                try:
+                    if not isinstance(xlref, str):
+                        raise ValueError("Expected a string as `xl-ref`: %s" % xlref)
+                    self._invalidate_if_changed(urldefrag(xlref)[0] or None)
+                    values = self.ranger.do_lasso(xlref).values
+                except Exception as ex:
+                    log.debug("Lassoing xl-ref(%r) failed: %s", xlref, ex, exc_info=1)
+                    err = str(ex) or repr(ex)
+                    values = None
+                arr = pack_values(values)
+                key = "objects_%i" if is_object_array(arr) else "values_%i"
+                results[key % i] = arr
+                errors.append(err)
+        results["errors"] = np.array(errors, dtype=str)
+
+        return results
+
+    def server_close(self):
+        super().server_close()
+        self.ranger.sheets_factory.close()
+
+
+class LassoServer(_LassoServerMixin, http_server.HTTPServer):
+    """A :term:`lassoing` server listening on a TCP `address`, see :func:`make_server()`."""
+
+    def __init__(self, address, ranger=None):
+        self._init_lasso_server(ranger)
+        super().__init__(address, _LassoRequestHandler)
+
+
+if hasattr(socket, "AF_UNIX"):
+
+    class UnixLassoServer(_LassoServerMixin, socketserver.UnixStreamServer):
+        """A :term:`lassoing` server listening on a Unix domain-socket, see :func:`make_server()`."""
+
+        def __init__(self, address, ranger=None):
+            self._init_lasso_server(ranger)
+            super().__init__(address, _LassoRequestHandler)
+
+        def server_close(self):
+            super().server_close()
+            try:
+                os.unlink(self.server_address)
+            except OSError:
+                pass
+
+
+def make_server(address=("localhost", 0), ranger=None):
+    """
+    Create a :term:`lassoing` server; invoke its ``serve_forever()`` to start it.
+
+    :param address:
+            Either a ``(host, port)`` tuple for TCP (port 0 picks a free one),
+            or a string for a Unix domain-socket file-path.
+    :param Ranger ranger:
+            if unspecified, a :attr:`Ranger.lean` one is created by
+            :func:`make_default_Ranger()` with a change-tracking
+            :class:`SheetsFactory`, closed when server closes.
+    """
+    if isinstance(address, str):
+        return UnixLassoServer(address, ranger)
+    return LassoServer(tuple(address), ranger)
+
+
+class _UnixHTTPConnection(http_client.HTTPConnection):
+    def __init__(self, sock_path, timeout=None):
+        super().__init__("localhost", timeout=timeout)
+        self._sock_path = sock_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self._sock_path)
+
+
+def lasso_remote(xlrefs, address, lax=False, timeout=None):
+    """
+    Client of a :term:`lassoing` server, see :func:`make_server()`.
+
+    :param list xlrefs:
+            the :term:`xl-ref` strings to lasso in a single batch
+    :param address:
+            either a ``(host, port)`` tuple or a Unix domain-socket file-path
+    :param bool lax:
+            if true, log warnings and return `None` for failed :term:`xl-ref`,
+            otherwise (default) scream on the 1st error.
+    :return:
+            a list with the values of each :term:`xl-ref`
+    """
+    if isinstance(address, str):
+        conn = _UnixHTTPConnection(address, timeout=timeout)
+    else:
+        host, port = address
+        conn = http_client.HTTPConnection(host, port, timeout=timeout)
+    try:
+        body = json.dumps({"xlrefs": list(xlrefs)})
+        conn.request("POST", "/", body, {"Content-Type": "application/json"})
+        resp = conn.getresponse()
+        payload = resp.read()
+        if resp.status != 200:
+            raise ValueError(
+                "Lasso-server(%s) failed with %s: %s"
+                % (address, resp.status, payload.decode("utf-8", "replace"))
+            )
+    finally:
+        conn.close()
+
+    with np.load(io.BytesIO(payload), allow_pickle=False) as npz:
+        errors = npz["errors"].tolist()
+        results = []
+        for i, (xlref, err) in enumerate(zip(xlrefs, errors)):
+            if err:
+                msg = "Remote-lassoing xl-ref(%r) failed due to: %s"
+                if not lax:
+                    raise ValueError(msg % (xlref, err))
+                log.warning(msg, xlref, err)
+                results.append(None)
+            else:
+                key = "values_%i" % i
+                if key in npz:
+                    arr = npz[key]
+                else:
+                    arr = read_object_array(npz, "objects_%i" % i)
+                results.append(unpack_values(arr))
+
+    return results
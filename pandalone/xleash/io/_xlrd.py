@@ -17,7 +17,7 @@ import logging
 
 from urllib import request
 from urllib.parse import urlparse
-from pandalone.xleash.io.backend import ABCBackend, ABCSheet, SheetId
+from pandalone.xleash.io.backend import ABCBackend, ABCSheet, SheetId, hash_cells
 from xlrd import (
     xldate,
     XL_CELL_DATE,
@@ -178,6 +178,12 @@ class XlrdSheet(ABCSheet):
         types = np.asarray(self._sheet._cell_types)
         return (types != XL_CELL_EMPTY) & (types != XL_CELL_BLANK)
 
+    def _read_cells_digest(self):
+        """See super-method; hashes raw cell-types & values, without parsing them."""
+        sheet = self._sheet
+        digest = hash_cells(sheet._cell_values, sheet._cell_types)
+        return digest.reshape(self.get_states_matrix().shape)
+
     def _read_margin_coords(self):
         nrows = self._sheet.nrows - 1
         ncols = self._sheet.ncols - 1
@@ -14,8 +14,10 @@ Prefer accessing the public members from the parent module.
 """
 
 from abc import abstractmethod, ABC
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
+from copy import deepcopy
 
+import hashlib
 import itertools as itt
 import numpy as np
 
@@ -129,18 +131,38 @@ class SheetsFactory(SimpleSheetsFactory):
     - It is a resource-manager for contained sheets, so it can be used wth
       a `with` statement.
 
+    - When `track_changes` is true, it remembers the :class:`SheetFingerprint`
+      of each (workbook, sheet) and the :term:`capture-rect` values read
+      from it; so when a workbook gets re-opened (e.g. after
+      :meth:`close_book()`), only the captures overlapping changed cells
+      are re-read (see :meth:`Ranger.do_lasso()`).
+      This tracking-info survives :meth:`close()` (unless `track_changes`
+      has been reset), and only the `max_captures` most-recently-used
+      captures are kept.
+
     """
 
-    def __init__(self, backends=None):
+    def __init__(self, backends=None, track_changes=False, max_captures=1024):
         """
         :param backends:
                 The list of :class:`backends` to consider when opening sheets.
                 If it evaluates to false, :data:`io_backends` assumed.
         :typ backends:
                 list or None
+        :param bool track_changes:
+                whether to reuse captures of unchanged sheet-regions
+        :param int max_captures:
+                how many captures to remember when `track_changes`,
+                evicting the least-recently-used ones
         """
         super(SheetsFactory, self).__init__(backends)
         self._cached_sheets = {}
+        self.track_changes = track_changes
+        self.max_captures = max_captures
+        #: ``{(wb_id, sh_id): SheetFingerprint}``
+        self._tracked_sheets = {}
+        #: LRU ``{((wb_id, sh_id), capture_key): (st, nd, values)}``
+        self._tracked_captures = OrderedDict()
 
     def _cache_get(self, key):
         wb, sh = key
@@ -189,12 +211,40 @@ class SheetsFactory(SimpleSheetsFactory):
                     if sh is sheet:
                         del sh_dict[sh_id]
 
+    def close_book(self, wb_id):
+        """
+        Closes and forgets all sheets cached under some workbook-id, including their aliases.
+
+        Use it to invalidate a workbook whose file has changed.
+
+        :param wb_id:
+                any workbook-id (ie: file, url) the sheets were cached with
+        :return:
+                the number of sheets closed
+        """
+        sheets = list(self._cached_sheets.get(wb_id, {}).values())
+        for sh in sheets:
+            sh._close_all()
+        for wb in list(self._cached_sheets):
+            sh_dict = self._cached_sheets[wb]
+            for sh_id, sh in list(sh_dict.items()):
+                if any(sh is s for s in sheets):
+                    del sh_dict[sh_id]
+            if not sh_dict:
+                del self._cached_sheets[wb]
+        if not self.track_changes:
+            self._forget_tracked({wb_id} | {sh.get_sheet_ids()[0] for sh in sheets})
+
+        return len(sheets)
+
     def close(self):
-        """Closes all contained sheets and empties cache."""
+        """Closes all contained sheets and empties cache (and tracking-info, unless `track_changes`)."""
         for sh_dict in self._cached_sheets.values():
             for sh in sh_dict.values():
                 sh._close_all()
         self._cached_sheets = {}
+        if not self.track_changes:
+            self._forget_tracked()
 
     def add_sheet(self, sheet, wb_ids=None, sh_ids=None):
         """
@@ -244,6 +294,74 @@ class SheetsFactory(SimpleSheetsFactory):
         assert sheet, (wb_id, sheet_id)
         return sheet
 
+    def _forget_tracked(self, wb_ids=None):
+        """Drop the fingerprints & captures of the sheets in `wb_ids` workbooks (all if `None`)."""
+        if wb_ids is None:
+            self._tracked_sheets.clear()
+            self._tracked_captures.clear()
+        else:
+            for skey in [k for k in self._tracked_sheets if k[0] in wb_ids]:
+                del self._tracked_sheets[skey]
+            for ckey in [k for k in self._tracked_captures if k[0][0] in wb_ids]:
+                del self._tracked_captures[ckey]
+
+    def _sync_tracked_sheet(self, sheet):
+        """
+        Sync the captures of `sheet` with its current fingerprint, dropping stale ones.
+
+        :return: the ``(wb_id, sh_id)`` key of the `sheet` in the tracked captures
+        """
+        fp = sheet.get_fingerprint()
+        wb_id, sh_ids = sheet.get_sheet_ids()
+        skey = (wb_id, sh_ids[0])
+        old_fp = self._tracked_sheets.get(skey)
+        if old_fp is not fp:
+            if old_fp is not None and old_fp.digest != fp.digest:
+                changed = None
+                if old_fp.states_digest == fp.states_digest:
+                    changed = old_fp.cells_digest != fp.cells_digest
+                captures = self._tracked_captures
+                for ckey in [k for k in captures if k[0] == skey]:
+                    st, nd, _values = captures[ckey]
+                    if changed is None or _is_rect_changed(changed, st, nd):
+                        del captures[ckey]
+            self._tracked_sheets[skey] = fp
+
+        return skey
+
+    def lookup_capture(self, sheet, capture_key):
+        """
+        Return a copy of a previous ``(st, nd, values)`` capture, if still valid.
+
+        :param capture_key:
+                anything hashable determining the :term:`capture-rect`
+                (besides the sheet's :term:`states-matrix`)
+        :return: `None` if not :attr:`track_changes` or no valid capture
+        """
+        if self.track_changes:
+            try:
+                ckey = (self._sync_tracked_sheet(sheet), capture_key)
+            except _capture.EmptyCaptureException:
+                return None
+            capture = self._tracked_captures.get(ckey)
+            if capture:
+                self._tracked_captures.move_to_end(ckey)
+                st, nd, values = capture
+                return st, nd, deepcopy(values)
+
+    def store_capture(self, sheet, capture_key, st, nd, values):
+        """Remember a capture for :meth:`lookup_capture()`, if :attr:`track_changes`."""
+        if self.track_changes:
+            try:
+                ckey = (self._sync_tracked_sheet(sheet), capture_key)
+            except _capture.EmptyCaptureException:
+                return
+            captures = self._tracked_captures
+            captures[ckey] = (st, nd, deepcopy(values))
+            captures.move_to_end(ckey)
+            while len(captures) > self.max_captures:
+                captures.popitem(last=False)
+
     def __enter__(self):
         return self
 
@@ -251,6 +369,78 @@ class SheetsFactory(SimpleSheetsFactory):
         self.close()
 
 
+def _is_rect_changed(changed, st, nd):
+    """
+    :param np.ndarray changed: boolean 2D-array with changed cells
+    :param Coords st: None if empty capture
+    :param Coords nd: None if scalar capture
+
+    Examples::
+
+        >>> changed = np.array([[0, 0], [0, 1]], dtype=bool)
+        >>> _is_rect_changed(changed, Coords(0, 0), Coords(0, 1))
+        False
+        >>> _is_rect_changed(changed, Coords(0, 0), Coords(4, 4))
+        True
+        >>> _is_rect_changed(changed, Coords(1, 1), None)
+        True
+        >>> _is_rect_changed(changed, None, None)
+        False
+    """
+    if st is None:
+        return False
+    if nd is None:
+        nd = st
+    return bool(changed[st[0] : nd[0] + 1, st[1] : nd[1] + 1].any())
+
+
+def _cell_hash(value, typ=None):
+    """A hash distinguishing also cells with equal values but different types (``1`` vs ``True``)."""
+    if typ is None:
+        typ = type(value)
+    try:
+        return hash((typ, value))
+    except TypeError:
+        return hash((typ, repr(value)))
+
+
+def hash_cells(values, types=None):
+    """
+    Hash vectorially the types & values of sheet-cells, with *pandas*, if installed.
+
+    :param values:
+            a 2D-array (or list of lists) with the values of the cells
+    :param types:
+            a same-shaped array with the types of the cells, if the backend has any;
+            if `None`, the python-types of the `values` are used
+    :return: an int64 2D-array shaped like `values`
+    :rtype: ndarray
+
+    Examples::
+
+        >>> digest = hash_cells([[1, 1], [True, '1']])
+        >>> digest.shape
+        (2, 2)
+        >>> len(set(digest.ravel()))
+        3
+    """
+    values = np.asarray(values, dtype=object)
+    try:
+        import pandas as pd
+    except ImportError:
+        if types is None:
+            return np.frompyfunc(_cell_hash, 1, 1)(values).astype(np.int64)
+        return np.frompyfunc(_cell_hash, 2, 1)(values, types).astype(np.int64)
+
+    cells = pd.Series(values.ravel())
+    types = cells.map(type) if types is None else pd.Series(np.ravel(types))
+    digest = pd.util.hash_pandas_object(cells, index=False).to_numpy()
+    types_digest = pd.util.hash_pandas_object(types, index=False).to_numpy()
+    digest = digest * np.uint64(31) + types_digest
+
+    return digest.view(np.int64).reshape(values.shape)
+
+
 def margin_coords_from_states_matrix(states_matrix):
     """
     Returns top-left/bottom-down margins of full cells from a :term:`state` matrix.
@@ -300,6 +490,21 @@ def margin_coords_from_states_matrix(states_matrix):
 
 SheetId = namedtuple("SheetId", ("book", "ids"))
 
+SheetFingerprint = namedtuple(
+    "SheetFingerprint", ("states_digest", "digest", "cells_digest")
+)
+"""
+The content of a sheet, to detect which cells changed when re-opened.
+
+:param str states_digest:
+        a hash of the :term:`states-matrix` (and its shape)
+:param str digest:
+        a hash of the whole sheet (i.e. of `cells_digest`)
+:param np.ndarray cells_digest:
+        an int64 2D-array of a hash for each cell's type & value,
+        shaped like the :term:`states-matrix`
+"""
+
 
 class ABCSheet(ABC):
     """
@@ -331,6 +536,7 @@ class ABCSheet(ABC):
 
     _states_matrix = None
     _margin_coords = None
+    _fingerprint = None
 
     def _close(self):
         """ Override it to release resources for this sheet."""
@@ -374,6 +580,39 @@ class ABCSheet(ABC):
             self._states_matrix = self._read_states_matrix()
         return self._states_matrix
 
+    def _read_cells_digest(self):
+        """
+        Override to hash the cell-types & values of the sheet more efficiently.
+
+        By default, hashes the cells read with :meth:`read_rect()`.
+
+        :return: an int64 2D-array shaped like the :term:`states-matrix`
+        :rtype: ndarray
+        """
+        states = self.get_states_matrix()
+        if not states.size:
+            return np.zeros(states.shape, dtype=np.int64)
+        nrows, ncols = states.shape
+        values = self.read_rect(Coords(0, 0), Coords(nrows - 1, ncols - 1))
+        return hash_cells(values)
+
+    def get_fingerprint(self):
+        """
+        Compute (and cache) the :class:`SheetFingerprint` of the wrapped sheet.
+
+        :raise: EmptyCaptureException if sheet empty
+        """
+        if self._fingerprint is None:
+            states = np.asarray(self.get_states_matrix(), dtype=bool)
+            cells_digest = self._read_cells_digest()
+            states_digest = hashlib.sha1(
+                repr(states.shape).encode() + np.packbits(states).tobytes()
+            ).hexdigest()
+            digest = hashlib.sha1(cells_digest.tobytes()).hexdigest()
+            self._fingerprint = SheetFingerprint(states_digest, digest, cells_digest)
+
+        return self._fingerprint
+
     @abstractmethod
     def read_rect(self, st, nd):
         """
@@ -453,6 +692,10 @@ class ArraySheet(ABCSheet):
             raise _capture.EmptyCaptureException("empty sheet")
         return ~np.equal(self._arr, None)
 
+    def _read_cells_digest(self):
+        """See super-method. """
+        return hash_cells(self._arr)
+
     def read_rect(self, st, nd):
         if not self._arr.size:
             raise _capture.EmptyCaptureException("empty sheet")
@@ -262,6 +262,7 @@ setup(
         "all": dev_reqs,
     },
     entry_points={
+        "console_scripts": ["pandalone = pandalone.__main__:main"],
         "pandalone.xleash.plugins": [
             "xlrd_be = pandalone.xleash.io._xlrd:load_as_xleash_plugin [xlrd]",
             "pandas_filters = pandalone.xleash._pandas_filters:load_as_xleash_plugin [pandas]",
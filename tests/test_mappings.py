@@ -564,6 +564,156 @@ class TestPmod(unittest.TestCase):
         pmods = pmods_from_tuples([(None, "spam")])
         self.assertEqual(pmods, Pmod())
 
+    def test_compile_maps_as_map_path(self):
+        pmods = pmods_from_tuples(
+            [
+                ("", "relative/Root"),
+                ("/a/b", "/Rooted/B"),
+                ("/~a(\\d+)", r"C/\1"),
+                ("/~a(\\d+)/~(c.*)", r"CC-/\1"),
+                ("/~a\\d+/~e.*", r"/newroot/\g<0>"),
+                ("/x", "../y/"),
+                ("/x/~.*", "./z"),
+            ]
+        )
+        paths = [
+            "",
+            "/",
+            "/a",
+            "/a/b",
+            "/a/c",
+            "/a12/cow",
+            "/a12/etc/",
+            "/x",
+            "/x/w",
+            "/x/w/",
+            "a/b",
+            "/a~1b/c",
+        ]
+        self.assertEqual(
+            pmods.compile().map_paths(paths), [pmods.map_path(p) for p in paths]
+        )
+        self.assertEqual(pmods.map_paths(paths), [pmods.map_path(p) for p in paths])
+
+    def test_compiled_memoizes_merged_children(self):
+        pmods = pmods_from_tuples(
+            [("/~a.*", "A"), ("/~.*b", "B"), ("/~a.*/c", "C"), ("/~.*b/d", "D")]
+        )
+        root = pmods.compile().descend("")[0]
+        ab1, alias1 = root.descend("ab")
+        ab2, alias2 = root.descend("axb")
+        self.assertIs(ab1, ab2)
+        self.assertEqual((alias1, alias2), ("B", "B"))
+        self.assertEqual((ab1.alias("c"), ab1.alias("d")), ("C", "D"))
+        self.assertIsNot(root.descend("a")[0], ab1)
+        self.assertEqual(root.descend("BAD"), (None, None))
+
+    def test_combine_regexes(self):
+        from pandalone.mappings import _combine_regexes
+
+        rx = _combine_regexes([re.compile("a(\\d)"), re.compile("b.*")])
+        self.assertTrue(rx.fullmatch("a1"))
+        self.assertTrue(rx.fullmatch("bcd"))
+        self.assertFalse(rx.fullmatch("c"))
+        self.assertIsNone(_combine_regexes([re.compile("a")]))
+        self.assertIsNone(_combine_regexes([re.compile("(a)\\1"), re.compile("b")]))
+        self.assertIsNone(
+            _combine_regexes([re.compile("(?P<g>a)"), re.compile("(?P<g>b)")])
+        )
+
+    def test_pmods_from_tuples_frozen(self):
+        pmods = pmods_from_tuples([("/a", "A"), ("/~b.*", "B")])
+        child = pmods.descend("")[0]
+        with self.assertRaisesRegex(AttributeError, "frozen"):
+            pmods._alias = "BAD"
+        with self.assertRaisesRegex(AttributeError, "frozen"):
+            child._append_into_steps("c")
+        with self.assertRaisesRegex(AttributeError, "frozen"):
+            child._append_into_regxs("c")
+
+        with self.assertRaises(TypeError):
+            child._steps["c"] = Pmod()
+        with self.assertRaises(TypeError):
+            del child._regxs[re.compile("b.*")]
+
+        merged = child._merge(pmods_from_tuples([("/a", "AA")]))
+        self.assertTrue(merged._frozen)
+        self.assertFalse(child._merge(Pmod(_alias="X"))._frozen)
+        self.assertFalse(Pmod()._frozen)
+
+    def test_compile_leaves_unfrozen_pmods_intact(self):
+        pmods = Pmod(_steps={"": Pmod(_steps={"a": Pmod(_alias="A")})})
+        self.assertEqual(pmods.map_paths(["/a/b"]), ["/A/b"])
+        self.assertFalse(pmods._frozen)
+        self.assertFalse(pmods._steps[""]._steps["a"]._frozen)
+        pmods._steps[""]._append_into_steps("c")._alias = "C"
+        self.assertEqual(pmods.map_paths(["/c"]), ["/C"])
+
+    def test_frozen_pmod_caches_descend_and_alias(self):
+        pmods = pmods_from_tuples([("/a", "A"), ("/~a.*", "AA"), ("/~a.*/c", "C")])
+        root = pmods.descend("")[0]
+        self.assertEqual(root.cache_info(), (0, 0, 1024, 0))
+
+        ab1 = root.descend("ab")
+        self.assertIs(root.descend("ab"), ab1)
+        self.assertEqual(ab1[1], "AA")
+        self.assertEqual(root.alias("a"), "A")
+        self.assertEqual(root.alias("a"), "A")
+        self.assertEqual(root.alias("BAD"), None)
+        self.assertEqual(root.cache_info(), (2, 3, 1024, 3))
+        self.assertEqual(ab1[0].alias("c"), "C")
+
+        self.assertEqual(Pmod(_alias="A").cache_info(), (0, 0, 0, 0))
+
+    def test_map_index_maps_unique_labels_once(self):
+        pmods = pmods_from_tuples([("/a", "A"), ("/~b(.*)", r"B/\1")])
+        labels = ["/a", "/bx", "/c", "/a", "/bx", 1]
+        index, table = pmods.map_index(pd.Index(labels))
+        exp = [pmods.map_path(l) if isinstance(l, str) else l for l in labels]
+        self.assertEqual(list(index), exp)
+        self.assertEqual(len(table), 3)
+
+        table = dict(table, **{"/a": "/REUSED"})
+        index, table2 = pmods.map_index(pd.Index(["/a", "/d"]), table)
+        self.assertEqual(list(index), ["/REUSED", "/d"])
+        self.assertNotIn("/d", table)
+        self.assertEqual(table2["/d"], "/d")
+
+    def test_map_index_non_string_labels_intact(self):
+        pmods = pmods_from_tuples([("/a", "A")])
+        index, table = pmods.map_index(pd.Index([1, True, "/a", 0, False]))
+        self.assertEqual(
+            [(type(l), l) for l in index],
+            [(int, 1), (bool, True), (str, "/A"), (int, 0), (bool, False)],
+        )
+        self.assertEqual(table, {"/a": "/A"})
+
+        index = pd.Index([3, 1, 2])
+        mapped, table = pmods.map_index(index)
+        pd.testing.assert_index_equal(mapped, index)
+        self.assertEqual(table, {})
+
+    def test_map_frame_columns(self):
+        pmods = pmods_from_tuples([("/a", "A/AA"), ("/~b.*", "B")])
+        df = pd.DataFrame([[1, 2, 3]], columns=["/a", "/bb", "/c"])
+        df2, table = pmods.map_frame_columns(df)
+        self.assertEqual(list(df2.columns), ["/A/AA", "/B", "/c"])
+        self.assertEqual(list(df.columns), ["/a", "/bb", "/c"])
+        npt.assert_array_equal(df2.values, df.values)
+
+        df3, table3 = pmods.map_frame_columns(df, table)
+        self.assertEqual(list(df3.columns), list(df2.columns))
+        self.assertEqual(table3, table)
+
+    def test_frozen_pmod_cache_bounded(self):
+        import pandalone.mappings as mappings
+
+        pmods = pmods_from_tuples([("/~a.*", "A")])
+        root = pmods.descend("")[0]
+        for i in range(mappings._PMOD_CACHE_SIZE + 10):
+            root.alias("a%i" % i)
+        self.assertEqual(root.cache_info().currsize, mappings._PMOD_CACHE_SIZE)
+
 
 class TestPstep(unittest.TestCase):
     def PMODS(self, absolute=False):
@@ -7,10 +7,16 @@
 # You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
 
 import doctest
+import functools as ft
+import io
 import json
+import os.path as osp
 import sys
+import tempfile
 import unittest
 
+from unittest.mock import patch
+
 from jsonschema.exceptions import RefResolutionError
 
 import numpy as np
@@ -87,6 +93,76 @@ class TestJSONCodec(unittest.TestCase):
             self.assertTrue(...)
 
 
+class TestBinaryJSONCodec(unittest.TestCase):
+    def _roundtrip(self, o, sidecar=None):
+        s = json.dumps(o, cls=pandata.BinaryJSONCodec.Encoder, sidecar=sidecar)
+        return s, json.loads(s, cls=pandata.BinaryJSONCodec.Decoder, sidecar=sidecar)
+
+    def test_json_natives(self):
+        o = {"a": 1, "b": [1, "2", None, 3.5], "c": {"d": True}}
+        self.assertEqual(self._roundtrip(o)[1], o)
+
+    def test_Numpy(self):
+        for o in [
+            np.random.randn(6, 2),
+            np.arange(6, dtype=">i2").reshape(3, 2).T,
+            np.array([True, False]),
+            np.array(["2019-01-01", "NaT"], dtype="datetime64[ns]"),
+            np.empty((0, 3)),
+        ]:
+            for sidecar in (None, io.BytesIO()):
+                s, oo = self._roundtrip(o, sidecar)
+                self.assertEqual(oo.dtype, o.dtype)
+                npt.assert_array_equal(oo, o)
+                oo[...] = o  # Writable.
+        s, oo = self._roundtrip(np.int16(3))
+        self.assertIsInstance(oo, np.int16)
+
+    def test_DataFrame(self):
+        o = pd.DataFrame(
+            {
+                "f": np.random.randn(4),
+                "i": np.arange(4),
+                "s": ["a", None, 2, "b"],
+                "t": pd.date_range("2020-01-01", periods=4),
+            },
+            index=pd.Index(list("wxyz"), name="idx"),
+        )
+        for sidecar in (None, io.BytesIO()):
+            s, oo = self._roundtrip(o, sidecar)
+            pd.testing.assert_frame_equal(oo, o)
+        self.assertNotIn("pickle", s)
+
+        o = pd.DataFrame(np.ones((3, 2)), columns=[1, 1])
+        pd.testing.assert_frame_equal(self._roundtrip(o)[1], o)
+        o = pd.DataFrame()
+        pd.testing.assert_frame_equal(self._roundtrip(o)[1], o)
+
+    def test_Series(self):
+        o = pd.Series([1.5, 2.5], index=pd.RangeIndex(2, 6, 2), name="sr")
+        pd.testing.assert_series_equal(self._roundtrip(o)[1], o)
+
+    def test_pickled_fallbacks(self):
+        o = {
+            "cat": pd.Series(["a", "b"], dtype="category"),
+            "mi": pd.Series([1, 2], index=pd.MultiIndex.from_tuples([(1, 2), (3, 4)])),
+            "set": {1, 2},
+        }
+        s, oo = self._roundtrip(o)
+        self.assertIn("$qpickle", s)
+        pd.testing.assert_series_equal(oo["cat"], o["cat"])
+        pd.testing.assert_series_equal(oo["mi"], o["mi"])
+        self.assertEqual(oo["set"], o["set"])
+
+    def test_sidecar_keeps_json_small(self):
+        arr = np.random.randn(1000, 10)
+        sidecar = io.BytesIO()
+        s, oo = self._roundtrip({"arr": arr}, sidecar)
+        self.assertLess(len(s), 200)
+        self.assertEqual(sidecar.tell(), arr.nbytes)
+        npt.assert_array_equal(oo["arr"], arr)
+
+
 class TestJsonPointer(unittest.TestCase):
     def test_jsonpointer_escape_parts(self):
         def un_esc(part):
@@ -286,6 +362,35 @@ class TestJsonPointer(unittest.TestCase):
             doc = _doc()
             self.assertEqual(pandata.resolve_jsonpointer(doc, path), exp)
 
+    def test_resolve_jsonpointers_batch(self):
+        doc = {"a": {"b": [1, {"c": 2}], "": 3}, "x/y": 4}
+        paths = ["/a/b/1/c", "/a/b/0", "/a/", "/x~1y", "", "/a/b", "/a/b/1/c"]
+        exp = [pandata.resolve_jsonpointer(doc, p) for p in paths]
+        self.assertEqual(pandata.resolve_jsonpointers(doc, paths), exp)
+
+        jps = [pandata.compile_jsonpointer(p) for p in paths]
+        self.assertEqual(pandata.resolve_jsonpointers(doc, jps), exp)
+        self.assertEqual(pandata.resolve_jsonpointers(doc, []), [])
+
+    def test_resolve_jsonpointers_missing(self):
+        doc = {"a": {"b": 1}}
+        paths = ["/a/b", "/a/b/c", "/z", "/a/q"]
+        self.assertEqual(
+            pandata.resolve_jsonpointers(doc, paths, default="D"), [1, "D", "D", "D"]
+        )
+        with self.assertRaisesRegex(RefResolutionError, r"'/a/b/c'\)@\(c\)"):
+            pandata.resolve_jsonpointers(doc, paths)
+        with self.assertRaisesRegex(RefResolutionError, r"must start with '/'"):
+            pandata.resolve_jsonpointers(doc, ["/a", "a"])
+
+    def test_compile_jsonpointer_cached(self):
+        jp = pandata.compile_jsonpointer("/a~0b/c")
+        self.assertIs(pandata.compile_jsonpointer("/a~0b/c"), jp)
+        self.assertEqual(jp.parts, ("a~b", "c"))
+        self.assertEqual(jp.resolve({"a~b": {"c": 1}}), 1)
+        with self.assertRaises(RefResolutionError):
+            jp.resolve({})
+
     def test_set_jsonpointer_empty_doc(self):
         doc = {}
         path = "/foo"
@@ -418,6 +523,43 @@ class TestJsonPointer(unittest.TestCase):
         with self.assertRaises(RefResolutionError):
             pandata.set_jsonpointer(doc, path, value)
 
+    def _check_set_jsonpointers(self, doc, pairs):
+        exp = json.loads(json.dumps(doc))
+        for path, value in pairs:
+            pandata.set_jsonpointer(exp, path, value)
+        pandata.set_jsonpointers(doc, pairs)
+        self.assertEqual(doc, exp)
+
+    def test_set_jsonpointers_like_one_by_one(self):
+        self._check_set_jsonpointers({}, [("/a/b", 1), ("/a/c/d", 2), ("/e", 3)])
+        self._check_set_jsonpointers(
+            {"a": [1, {"b": 2}], "s": "str"},
+            [
+                ("/a/1/c", 3),
+                ("/a/-", 4),
+                ("/a/-/x", 5),
+                ("/a/-/y", 6),
+                ("/a/2", 7),
+                ("/s/q", 8),
+                ("/n/0/1", 9),
+            ],
+        )
+        self._check_set_jsonpointers({"a": 1}, [("/a", {"b": 1}), ("/a/c", 2)])
+        self._check_set_jsonpointers({"l": []}, [("/l/0", 0), ("/l/1", 1)])
+        self._check_set_jsonpointers({}, [("/x/-/a", 1), ("/x/-/b", 2)])
+        self._check_set_jsonpointers(
+            {"m": {"-": {"z": 0}}}, [("/m/-/a", 1), ("/m/-/b", 2)]
+        )
+
+    def test_set_jsonpointers_sequence_errors(self):
+        doc = {"l": [1]}
+        with self.assertRaisesRegex(RefResolutionError, r"out of bounds\(1\)"):
+            pandata.set_jsonpointers(doc, {"/l/0": 0, "/l/3": 3})
+        with self.assertRaisesRegex(RefResolutionError, "Expected numeric index"):
+            pandata.set_jsonpointers(doc, {"/l/x": 0})
+        with self.assertRaisesRegex(RefResolutionError, "Cannot set the root"):
+            pandata.set_jsonpointers(doc, {"": 0})
+
     def test_build_all_jsonpaths(self):
         from jsonschema._utils import load_schema
 
@@ -428,6 +570,1007 @@ class TestJsonPointer(unittest.TestCase):
         self.assertIn("/a/b", paths)
 
 
+class TestSchemaIndex(unittest.TestCase):
+    schema = {
+        "$defs": {
+            "node": {
+                "type": "object",
+                "properties": {
+                    "val": {"type": ["number", "null"], "default": 1},
+                    "kids": {"type": "array", "items": {"$ref": "#/$defs/node"}},
+                },
+            }
+        },
+        "type": "object",
+        "properties": {
+            "tree": {"$ref": "#/$defs/node"},
+            "pair": {"items": [{"type": "string"}, {"type": "number"}]},
+            "a~b": {"allOf": [{"type": "integer"}, {"default": 3, "minimum": 0}]},
+            "any": {"anyOf": [{"type": "string"}, {"properties": {"x": {}}}]},
+            "map": {"additionalProperties": {"type": "boolean"}},
+        },
+    }
+
+    def test_paths(self):
+        sidx = pandata.SchemaIndex(self.schema)
+        self.assertEqual(
+            sorted(sidx),
+            [
+                "",
+                "/any",
+                "/any/x",
+                "/a~0b",
+                "/map",
+                "/map/~*",
+                "/pair",
+                "/pair/0",
+                "/pair/1",
+                "/tree",
+                "/tree/kids",
+                "/tree/kids/~*",
+                "/tree/val",
+            ],
+        )
+        self.assertEqual(
+            sorted(sidx.leaf_paths()),
+            ["/any/x", "/a~0b", "/map/~*", "/pair/0", "/pair/1", "/tree/val"],
+        )
+
+    def test_entries(self):
+        sidx = pandata.SchemaIndex(self.schema)
+        entry = sidx["/a~0b"]
+        self.assertEqual(len(entry.subschemas), 3)
+        self.assertEqual(entry.defaults, (3,))
+        self.assertEqual(entry.types, {"integer"})
+        self.assertEqual(sidx["/any"].types, {"string"})
+        self.assertEqual(sidx["/tree"].types, {"object"})
+        self.assertEqual(sidx["/tree/val"].types, {"number", "null"})
+        self.assertEqual(sidx["/tree/kids/~*"].subschemas, ({"$ref": "#/$defs/node"},))
+        self.assertEqual(sidx["/tree/kids/~*"].types, {"object"})
+        self.assertEqual(sidx["/map/~*"].types, {"boolean"})
+        self.assertNotIn("/tree/kids/~*/val", sidx)
+
+    def test_match(self):
+        sidx = pandata.SchemaIndex(self.schema)
+        self.assertIs(sidx.match("/tree/kids/7/val"), sidx["/tree/val"])
+        self.assertIs(sidx.match("/tree/kids/7/kids/0/kids"), sidx["/tree/kids"])
+        self.assertIs(sidx.match("/pair/1"), sidx["/pair/1"])
+        self.assertIs(sidx.match("/map/foo"), sidx["/map/~*"])
+        self.assertIs(sidx.match(""), sidx[""])
+        self.assertIsNone(sidx.match("/pair/2"))
+        self.assertIsNone(sidx.match("/tree/kids/7/bad"))
+
+    def test_literal_star_property(self):
+        sidx = pandata.SchemaIndex(
+            {
+                "properties": {"*": {"type": "string"}},
+                "additionalProperties": {"type": "number"},
+            }
+        )
+        self.assertEqual(sidx["/*"].types, {"string"})
+        self.assertEqual(sidx["/~*"].types, {"number"})
+        self.assertIs(sidx.match("/*"), sidx["/*"])
+        self.assertIs(sidx.match("/x"), sidx["/~*"])
+
+    def test_unresolved_refs(self):
+        sidx = pandata.SchemaIndex({"properties": {"a": {"$ref": "other.json#/a"}}})
+        self.assertEqual(sidx["/a"].subschemas, ({"$ref": "other.json#/a"},))
+
+
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
     unittest.main()
+
+
+class TestValidatorsCache(unittest.TestCase):
+    def setUp(self):
+        pandata._validators_cache.clear()
+
+    def test_same_or_equal_schema(self):
+        schema = {"type": "object", "properties": {"a": {"type": "integer"}}}
+        v1 = pandata._cached_PandelVisitor(schema)
+        self.assertIs(pandata._cached_PandelVisitor(schema), v1)
+        self.assertIs(pandata._cached_PandelVisitor(json.loads(json.dumps(schema))), v1)
+        self.assertIsNot(pandata._cached_PandelVisitor({"type": "object"}), v1)
+
+        v1.validate({"a": 1})
+        with self.assertRaises(pandata.ValidationError):
+            v1.validate({"a": "str"})
+
+    def test_unjsonable_schema(self):
+        schema = {"type": "object", "default": object()}
+        v1 = pandata._cached_PandelVisitor(schema)
+        self.assertIs(pandata._cached_PandelVisitor(schema), v1)
+        self.assertIsNot(pandata._cached_PandelVisitor(dict(schema)), v1)
+
+    def test_eviction(self):
+        schemas = [{"minimum": i} for i in range(pandata._VALIDATORS_CACHE_SIZE)]
+        v0 = pandata._cached_PandelVisitor(schemas[0])
+        for schema in schemas[1:]:
+            pandata._cached_PandelVisitor(schema)
+        self.assertLessEqual(
+            len(pandata._validators_cache), pandata._VALIDATORS_CACHE_SIZE
+        )
+        self.assertIsNot(pandata._cached_PandelVisitor({"minimum": 0}), v0)
+
+
+class TestVectorizedItems(unittest.TestCase):
+    def _errors(self, instance, schema):
+        errors = pandata.PandelVisitor(schema).iter_errors(instance)
+        return sorted((list(e.path), e.message, e.validator) for e in errors)
+
+    def test_same_errors_as_elementwise(self):
+        arr = np.array([-2.0, 0, 0.5, 3, np.nan, 7])
+        for draft, items in [
+            (4, {"type": "number", "minimum": 0, "maximum": 3}),
+            (4, {"minimum": 0, "exclusiveMinimum": True, "maximum": 3}),
+            (7, {"type": ["number", "null"], "exclusiveMaximum": 3}),
+            (7, {"type": "integer"}),
+            (7, {"type": "number", "enum": [0, 3]}),
+        ]:
+            schema = {
+                "$schema": "http://json-schema.org/draft-0%i/schema#" % draft,
+                "type": "array",
+                "items": items,
+            }
+            exp = self._errors(list(arr), schema)
+            self.assertTrue(exp, (draft, items))
+            self.assertEqual(self._errors(arr, schema), exp, (draft, items))
+            self.assertEqual(self._errors(pd.Series(arr), schema), exp, (draft, items))
+
+    def test_dataframe_columns(self):
+        df = pd.DataFrame({"a": np.arange(10), "b": np.arange(10) > 5})
+        schema = {
+            "type": "object",
+            "properties": {
+                "a": {"type": "array", "items": {"type": "integer", "maximum": 7}},
+                "b": {"type": "array", "items": {"type": "boolean"}},
+            },
+        }
+        errors = self._errors(df, schema)
+        self.assertEqual([e[0] for e in errors], [["a", 8], ["a", 9]])
+        self.assertEqual(errors[0][1], "8 is greater than the maximum of 7")
+
+
+class TestMergeSubmodels(unittest.TestCase):
+    def test_shares_untouched_branches(self):
+        df1 = pd.DataFrame({"x": np.arange(4.0), "y": np.arange(4.0)})
+        df2 = pd.DataFrame({"y": [np.nan, 10, np.nan, 11], "z": np.ones(4)})
+        lst = [{"a": 1}]
+        sub1 = {"df": df1, "lst": lst, "nested": {"k": 1, "only1": [1]}}
+        sub2 = {"df": df2, "nested": {"k": 2}, "only2": {"n": 0}}
+
+        mdl = pandata.Pandel()._clone_and_merge_submodels(
+            pandata.Pandel()._clone_and_merge_submodels(None, sub1), sub2
+        )
+
+        self.assertIs(mdl["lst"], lst)
+        self.assertIs(mdl["only2"], sub2["only2"])
+        self.assertIs(mdl["nested"]["only1"], sub1["nested"]["only1"])
+        self.assertIsNot(mdl["nested"], sub1["nested"])
+        self.assertEqual(mdl["nested"], {"k": 2, "only1": [1]})
+
+        df = mdl["df"]
+        self.assertEqual(list(df.columns), ["x", "y", "z"])
+        npt.assert_array_equal(df["y"], [0, 10, 2, 11])
+        self.assertTrue(np.shares_memory(df["x"].values, df1["x"].values))
+        self.assertTrue(np.shares_memory(df["z"].values, df2["z"].values))
+
+        ## Submodels untouched.
+        #
+        self.assertEqual(list(df1.columns), ["x", "y"])
+        npt.assert_array_equal(df1["y"], np.arange(4.0))
+        self.assertEqual(sub1["nested"], {"k": 1, "only1": [1]})
+
+    def test_frame_misaligned_extra_columns(self):
+        a = pd.DataFrame({"x": [1, 2]}, index=["r1", "r2"])
+        b = pd.DataFrame({"x": [5], "z": [3.0]}, index=["r2"])
+        m = pandata.Pandel()._clone_and_merge_submodels(a, b)
+        npt.assert_array_equal(m["x"], [1, 5])
+        npt.assert_array_equal(m["z"], [np.nan, 3.0])
+        self.assertEqual(list(m.index), ["r1", "r2"])
+
+    def _merge_peak_memory(self, nan_step):
+        import tracemalloc
+
+        nrows, ncols = 100000, 16
+        base = pd.DataFrame(np.random.rand(nrows, ncols))
+        layers = [{"df": base}]
+        for i in range(12):
+            col = np.random.rand(nrows)
+            if nan_step:
+                col[::nan_step] = np.nan
+            layers.append({"df": pd.DataFrame({i: col})})
+
+        merge = pandata.Pandel()._clone_and_merge_submodels
+        tracemalloc.start()
+        try:
+            mdl = ft.reduce(merge, layers)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        untouched = mdl["df"][ncols - 1].values
+        self.assertTrue(np.shares_memory(untouched, base[ncols - 1].values))
+        return peak / base[0].nbytes, mdl
+
+    def test_merge_memory_wholly_overridden_columns_shared(self):
+        peak_columns, mdl = self._merge_peak_memory(nan_step=None)
+        self.assertLess(peak_columns, 1)
+        npt.assert_array_equal(mdl["df"][0].isna().sum(), 0)
+
+    def test_merge_memory_copies_only_overridden_columns(self):
+        ## The merged frame owns the 12 overridden columns, not mutating `base`;
+        #  temporaries must stay below 2 columns (the old code peaked
+        #  above 18 columns, even though it mutated `base` in-place).
+        peak_columns, mdl = self._merge_peak_memory(nan_step=2)
+        self.assertLess(peak_columns, 14)
+        self.assertEqual(mdl["df"].isna().sum().sum(), 0)
+
+    def test_merge_nones(self):
+        with self.assertRaisesRegex(pandata.ValidationError, "Cannot merge Nones"):
+            pandata.Pandel()._clone_and_merge_submodels({"a": None}, {"a": None})
+
+
+class _NumbersModel(pandata.Pandel):
+    def _get_json_schema(self, is_prevalidation):
+        return {
+            "type": "object",
+            "additionalProperties": {"type": "number", "maximum": 10},
+        }
+
+
+class _DefaultsModel(pandata.Pandel):
+    def _get_json_schema(self, is_prevalidation):
+        return {
+            "type": "object",
+            "properties": {"d": {"type": "object", "default": {}}},
+            "additionalProperties": {"type": "number"},
+        }
+
+
+class TestPrevalidation(unittest.TestCase):
+    def test_errors_in_submodels_order(self):
+        for jobs in (None, 2):
+            mm = _NumbersModel(prevalidate_jobs=jobs)
+            for i in range(20):
+                mm.add_submodel({"n%i" % i: i, "s%i" % i: "str%i" % i})
+            errors = [e.message for e in mm.build_iter()]
+            self.assertEqual(len(errors), 20 + 9 + 1)
+            self.assertEqual(
+                errors[:2],
+                ["'str0' is not of type 'number'", "'str1' is not of type 'number'"],
+            )
+            self.assertIn("Gave-up building model after step 1.prevalidate", errors[-1])
+            self.assertIsNone(mm.model)
+
+    def test_valid(self):
+        mm = _NumbersModel()
+        for i in range(5):
+            mm.add_submodel({"n%i" % i: i})
+        self.assertEqual(mm.build(), {"n%i" % i: i for i in range(5)})
+
+    def test_in_processes_defaults_applied(self):
+        cache = pandata.ValidationCache()
+        nkeys = []
+        for _ in range(2):
+            mm = _DefaultsModel(prevalidate_jobs=2, validation_cache=cache)
+            mm.add_submodel({"a": 1})
+            mm.add_submodel({"b": 2})
+            self.assertEqual(mm.build(), {"a": 1, "b": 2, "d": {}})
+            nkeys.append(len(cache))
+        self.assertEqual(nkeys[0], nkeys[1])
+
+    def test_in_processes_unpicklable_submodels(self):
+        mm = _DefaultsModel(prevalidate_jobs=2)
+        mm.add_submodel({"a": 1, "d": {"f": lambda: 0}})
+        mm.add_submodel({"b": "x"})
+        errors = [e.message for e in mm.build_iter()]
+        self.assertEqual(errors[0], "'x' is not of type 'number'")
+        self.assertEqual(len(errors), 2)
+
+
+class _PropsModel(pandata.Pandel):
+    def _get_json_schema(self, is_prevalidation):
+        return {
+            "type": "object",
+            "properties": {
+                "a": {"type": "number", "maximum": 10},
+                "b": {"type": "object"},
+                "c": {"type": "string"},
+            },
+        }
+
+
+class TestRebuild(unittest.TestCase):
+    def _make_model(self):
+        calls = []
+
+        def cur_all(mm):
+            calls.append("all")
+
+        def cur_b(mm):
+            calls.append("b")
+
+        cur_b.input_paths = ["/b/x"]
+
+        mm = _PropsModel(curate_funcs=[cur_all, cur_b])
+        mm.add_submodel({"a": 1, "b": {"x": 1}})
+        mm.add_submodel({"b": {"y": 2}, "c": "s"})
+        self.assertEqual(mm.build(), {"a": 1, "b": {"x": 1, "y": 2}, "c": "s"})
+        self.assertEqual(calls, ["all", "b"])
+        calls.clear()
+
+        return mm, calls
+
+    def test_provenance(self):
+        mm, _ = self._make_model()
+        self.assertEqual(mm.model_provenance, {"/a": [0], "/b": [0, 1], "/c": [1]})
+
+    def test_rebuild_touched_keys_only(self):
+        mm, calls = self._make_model()
+        model = mm.model
+        b = model["b"]
+        mm.replace_submodel(1, {"b": {"y": 2}, "c": "t"})
+        self.assertEqual(mm.rebuild(), {"a": 1, "b": {"x": 1, "y": 2}, "c": "t"})
+        self.assertIs(mm.model["b"], b)
+        self.assertEqual(model["c"], "s")
+        self.assertEqual(calls, ["all"])
+
+        calls.clear()
+        mm.replace_submodel(0, {"b": {"x": 3}})
+        self.assertEqual(mm.rebuild(), {"b": {"x": 3, "y": 2}, "c": "t"})
+        self.assertEqual(calls, ["all", "b"])
+        self.assertEqual(mm.model_provenance, {"/b": [0, 1], "/c": [1]})
+
+    def test_rebuild_equals_build(self):
+        mm, _ = self._make_model()
+        mm.replace_submodel(0, {"a": 2, "b": {"x": 5, "z": 0}})
+        mm.add_submodel({"a": 3})
+        rebuilt = mm.rebuild()
+        self.assertEqual(rebuilt, mm.build())
+
+    def test_rebuild_errors(self):
+        mm, _ = self._make_model()
+        mm.replace_submodel(0, {"a": 11, "b": {}})
+        errors = [e.message for e in mm.rebuild_iter()]
+        self.assertEqual(errors[0], "11 is greater than the maximum of 10")
+        self.assertIn("after step 1.prevalidate", errors[-1])
+        self.assertIsNone(mm.model_provenance)
+
+        ## After failure, a full build is made.
+        mm.replace_submodel(0, {"a": 5})
+        self.assertEqual(mm.rebuild(), {"a": 5, "b": {"y": 2}, "c": "s"})
+        self.assertEqual(mm.model_provenance, {"/a": [0], "/b": [1], "/c": [1]})
+
+    def test_rebuild_inplace_edits_need_digests(self):
+        mm, calls = self._make_model()
+        self.assertTrue(
+            all(d is None for snap in mm._submodel_snapshots for _, d in snap.values())
+        )
+        mm._submodel_tuples[0][0]["b"]["x"] = 4
+        mm.rebuild()
+        self.assertEqual(mm.model["b"]["x"], 1)
+
+        mm.digest_submodels = True
+        mm.build()
+        calls.clear()
+        mm._submodel_tuples[0][0]["b"]["x"] = 5
+        self.assertEqual(mm.rebuild(), {"a": 1, "b": {"x": 5, "y": 2}, "c": "s"})
+        self.assertEqual(calls, ["all", "b"])
+
+    def test_rebuild_validates_changed_only(self):
+        mm, _ = self._make_model()
+        mm.replace_submodel(1, {"b": {"y": 2}, "c": 1})
+        errors = [e.message for e in mm.rebuild_iter()]
+        self.assertEqual(errors[0], "1 is not of type 'string'")
+
+
+class _CountingLazyModel(_PropsModel):
+    def __init__(self, *args, **kws):
+        super().__init__(*args, **kws)
+        self.reads = []
+
+    def _read_branch(self, source, fmt="AUTO", *opts):
+        self.reads.append(source)
+        return super()._read_branch(source, fmt, *opts)
+
+
+class TestLazyBranches(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def _fpath(self, fname):
+        return osp.join(self.tmpdir.name, fname)
+
+    def test_unused_branch_never_read(self):
+        npy = self._fpath("big.npy")
+        np.save(npy, np.arange(5))
+        mdl = {"b": {"x": 1}, "big": pandata.ModelOperations(inp=[npy])}
+        mm = _CountingLazyModel()
+        mm.add_submodel(mdl)
+        mm.build()
+        self.assertEqual(mm.reads, [])
+        self.assertIsInstance(mdl["big"], pandata.ModelOperations)
+
+        npt.assert_array_equal(mm.get("/big"), np.arange(5))
+        mm.get("/big")
+        self.assertEqual(mm.reads, [npy])
+
+    def test_validated_branch_read_once(self):
+        jfile = self._fpath("b.json")
+        with open(jfile, "wt") as fd:
+            json.dump({"x": 2}, fd)
+        mm = _CountingLazyModel()
+        mm.add_submodel({"a": 1, "b": {"$ref": jfile, "$inp": ["JSON"]}})
+        mm.add_submodel({"b": {"y": 3}})
+        self.assertEqual(mm.build(), {"a": 1, "b": {"x": 2, "y": 3}})
+        self.assertEqual(mm.reads, [jfile])
+
+    def test_plain_refs_are_data(self):
+        mm = _CountingLazyModel()
+        mm.add_submodel({"r": {"$ref": "#/b"}, "b": {"x": 1}})
+        mdl = mm.build()
+        self.assertEqual(mdl["r"], {"$ref": "#/b"})
+        self.assertEqual(mm.reads, [])
+
+    def test_built_views(self):
+        npy = self._fpath("v.npy")
+        np.save(npy, np.arange(3))
+        mm = _CountingLazyModel()
+        mm.add_submodel({"a": 1, "big": pandata.ModelOperations(inp=[npy])})
+        mdl = mm.build()
+        items = mdl.items()
+        self.assertNotIsInstance(items, list)
+        self.assertEqual(mm.reads, [])
+        self.assertEqual(len(items), 2)
+        mdl["c"] = 3
+        self.assertEqual(len(items), 3)
+        npt.assert_array_equal(dict(items)["big"], np.arange(3))
+        self.assertEqual(mm.reads, [npy])
+
+    def test_nested_and_overridden(self):
+        csv = self._fpath("t.csv")
+        pd.DataFrame({"A": [1, 2]}).to_csv(csv, index=False)
+        mm = _CountingLazyModel()
+        mm.add_submodel({"b": {"t": pandata.ModelOperations(inp=[csv])}})
+        mm.add_submodel({"b": {"u": 5}})
+        mm.build()
+        self.assertEqual(mm.get("/b/u"), 5)
+        self.assertEqual(mm.reads, [])
+
+        self.assertEqual(mm.get("/b/t/A/1"), 2)
+        self.assertEqual(mm.reads, [csv])
+
+        ## Overlapping branches must be read to merge.
+        mm = _CountingLazyModel()
+        mm.add_submodel({"b": {"t": pandata.ModelOperations(inp=[csv])}})
+        mm.add_submodel({"b": {"t": {"A": [3, 4]}}})
+        mm.build()
+        self.assertEqual(mm.reads, [csv])
+        self.assertEqual(mm.get("/b/t/A/1"), 4)
+
+    def test_reader_opts_parsed(self):
+        csv = self._fpath("t.csv")
+        pd.DataFrame({"A": [1, 2]}, index=["x", "y"]).to_csv(csv)
+        mm = _CountingLazyModel()
+        mm.add_submodel({"t": {"$ref": csv, "$inp": ["CSV", "index_col=0"]}})
+        mm.build()
+        self.assertEqual(mm.get("/t").index.tolist(), ["x", "y"])
+
+    def test_read_errors(self):
+        mm = _CountingLazyModel()
+        mm.add_submodel({"a": pandata.ModelOperations(inp=["missing.json"])})
+        errors = [e.message for e in mm.build_iter()]
+        self.assertIn("Reading branch(/a) from ['missing.json']", errors[0])
+        self.assertIn("after step 1.prevalidate", errors[-1])
+
+        mm = _CountingLazyModel()
+        mm.add_submodel({"d": pandata.ModelOperations(inp=["file.bad"])})
+        mm.build()
+        with self.assertRaisesRegex(ValueError, "Cannot guess format"):
+            mm.get("/d")
+
+
+class TestModelStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.dpath = self.tmpdir.name
+
+    def _model(self):
+        return {
+            "a": 1,
+            "s": "str",
+            "arr": np.arange(12.0).reshape(3, 4),
+            "sub": {
+                "sr": pd.Series([1, 2], index=["x", "y"], name="sr"),
+                "df": pd.DataFrame(np.ones((3, 2)), columns=["A", "B"]),
+                "mixed": pd.DataFrame(
+                    {
+                        "i": [1, 2],
+                        "f": [1.5, 2.5],
+                        "t": pd.date_range("2020", periods=2),
+                    }
+                ),
+                "objs": pd.DataFrame({"o": ["a", None]}),
+            },
+            "lst": [np.arange(2), {"b": np.int64(3)}],
+            "misc": {1, 2},
+            "empty": pd.DataFrame(),
+        }
+
+    def test_roundtrip(self):
+        model = self._model()
+        pandata.store_model(model, self.dpath)
+        for lazy in (True, False):
+            m2 = pandata.load_model(self.dpath, lazy=lazy)
+            self.assertEqual(m2["a"], 1)
+            self.assertEqual(m2["s"], "str")
+            npt.assert_array_equal(m2["arr"], model["arr"])
+            for k in ("sr",):
+                pd.testing.assert_series_equal(m2["sub"][k], model["sub"][k])
+            for k in ("df", "mixed", "objs"):
+                pd.testing.assert_frame_equal(m2["sub"][k], model["sub"][k])
+            npt.assert_array_equal(m2["lst"][0], np.arange(2))
+            self.assertEqual(m2["lst"][1], {"b": 3})
+            self.assertEqual(m2["misc"], {1, 2})
+            pd.testing.assert_frame_equal(m2["empty"], model["empty"])
+
+    def test_lazy_memmapped(self):
+        pandata.store_model(self._model(), self.dpath)
+        m2 = pandata.load_model(self.dpath)
+        branch = dict.__getitem__(m2, "arr")
+        self.assertFalse(branch.is_read)
+        self.assertIsInstance(m2["arr"], np.memmap)
+        self.assertTrue(branch.is_read)
+        ## Not copied from the read-only memmap.
+        self.assertFalse(m2["sub"]["df"].values.flags.writeable)
+        self.assertFalse(dict.__getitem__(m2["sub"], "mixed").is_read)
+
+        m3 = pandata.load_model(self.dpath, mmap_mode=None)
+        self.assertNotIsInstance(m3["arr"], np.memmap)
+
+    def test_lazy_paths(self):
+        pandata.store_model(self._model(), self.dpath)
+        m2 = pandata.load_model(self.dpath)
+        self.assertEqual(dict.__getitem__(m2, "arr").path, "/arr")
+        self.assertEqual(dict.__getitem__(m2["sub"], "sr").path, "/sub/sr")
+
+    def test_as_pandel_submodel(self):
+        pandata.store_model(
+            {"a": 2, "b": {"x": np.arange(3)}, "big": np.ones(4)}, self.dpath
+        )
+        mm = _CountingLazyModel()
+        mm.add_submodel(pandata.load_model(self.dpath))
+        mm.add_submodel({"c": "s"})
+        mm.build()
+        self.assertFalse(dict.__getitem__(mm.model, "big").is_read)
+        npt.assert_array_equal(mm.get("/big"), np.ones(4))
+
+    def test_bad_format(self):
+        with self.assertRaisesRegex(ValueError, "Unknown model-store format"):
+            pandata.store_model({}, self.dpath, fmt="bad")
+
+
+class TestValidationCache(unittest.TestCase):
+    schema = {
+        "type": "object",
+        "properties": {
+            "a": {"type": "array", "items": {"type": "number"}},
+            "b": {
+                "type": "object",
+                "properties": {"x": {"type": "string", "default": "dx"}},
+            },
+        },
+    }
+
+    def test_skips_passed_subtrees(self):
+        cache = pandata.ValidationCache()
+        pv = pandata.PandelVisitor(self.schema, validation_cache=cache)
+        pv.validate({"a": [1, 2]})
+        self.assertEqual(len(cache), 1)
+
+        ## Pretend a bad subtree has passed, to prove it is not descended.
+        salt = pandata._validation_salt(pv)
+        cache.add(
+            cache.key(self.schema["properties"]["a"], [1, "x"], salt, self.schema)
+        )
+        pv.validate({"a": [1, "x"]})
+        self.assertFalse(pv.is_valid({"a": [1, "y"]}))
+
+    def test_pandas_leaves(self):
+        cache = pandata.ValidationCache()
+        pv = pandata.PandelVisitor(self.schema, validation_cache=cache)
+        pv.validate({"a": pd.Series([1.0, 2.0])})
+        self.assertIn(
+            cache.key(
+                self.schema["properties"]["a"],
+                pd.Series([1.0, 2.0]),
+                pandata._validation_salt(pv),
+                self.schema,
+            ),
+            cache,
+        )
+        self.assertFalse(pv.is_valid({"a": pd.Series([1.0, "x"])}))
+        self.assertEqual(len(cache), 1)
+
+    def test_auto_defaults_still_applied(self):
+        cache = pandata.ValidationCache()
+        pv = pandata.PandelVisitor(self.schema, validation_cache=cache)
+        for _ in range(2):
+            mdl = {"b": {}}
+            pv.validate(mdl)
+            self.assertEqual(mdl, {"b": {"x": "dx"}})
+
+    def test_deep_defaults_still_applied(self):
+        schema = {
+            "properties": {
+                "p": {"properties": {"q": self.schema}},
+                "l": {"items": self.schema},
+            }
+        }
+        cache = pandata.ValidationCache()
+        pv = pandata.PandelVisitor(schema, validation_cache=cache)
+        for _ in range(2):
+            mdl = {"p": {"q": {"a": [1], "b": {}}}, "l": [{"b": {}}]}
+            pv.validate(mdl)
+            self.assertEqual(mdl["p"]["q"]["b"], {"x": "dx"})
+            self.assertEqual(mdl["l"], [{"b": {"x": "dx"}}])
+
+    def test_digests_once_per_pass(self):
+        schema = {"properties": {"p": {"properties": {"q": self.schema}}}}
+        cache = pandata.ValidationCache()
+        pv = pandata.PandelVisitor(schema, validation_cache=cache)
+        hasher = pd.util.hash_pandas_object
+        with patch.object(pd.util, "hash_pandas_object", wraps=hasher) as hash_mock:
+            pv.validate({"p": {"q": {"a": pd.Series([1.0, 2.0])}}})
+        self.assertEqual(hash_mock.call_count, 1)
+        self.assertEqual(len(cache), 3)
+
+    def test_persist(self):
+        with tempfile.TemporaryDirectory() as tdir:
+            fpath = osp.join(tdir, "vcache.json")
+            cache = pandata.ValidationCache(fpath)
+            pandata.PandelVisitor(self.schema, validation_cache=cache).validate(
+                {"a": [1, 2], "b": {"x": "s"}}
+            )
+            cache.save()
+
+            cache2 = pandata.ValidationCache(fpath)
+            self.assertEqual(list(cache2._keys), list(cache._keys))
+            self.assertEqual(len(cache2), 2)
+
+            with open(fpath, "wt") as fd:
+                fd.write("garbage")
+            self.assertEqual(len(pandata.ValidationCache(fpath)), 0)
+
+    def test_refs_keyed_by_root(self):
+        def schema(item_type):
+            return {
+                "definitions": {"n": {"type": "array", "items": {"type": item_type}}},
+                "properties": {"a": {"$ref": "#/definitions/n"}},
+            }
+
+        cache = pandata.ValidationCache()
+        pandata.PandelVisitor(schema("number"), validation_cache=cache).validate(
+            {"a": [1, 2]}
+        )
+        self.assertEqual(len(cache), 1)
+        pv = pandata.PandelVisitor(schema("string"), validation_cache=cache)
+        self.assertFalse(pv.is_valid({"a": [1, 2]}))
+
+    def test_keyed_by_format_checker(self):
+        from jsonschema import FormatChecker
+
+        schema = {"properties": {"a": {"items": {"type": "string", "format": "date"}}}}
+        mdl = {"a": ["2020-99-99"]}
+        cache = pandata.ValidationCache()
+        self.assertTrue(
+            pandata.PandelVisitor(schema, validation_cache=cache).is_valid(mdl)
+        )
+        pv = pandata.PandelVisitor(
+            schema, validation_cache=cache, format_checker=FormatChecker()
+        )
+        self.assertFalse(pv.is_valid(mdl))
+
+    def test_schema_digests_bounded(self):
+        cache = pandata.ValidationCache()
+        size = pandata._SCHEMA_DIGESTS_CACHE_SIZE
+        for i in range(size + 10):
+            cache.key({"const": i}, [i])
+        self.assertEqual(len(cache._schema_digests), size)
+
+    def test_eviction(self):
+        cache = pandata.ValidationCache(maxsize=2)
+        for key in "abc":
+            cache.add(key)
+        self.assertNotIn("a", cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_pandel_rebuild(self):
+        cache = pandata.ValidationCache()
+        mm = _PropsModel(validation_cache=cache)
+        mm.add_submodel({"a": 1, "b": {"x": 1}})
+        mm.build()
+        nkeys = len(cache)
+        self.assertGreater(nkeys, 0)
+
+        mm = _PropsModel(validation_cache=cache)
+        mm.add_submodel({"a": 1, "b": {"x": 1}})
+        mm.build()
+        self.assertEqual(len(cache), nkeys)
+
+        mm = _PropsModel(validation_cache=cache)
+        mm.add_submodel({"a": 11, "b": {"x": 1}})
+        self.assertEqual(len(list(mm.build_iter())), 2)
+
+
+class _ColumnModel(pandata.Pandel):
+    def _get_json_schema(self, is_prevalidation):
+        return {
+            "type": "object",
+            "properties": {
+                "df": {
+                    "type": "object",
+                    "properties": {"x": {"items": {"type": "number", "maximum": 0}}},
+                },
+                "l": {"items": {"type": "string"}},
+            },
+        }
+
+
+class TestBoundedErrors(unittest.TestCase):
+    def _messages(self, errors):
+        return [(list(e.path), e.message) for e in errors]
+
+    def test_branch_errors_vectorized(self):
+        pv = pandata.PandelVisitor({"items": {"maximum": 0}}, max_branch_errors=2)
+        errors = self._messages(pv.iter_errors(np.ones(10**6)))
+        self.assertEqual(
+            errors,
+            [
+                ([0], "1.0 is greater than the maximum of 0"),
+                ([1], "1.0 is greater than the maximum of 0"),
+                (
+                    [],
+                    "Stopped validating items after 2 errors, out of 1000000 suspect ones.",
+                ),
+            ],
+        )
+
+    def test_branch_errors_elementwise(self):
+        pv = pandata.PandelVisitor({"items": {"type": "string"}}, max_branch_errors=1)
+        errors = self._messages(pv.iter_errors([1, 2, 3]))
+        self.assertEqual(
+            errors,
+            [
+                ([0], "1 is not of type 'string'"),
+                ([], "Stopped validating items after 1 errors."),
+            ],
+        )
+        self.assertEqual(
+            len(
+                list(
+                    pandata.PandelVisitor({"items": {"type": "string"}}).iter_errors(
+                        [1, 2, 3]
+                    )
+                )
+            ),
+            3,
+        )
+
+    def test_examples_per_schema_path(self):
+        pv = pandata.PandelVisitor({"items": {"type": "string", "minLength": 2}})
+        errors = pandata.iter_errors_bounded(
+            pv.iter_errors([1, "a", 2, "b", 3, "cc"]), max_examples=1
+        )
+        self.assertEqual(
+            self._messages(errors),
+            [
+                ([0], "1 is not of type 'string'"),
+                ([1], "'a' is too short"),
+                ([], "2 more errors like: 1 is not of type 'string'"),
+                ([], "1 more errors like: 'a' is too short"),
+            ],
+        )
+
+    def test_max_errors_stops_consuming(self):
+        consumed = []
+
+        def errors():
+            for i in range(100):
+                consumed.append(i)
+                yield pandata.ValidationError("err%i" % i)
+
+        msgs = [e.message for e in pandata.iter_errors_bounded(errors(), max_errors=3)]
+        self.assertEqual(
+            msgs, ["err0", "err1", "err2", "Gave-up validating after 3 errors."]
+        )
+        self.assertEqual(len(consumed), 4)
+
+    def test_pandel_budgets(self):
+        mm = _ColumnModel(max_errors=50, max_error_examples=2, max_branch_errors=10)
+        mm.add_submodel(
+            {"df": pd.DataFrame({"x": np.ones(10**6)}), "l": list(range(10**5))}
+        )
+        errors = self._messages(mm.build_iter())
+        self.assertEqual(
+            errors,
+            [
+                (["df", "x", 0], "1.0 is greater than the maximum of 0"),
+                (["df", "x", 1], "1.0 is greater than the maximum of 0"),
+                (
+                    ["df", "x"],
+                    "Stopped validating items after 10 errors, out of 1000000 suspect ones.",
+                ),
+                (["l", 0], "0 is not of type 'string'"),
+                (["l", 1], "1 is not of type 'string'"),
+                (["l"], "Stopped validating items after 10 errors."),
+                (
+                    ["df", "x"],
+                    "8 more errors like: 1.0 is greater than the maximum of 0",
+                ),
+                (["l"], "8 more errors like: 1 is not of type 'string'"),
+                ([], "Gave-up building model after step 1.prevalidate (out of 4)."),
+            ],
+        )
+
+
+class TestCoerceDtypes(unittest.TestCase):
+    schema = {
+        "type": "object",
+        "properties": {
+            "f": {"type": "array", "items": {"type": "number"}},
+            "i": {"type": "array", "items": {"type": "integer"}},
+            "b": {"type": "array", "items": {"type": "boolean"}},
+            "d": {"type": "array", "items": {"type": "string", "format": "date-time"}},
+            "s": {"type": "array", "items": {"type": "string"}},
+            "n": {"type": "array", "items": {"type": ["number", "null"]}},
+        },
+    }
+
+    def _frame(self, **cols):
+        return pd.DataFrame({k: np.array(v, dtype=object) for k, v in cols.items()})
+
+    def test_frame_columns(self):
+        df = self._frame(
+            f=[1, 2.5],
+            i=[1, 2],
+            b=[True, False],
+            d=["2019-01-02 10:00", "2019-01-03"],
+            s=["a", "b"],
+            n=[1.0, None],
+        )
+        pv = pandata.PandelVisitor(self.schema, coerce_dtypes=True)
+        pv.validate(df)
+        self.assertEqual(
+            {k: dt.kind for k, dt in df.dtypes.items()},
+            {"f": "f", "i": "i", "b": "b", "d": "M", "s": "O", "n": "f"},
+        )
+        self.assertTrue(np.isnan(df["n"][1]))
+        pv.validate(df)  # Coerced columns still valid.
+
+    def test_disabled_by_default(self):
+        df = self._frame(f=[1.0, 2.0])
+        pandata.PandelVisitor(self.schema).validate(df)
+        self.assertEqual(df["f"].dtype, object)
+
+    def test_invalid_left_intact(self):
+        df = self._frame(f=[1.0, None], i=[1, 2.5], d=["2019-01-02", 3])
+        pv = pandata.PandelVisitor(self.schema, coerce_dtypes=True)
+        errors = sorted((list(e.path), e.message) for e in pv.iter_errors(df))
+        self.assertEqual(
+            errors,
+            [
+                (["d", 1], "3 is not of type 'string'"),
+                (["f", 1], "None is not of type 'number'"),
+                (["i", 1], "2.5 is not of type 'integer'"),
+            ],
+        )
+        self.assertTrue((df.dtypes == object).all())
+
+    def test_coerced_dates_revalidated(self):
+        schema = {
+            "properties": {
+                "d": {
+                    "type": "array",
+                    "minItems": 2,
+                    "items": {"type": "string", "format": "date"},
+                }
+            }
+        }
+        pv = pandata.PandelVisitor(schema, coerce_dtypes=True)
+        mdl = {"d": np.array(["2019-01-02", "2019-01-03"], dtype=object)}
+        pv.validate(mdl)
+        self.assertEqual(mdl["d"].dtype.kind, "M")
+        pv.validate(mdl)
+
+        mdl["d"] = mdl["d"][:1]
+        errors = [e.message for e in pv.iter_errors(mdl)]
+        self.assertEqual(len(errors), 1)
+        self.assertIn("is too short", errors[0])
+
+        mdl["d"] = np.array(["2019-01-02", "2019-01-03"], dtype="datetime64[ns]")
+        self.assertFalse(pv.is_valid(mdl))
+
+    def test_arrays_in_mappings(self):
+        mdl = {"f": np.array([1.0, 2.0], dtype=object), "s": ["a"]}
+        pandata.PandelVisitor(self.schema, coerce_dtypes=True).validate(mdl)
+        self.assertIsInstance(mdl["f"], np.ndarray)
+        self.assertEqual(mdl["f"].dtype, float)
+        self.assertEqual(mdl["s"], ["a"])
+
+    def test_pandel(self):
+        class _CoercedModel(pandata.Pandel):
+            def _get_json_schema(_self, is_prevalidation):
+                return {"properties": {"df": self.schema}}
+
+        mm = _CoercedModel(coerce_dtypes=True)
+        mm.add_submodel(
+            {"df": self._frame(f=[1.0, 2.0], d=["2019-01-02", "2019-01-03"])}
+        )
+        mdl = mm.build()
+        self.assertEqual(mdl["df"]["f"].dtype, float)
+        self.assertEqual(mdl["df"]["d"].dtype.kind, "M")
+
+
+class TestUnits(unittest.TestCase):
+    def test_parse_unique_headers_once(self):
+        pandata._parse_header_with_units.cache_clear()
+        headers = ["a [m]", "b [s]"] * 100
+        united = pandata.parse_headers_with_units(headers)
+        self.assertEqual(united[-1], ("b", "s"))
+        self.assertEqual(pandata._parse_header_with_units.cache_info().misses, 2)
+
+    def test_convert_to_base_units(self):
+        df = pd.DataFrame(
+            {
+                "v [km/h]": [36, 72],
+                "t <min>": [1.0, 2],
+                "x [m]": [1, 2],
+                "s [s]": ["a", "b"],
+            }
+        )
+        orig = df.copy()
+        conv = pandata.convert_frame_units(df)
+        self.assertEqual(list(conv.columns), ["v [m/s]", "t [s]", "x [m]", "s [s]"])
+        npt.assert_allclose(conv["v [m/s]"], [10, 20])
+        npt.assert_allclose(conv["t [s]"], [60, 120])
+        self.assertEqual(conv["x [m]"].dtype, df["x [m]"].dtype)
+        self.assertEqual(list(conv["s [s]"]), ["a", "b"])
+        pd.testing.assert_frame_equal(df, orig)
+        for c in ("x [m]", "s [s]"):
+            self.assertTrue(np.shares_memory(conv[c].values, df[c].values))
+
+    def test_aliased_units_intact(self):
+        df = pd.DataFrame({"a [m/s^2]": [1.0, 2.0], "v [km/h]": [36, 72]})
+        conv = pandata.convert_frame_units(df)
+        self.assertEqual(list(conv.columns), ["a [m/s^2]", "v [m/s]"])
+        self.assertTrue(
+            np.shares_memory(conv["a [m/s^2]"].values, df["a [m/s^2]"].values)
+        )
+        pd.testing.assert_frame_equal(
+            pandata.convert_frame_units(df[["a [m/s^2]"]]), df[["a [m/s^2]"]]
+        )
+
+    def test_convert_by_name_and_quantity(self):
+        df = pd.DataFrame({"v [m/s]": [1.0], "w [m/s]": [1.0], "E [J]": [3600.0]})
+        conv = pandata.convert_frame_units(df, {"v": "km/h", "energy": "Wh"})
+        self.assertEqual(list(conv.columns), ["v [km/h]", "w [m/s]", "E [Wh]"])
+        npt.assert_allclose(conv.to_numpy(), [[3.6, 1.0, 1.0]])
+
+    def test_custom_table(self):
+        table = dict(pandata.UNITS_TABLE, inch=("length", 0.0254))
+        conv = pandata.convert_frame_units(
+            pd.DataFrame({"d [inch]": [100]}), units_table=table
+        )
+        npt.assert_allclose(conv["d [m]"], [2.54])
+
+    def test_incompatible_units(self):
+        df = pd.DataFrame({"v [km/h]": [1.0]})
+        with self.assertRaisesRegex(ValueError, "Incompatible units"):
+            pandata.convert_frame_units(df, {"v": "kg"})
+        with self.assertRaisesRegex(ValueError, "Unknown units"):
+            pandata.convert_frame_units(df, {"v": "furlong/fortnight"})
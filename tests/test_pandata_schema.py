@@ -161,6 +161,23 @@ def test_auto_default_auto_remove(schema, instance, exp, schema_prop, init_arg):
             assert exp == instance["prop"]
 
 
+def test_auto_defaults_many_objects():
+    props = {
+        "a": {"type": "number", "default": 1},
+        "b": {"type": "number", "default": 2, "autoDefaultNull": True},
+        "c": {"type": "number", "autoRemoveNull": True},
+        "d": {"default": None, "autoRemoveNull": True},
+    }
+    schema = {"type": "array", "items": {"type": "object", "properties": props}}
+    instance = [{}, {"b": None, "c": None}, {"a": 5, "b": 6, "c": 7, "d": None}]
+    validate(instance, schema)
+    assert instance == [
+        {"a": 1, "b": 2, "d": None},
+        {"b": 2, "a": 1, "d": None},
+        {"a": 5, "b": 6, "c": 7},
+    ]
+
+
 class TestValidationErrorMessages(unittest.TestCase):
     def message_for(self, instance, schema, *args, **kwargs):
         with self.assertRaises(ValidationError) as e:
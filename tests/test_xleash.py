@@ -10,17 +10,21 @@
 
 import contextlib
 import doctest
+import importlib.util
+import io
 import itertools as itt
 import json
 import logging
 import os
 import os.path as osp
+import socket
 import sys
 import tempfile
+import threading
 import unittest
 from collections import ChainMap
 from datetime import datetime
-from unittest.mock import MagicMock, sentinel
+from unittest.mock import MagicMock, patch, sentinel
 
 import ddt
 import numpy as np
@@ -1387,6 +1391,97 @@ class T10SheetManager(unittest.TestCase):
             sf._open_sheet.call_count, open_calls, sf._open_sheet.mock_calls
         )
 
+    def _reopen_tracked(self, sf, arr):
+        sheet = _s.ArraySheet(arr, _s.SheetId("wb", ["sh", 0]))
+        sheet.read_rect = MagicMock(name="read_rect", side_effect=sheet.read_rect)
+        sf.close_book("wb")
+        sf.add_sheet(sheet)
+
+        return sheet
+
+    def test_track_changes_reuses_unchanged_captures(self):
+        sf = _s.SheetsFactory(track_changes=True)
+        ranger = _l.make_default_Ranger(sf)
+        xlrefs = ("wb#sh!A1:A2", "wb#sh!B1:B2", "wb#sh!B1:..(D)")
+        self._reopen_tracked(sf, [[1, 2], [3, 4]])
+        self.assertEqual(
+            [ranger.do_lasso(xlref).values for xlref in xlrefs],
+            [[[1], [3]], [[2], [4]], [[2], [4]]],
+        )
+
+        sheet = self._reopen_tracked(sf, [[1, 2], [3, 5]])
+        self.assertEqual(
+            [ranger.do_lasso(xlref).values for xlref in xlrefs],
+            [[[1], [3]], [[2], [5]], [[2], [5]]],
+        )
+        self.assertEqual(sheet.read_rect.call_count, 2)
+
+        ## Identical sheet re-opened, mutated values not shared.
+        #
+        sheet = self._reopen_tracked(sf, [[1, 2], [3, 5]])
+        lasso = ranger.do_lasso(xlrefs[0])
+        lasso.values.append("garbage")
+        self.assertEqual(ranger.do_lasso(xlrefs[0]).values, [[1], [3]])
+        self.assertEqual(sheet.read_rect.call_count, 0)
+
+    def test_track_changes_states_changed(self):
+        sf = _s.SheetsFactory(track_changes=True)
+        ranger = _l.make_default_Ranger(sf)
+        self._reopen_tracked(sf, [[1, 2], [3, 4]])
+        self.assertEqual(ranger.do_lasso("wb#sh!A1:..(D)").values, [[1], [3]])
+
+        sheet = self._reopen_tracked(sf, [[1, 2], [3, 4], [5, None]])
+        self.assertEqual(ranger.do_lasso("wb#sh!A1:..(D)").values, [[1], [3], [5]])
+        self.assertEqual(sheet.read_rect.call_count, 1)
+
+    def test_track_changes_bounded(self):
+        sf = _s.SheetsFactory(track_changes=True, max_captures=2)
+        ranger = _l.make_default_Ranger(sf)
+        self._reopen_tracked(sf, [[1, 2], [3, 4]])
+        for xlref in ("wb#sh!A1", "wb#sh!B1", "wb#sh!A2"):
+            ranger.do_lasso(xlref)
+        self.assertEqual(len(sf._tracked_captures), 2)
+
+        sheet = self._reopen_tracked(sf, [[1, 2], [3, 4]])
+        self.assertEqual(ranger.do_lasso("wb#sh!A2").values, 3)
+        self.assertEqual(sheet.read_rect.call_count, 0)
+        self.assertEqual(ranger.do_lasso("wb#sh!A1").values, 1)
+        self.assertEqual(sheet.read_rect.call_count, 1)
+
+    def test_untracked_forgotten_on_close(self):
+        sf = _s.SheetsFactory(track_changes=True)
+        ranger = _l.make_default_Ranger(sf)
+        self._reopen_tracked(sf, [[1, 2], [3, 4]])
+        ranger.do_lasso("wb#sh!A1:B2")
+        sf.close_book("wb")
+        self.assertEqual(len(sf._tracked_captures), 1)
+
+        sf.track_changes = False
+        sf.close_book("wb")
+        self.assertEqual(sf._tracked_sheets, {})
+        self.assertEqual(len(sf._tracked_captures), 0)
+
+    def test_no_track_changes(self):
+        sf = _s.SheetsFactory()
+        ranger = _l.make_default_Ranger(sf, lean=True)
+        self._reopen_tracked(sf, [[1, 2], [3, 4]])
+        ranger.do_lasso("wb#sh!A1:B2")
+        sheet = self._reopen_tracked(sf, [[1, 2], [3, 4]])
+        self.assertEqual(ranger.do_lasso("wb#sh!A1:B2").values, [[1, 2], [3, 4]])
+        self.assertEqual(sheet.read_rect.call_count, 1)
+        self.assertEqual(sf._tracked_sheets, {})
+
+    def test_fingerprint(self):
+        fp1 = _s.ArraySheet([[1, 2], [3, None]]).get_fingerprint()
+        fp2 = _s.ArraySheet([[1, 2], [3, None]]).get_fingerprint()
+        fp3 = _s.ArraySheet([[1, 2], [True, None]]).get_fingerprint()
+        self.assertEqual(fp1.states_digest, fp3.states_digest)
+        self.assertEqual(fp1.digest, fp2.digest)
+        self.assertNotEqual(fp1.digest, fp3.digest)
+        npt.assert_array_equal(
+            fp1.cells_digest != fp3.cells_digest, [[False, False], [True, False]]
+        )
+
 
 @ddt.ddt
 class T11Redim(unittest.TestCase):
@@ -1589,6 +1684,42 @@ class T13Ranger(unittest.TestCase):
         res12 = ranger.do_lasso("wb1#sh1!:")
         self.assertEqual(res11, res12)
 
+    def test_lean_same_as_normal(self):
+        sheet = _s.ArraySheet([[None, 1, 2], [None, 3, 4]])
+        xlrefs = [
+            "#B1",
+            "#A1(DR):..(DR)",
+            '#A1(DR):..(DR):["redim", {"table": [2, 1]}]',
+            '#A1(DR):..(DR):{"opts": {"verbose": true}, "func": "numpy"}',
+        ]
+        normal = _l.make_default_Ranger()
+        lean = _l.make_default_Ranger(lean=True)
+        for xlref in xlrefs * 2:
+            exp = normal.do_lasso(xlref, sheet=sheet)
+            res = lean.do_lasso(xlref, sheet=sheet)
+            npt.assert_array_equal(res.values, exp.values)
+            self.assertEqual(dict(res.opts), dict(exp.opts))
+            self.assertEqual((res.st, res.nd), (exp.st, exp.nd))
+        self.assertIsNone(lean.intermediate_lasso)
+        self.assertGreaterEqual(_l._parse_xlref_fields.cache_info().hits, len(xlrefs))
+
+    def test_lean_opts_copy_on_write(self):
+        base_opts = {"lax": False, "read": {"on_demand": True}}
+        ranger = _l.Ranger(_s.SheetsFactory(), base_opts, lean=True)
+        sheet = _s.ArraySheet([[1, 2], [3, 4]])
+        res = ranger.do_lasso("#A1", sheet=sheet)
+        res.opts["lax"] = True
+        self.assertIs(res.opts["read"], base_opts["read"])
+        self.assertEqual(base_opts["lax"], False)
+
+    def test_lean_cached_lax_kwds_not_mutated(self):
+        sheet = _s.ArraySheet([[1, 2], [3, 4]])
+        ranger = _l.make_default_Ranger(lean=True)
+        xlref = '#A1:B2:["bad_func", {"lax": true}]'
+        for _ in range(2):
+            res = ranger.do_lasso(xlref, sheet=sheet)
+            self.assertEqual(res.values, [[1, 2], [3, 4]])
+
 
 @ddt.ddt
 class T14Lasso(unittest.TestCase):
@@ -1955,6 +2086,55 @@ class T15Recursive(unittest.TestCase):
         for v in missing:
             self.assertNotIn(v, str(res))
 
+    def test_expandDFs_visits_only_str_cells(self):
+        df = pd.DataFrame(
+            {"nums": np.arange(5.0), "objs": [1, "a", None, "b", 2.2]},
+            index=list("ABCDE"),
+        )
+        visited = []
+
+        def elfunc(ranger, lasso, context, elval):
+            visited.append((elval, context.base_coords))
+            return True, elval.upper()
+
+        elfunc.element_types = (str,)
+        ranger = _l.Ranger(_s.SheetsFactory(), available_filters={})
+        lasso = Lasso(values=df, st=Coords(10, 20), opts={})
+        res = _f.run_filter_elementwise(ranger, lasso, elfunc, ()).values
+
+        self.assertEqual(visited, [("a", (11, 21)), ("b", (13, 21))])
+        self.assertEqual(res["objs"].tolist(), [1, "A", None, "B", 2.2])
+        self.assertEqual(res["nums"].dtype, np.float64)
+        self.assertEqual(res.index.tolist(), list("ABCDE"))
+
+    def test_expandSeries_IncExcFilters(self):
+        sr = pd.Series(["a", "b", "c"], index=["k1", "k2", "k3"])
+        ranger = _l.Ranger(_s.SheetsFactory(), available_filters={})
+        ranger.do_lasso = MagicMock(
+            name="do_lasso()", return_value=Lasso(values=sentinel.BINGO)
+        )
+        lasso = Lasso(values=sr, opts={})
+        res = _f.recursive_filter(ranger, lasso, include=["k1", "k3"], exclude="k3")
+        self.assertEqual(res.values.tolist(), [sentinel.BINGO, "b", "c"])
+
+    def test_vectorized_element_func(self):
+        df = pd.DataFrame({"a": np.arange(3), "b": np.arange(3) * 10})
+        blocks = []
+
+        def elfunc(ranger, lasso, context, elval):
+            if isinstance(elval, pd.Series):
+                blocks.append((elval.name, context.base_coords))
+                return True, elval * 2
+            return False, elval
+
+        elfunc.vectorized = True
+        ranger = _l.Ranger(_s.SheetsFactory(), available_filters={})
+        lasso = Lasso(values=df, st=Coords(1, 1), opts={})
+        res = _f.run_filter_elementwise(ranger, lasso, elfunc, ()).values
+
+        self.assertEqual(blocks, [("a", (1, 1)), ("b", (1, 2))])
+        self.assertEqual(res.values.tolist(), [[0, 0], [2, 20], [4, 40]])
+
 
 @ddt.ddt
 class T16Eval(unittest.TestCase, _tutils.CustomAssertions):
@@ -2082,6 +2262,17 @@ class T17RealFile(unittest.TestCase, _tutils.CustomAssertions):
         shnames = shfac.list_sheetnames(fpath)
         self.assertEqual(shnames, ["2", "3", "Sheet4", "eval sheet", "e2"])
 
+    def test_real_file_fingerprint(self):
+        fpath = osp.abspath("tests/recursive.xlsx")
+        with _s.SheetsFactory() as sf:
+            sheet = sf.fetch_sheet(fpath, "Sheet4")
+            fp = sheet.get_fingerprint()
+            self.assertEqual(fp.cells_digest.shape, sheet.get_states_matrix().shape)
+            sf.close_book(fpath)
+            fp2 = sf.fetch_sheet(fpath, "Sheet4").get_fingerprint()
+            self.assertIsNot(fp2, fp)
+            self.assertEqual(fp2.digest, fp.digest)
+
     def test_real_absolute_file(self):
         fpath = osp.abspath("tests/recursive.xlsx")
         res = _l.lasso("%s#%s" % (fpath, _recurse_rect))
@@ -2335,3 +2526,278 @@ class T20VsXlwings(unittest.TestCase):
         dims = _f.xlwings_dims_call_spec()
         xleash_res = _l.lasso(xlref % dims, sheet=self.sheet)
         self.assertEqual(xleash_res, xlwings_res)
+
+
+class T21Server(unittest.TestCase):
+    def _start(self, address):
+        from pandalone.xleash import _server
+
+        srv = _server.make_server(address)
+        srv.ranger.sheets_factory.add_sheet(
+            _s.ArraySheet([[1, 2], [3, None]]), wb_ids="wb1", sh_ids="Sheet1"
+        )
+        thread = threading.Thread(target=srv.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(srv.server_close)
+        self.addCleanup(srv.shutdown)
+
+        return srv
+
+    def _check_batch(self, srv):
+        from pandalone.xleash import _server
+
+        xlrefs = ["wb1#Sheet1!A1:B1", "wb1#Sheet1!B1", '#:"dict"', "wb1#Sheet1!:"]
+        res = _server.lasso_remote(xlrefs, srv.server_address, lax=True)
+        npt.assert_array_equal(res[0], [[1, 2]])
+        self.assertEqual(res[1], 2)
+        self.assertIsNone(res[2])
+        self.assertEqual(res[3], [[1, 2], [3, None]])
+
+        with self.assertRaisesRegex(ValueError, "Remote-lassoing xl-ref"):
+            _server.lasso_remote(xlrefs, srv.server_address)
+
+    def test_tcp(self):
+        srv = self._start(("localhost", 0))
+        self._check_batch(srv)
+
+    @unittest.skipIf(not hasattr(socket, "AF_UNIX"), "No Unix domain-sockets.")
+    def test_unix_socket(self):
+        sock_path = osp.join(tempfile.mkdtemp(), "xleash.sock")
+        srv = self._start(sock_path)
+        self._check_batch(srv)
+
+    def test_mixed_values_not_coerced(self):
+        from pandalone.xleash import _server
+
+        srv = self._start(("localhost", 0))
+        sf = srv.ranger.sheets_factory
+        sheet = _s.ArraySheet(
+            np.array([["a", 1.5], ["b", 2]], dtype=object),
+            ids=_s.SheetId("wb2", ["S", 0]),
+        )
+        sf.add_sheet(sheet)
+        sheet = _s.ArraySheet(
+            np.array([[1, True]], dtype=object), ids=_s.SheetId("wb3", ["S", 0])
+        )
+        sf.add_sheet(sheet)
+
+        res = _server.lasso_remote(["wb2#S!:", "wb3#S!:"], srv.server_address)
+        self.assertEqual(res, [[["a", 1.5], ["b", 2]], [[1, True]]])
+        self.assertIsInstance(res[1][0][1], bool)
+
+    def test_pack_doctest(self):
+        from pandalone.xleash import _pack
+
+        failure_count, test_count = doctest.testmod(
+            _pack, optionflags=doctest.NORMALIZE_WHITESPACE | doctest.ELLIPSIS
+        )
+        self.assertGreater(test_count, 0, (failure_count, test_count))
+        self.assertEqual(failure_count, 0, (failure_count, test_count))
+
+    def test_invalidate_changed_books(self):
+        from pandalone.xleash import _server
+
+        srv = self._start(("localhost", 0))
+        sf = srv.ranger.sheets_factory
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as fp:
+            fpath = fp.name
+        self.addCleanup(os.unlink, fpath)
+        sheet = _s.ArraySheet([[7]], ids=_s.SheetId("wb2", ["sh", 0]))
+        sf.add_sheet(sheet, wb_ids=fpath, sh_ids="Sheet1")
+
+        xlref = "%s#Sheet1!A1" % fpath
+        self.assertEqual(_server.lasso_remote([xlref], srv.server_address), [7])
+        self.assertEqual(_server.lasso_remote([xlref], srv.server_address), [7])
+
+        st = os.stat(fpath)
+        os.utime(fpath, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+        self.assertEqual(
+            _server.lasso_remote([xlref], srv.server_address, lax=True), [None]
+        )
+        self.assertNotIn(fpath, sf._cached_sheets)
+        self.assertIn("wb1", sf._cached_sheets)
+
+
+class T22Extract(unittest.TestCase):
+    def setUp(self):
+        import shutil
+
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.book = osp.join(self.tmpdir, "book.xlsx")
+        shutil.copy(osp.join(mydir, "recursive.xlsx"), self.book)
+        self.manifest = osp.join(self.tmpdir, "refs.csv")
+        with open(self.manifest, "wt") as fd:
+            fd.write("name,xlref\n")
+            fd.write("ev,%s#%s\n" % (self.book, _recurse_rect))
+            fd.write("bad,%s#BAD_SHEET!A1\n" % self.book)
+        self.out_dir = osp.join(self.tmpdir, "out")
+
+    def _run(self, *args):
+        from pandalone.__main__ import main
+
+        with contextlib.redirect_stdout(io.StringIO()) as stdout:
+            exit_code = main(["xleash", "extract", "-o", self.out_dir] + list(args))
+        return exit_code, stdout.getvalue()
+
+    def test_read_manifest(self):
+        from pandalone.xleash import _extract
+
+        refs = _extract.read_manifest(self.manifest)
+        self.assertEqual([n for n, _ in refs], ["ev", "bad"])
+
+    def test_extract_and_skip_unchanged(self):
+        exit_code, out = self._run("-j", "0", self.manifest)
+        self.assertEqual(exit_code, 1, out)
+        self.assertRegex(out, r"s ok +ev: ")
+        self.assertRegex(out, r"s failed +bad: ")
+        with np.load(osp.join(self.out_dir, "ev.npz"), allow_pickle=False) as npz:
+            npt.assert_array_equal(npz["values"], _recurse_val)
+
+        _exit_code, out = self._run("-j", "0", self.manifest)
+        self.assertRegex(out, r"s skipped +ev: ")
+        self.assertRegex(out, r"s failed +bad: ")
+
+        st = os.stat(self.book)
+        os.utime(self.book, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+        _exit_code, out = self._run("-j", "0", self.manifest)
+        self.assertRegex(out, r"s ok +ev: ")
+
+        _exit_code, out = self._run("-j", "0", "--force", self.manifest)
+        self.assertRegex(out, r"s ok +ev: ")
+
+    def test_write_frame_npz_per_column(self):
+        from pandalone.xleash import _extract
+
+        df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"], 3: [1.5, 2.5]})
+        fpath = osp.join(self.tmpdir, "df.npz")
+        _extract._write_values(df, fpath, "npz")
+        with np.load(fpath, allow_pickle=False) as npz:
+            self.assertEqual(
+                sorted(npz.files), ["col_0", "col_1", "col_2", "columns", "index"]
+            )
+            npt.assert_array_equal(npz["columns"], ["a", "b", "3"])
+            npt.assert_array_equal(npz["index"], [0, 1])
+            npt.assert_array_equal(npz["col_0"], [1, 2])
+            npt.assert_array_equal(npz["col_1"], ["x", "y"])
+            npt.assert_array_equal(npz["col_2"], [1.5, 2.5])
+
+        _extract._write_values([[1, "a"]], fpath, "npz")
+        with np.load(fpath, allow_pickle=True) as npz:
+            self.assertEqual(npz["values"].item(), [[1, "a"]])
+
+    @unittest.skipIf(
+        importlib.util.find_spec("pyarrow") is None, "Feather needs pyarrow."
+    )
+    def test_write_frame_feather_keeps_index(self):
+        from pandalone.xleash import _extract
+
+        df = pd.DataFrame({"a": [1, 2]}, index=pd.Index([10, 20], name="i"))
+        fpath = osp.join(self.tmpdir, "df.feather")
+        _extract._write_values(df, fpath, "feather")
+        rdf = pd.read_feather(fpath).set_index("i")
+        assert_frame_equal(rdf, df)
+
+    def test_extract_process_pool(self):
+        exit_code, out = self._run("-j", "2", self.manifest)
+        self.assertEqual(exit_code, 1, out)
+        self.assertRegex(out, r"s ok +ev: ")
+        self.assertTrue(osp.isfile(osp.join(self.out_dir, "ev.npz")))
+
+
+class T23Plan(unittest.TestCase):
+    def test_doctest(self):
+        from pandalone.xleash import _plan
+
+        failure_count, test_count = doctest.testmod(
+            _plan, optionflags=doctest.NORMALIZE_WHITESPACE | doctest.ELLIPSIS
+        )
+        self.assertGreater(test_count, 0, (failure_count, test_count))
+        self.assertEqual(failure_count, 0, (failure_count, test_count))
+
+    def _make_plan(self, arr, xlrefs):
+        from pandalone.xleash import _plan
+
+        sf = _s.SheetsFactory()
+        sf.add_sheet(
+            _s.ArraySheet(np.array(arr, dtype=object), _s.SheetId("wb", ["sh", 0]))
+        )
+        ranger = _l.make_default_Ranger(sf)
+
+        return _plan.make_plan(xlrefs, ranger)
+
+    def test_levels_shared_and_relative(self):
+        arr = [
+            ["#B2:C2", "#^^(R):..(R)", '#A2:B2:"recurse"'],
+            [1, 2, 3],
+        ]
+        xlrefs = ['wb#sh!A1:C1:"recurse"', 'wb#sh!C1:"recurse"']
+        plan = self._make_plan(arr, xlrefs)
+
+        levels = [[k[2] for k in lvl] for lvl in plan.levels()]
+        self.assertEqual(levels[0], ["B2:C2", "^^(R):..(R)", 'A2:B2:"recurse"'])
+        self.assertEqual(levels[1], ['A1:C1:"recurse"', 'C1:"recurse"'])
+        self.assertEqual(len(plan.nodes), 5)
+
+        rel_key = [k for k in plan.nodes if "^" in k[2]][0]
+        self.assertEqual(rel_key[3], (0, 0))
+
+        ranger = plan.ranger
+        exp = [ranger.do_lasso(xlref).values for xlref in xlrefs]
+        self.assertEqual(plan.run(), exp)
+        self.assertEqual(exp[1], [[1, 2]])
+
+        graph = plan.to_dict()
+        json.dumps(graph)
+        fan_outs = {n["fragment"]: n["fan_out"] for n in graph["nodes"]}
+        self.assertEqual(fan_outs['A1:C1:"recurse"'], 3)
+        self.assertEqual(len(graph["edges"]), 4)
+        self.assertEqual(plan.to_dot().count("->"), 4)
+
+    def test_relative_keyed_by_base(self):
+        arr = [["#R.C3", "a1", "b1"], ["#R.C3", "a2", "b2"]]
+        xlrefs = ['wb#sh!A1:"recurse"', 'wb#sh!A2:"recurse"']
+        plan = self._make_plan(arr, xlrefs)
+        ranger = plan.ranger
+        exp = [ranger.do_lasso(xlref).values for xlref in xlrefs]
+        self.assertEqual(exp, ["b1", "b2"])
+        self.assertEqual(plan.run(), exp)
+
+        rel_keys = sorted(k[3] for k in plan.nodes if k[2] == "R.C3")
+        self.assertEqual(rel_keys, [(0, 0), (1, 0)])
+
+    def test_root_and_nested_books_keyed_alike(self):
+        plan = self._make_plan([["#B1", 5]], ['wb#sh!A1:"recurse"', "wb#sh!B1"])
+        self.assertEqual(len(plan.nodes), 2)
+        self.assertEqual({k[:2] for k in plan.nodes}, {("wb", "sh")})
+
+    def test_reuses_results(self):
+        plan = self._make_plan([["#B1", 5]], ['wb#sh!A1:"recurse"'])
+        self.assertEqual(plan.run(), [5])
+
+        root, leaf = plan.roots[0], [k for k in plan.nodes if k[2] == "B1"][0]
+        plan.results[leaf] = plan.results[leaf]._replace(values="planned")
+        plan.results.pop(root)
+        plan.levels = lambda: [[root]]
+        self.assertEqual(plan.run(), ["planned"])
+
+    def test_run_reuses_scan_captures(self):
+        plan = self._make_plan([["#B1", 5]], ['wb#sh!A1:"recurse"'])
+        with patch.object(
+            _l.Ranger, "_capture_values", side_effect=AssertionError("re-captured")
+        ):
+            self.assertEqual(plan.run(), [5])
+            self.assertEqual(plan.run(), [5])
+
+    def test_cyclic(self):
+        with self.assertRaisesRegex(ValueError, "Cyclic xl-ref"):
+            self._make_plan(
+                [['#B1:"recurse"', '#A1:"recurse"']], ['wb#sh!A1:"recurse"']
+            )
+
+    def test_failed_root(self):
+        plan = self._make_plan([["#BAD_SHEET!A1"]], ['wb#sh!A1:"recurse"'])
+        self.assertEqual(len(plan.nodes), 1)
+        with self.assertRaisesRegex(ValueError, "BAD_SHEET"):
+            plan.run()
+        self.assertEqual(len(plan.errors), 1)